@@ -25,7 +25,7 @@ from ixmp.cli import main as ixmp_cli
 
 from message_ix_models.util._logging import flush, mark_time
 from message_ix_models.util._logging import setup as setup_logging
-from message_ix_models.util.click import common_params
+from message_ix_models.util.click import LazyGroup, common_params
 from message_ix_models.util.context import Context
 
 log = logging.getLogger(__name__)
@@ -33,7 +33,7 @@ log = logging.getLogger(__name__)
 
 # Main command group. The code in this function is ALWAYS executed, so it should only
 # include tasks that are common to all CLI commands.
-@click.group(help=__doc__)
+@click.group(cls=LazyGroup, help=__doc__)
 @click.option(
     "--url", metavar="ixmp://PLATFORM/MODEL/SCENARIO[#VERSION]", help="Scenario URL."
 )
@@ -154,70 +154,101 @@ def _log_threads(k: int, n: int):
 main.add_command(ixmp_cli.commands["config"])
 
 
-#: List of submodules providing CLI (sub)commands accessible through `mix-models`.
-#: Each of these should contain a function named ``cli`` decorated with @click.command
-#: or @click.group.
-submodules = [
-    "message_ix_models.model.buildings.cli",
-    "message_ix_models.model.cli",
-    "message_ix_models.model.structure",
-    "message_ix_models.model.transport.cli",
-    "message_ix_models.model.water.cli",
-    "message_ix_models.project.circeular.cli",
-    "message_ix_models.project.edits.cli",
-    "message_ix_models.project.navigate.cli",
-    "message_ix_models.project.ssp.cli",
-    "message_ix_models.report.cli",
-    "message_ix_models.model.material.cli",
-    "message_ix_models.testing.cli",
-    "message_ix_models.util.pooch",
-    "message_ix_models.util.slurm",
-    "message_ix_models.model.bmt.cli",
-]
-
-try:
-    import message_data.cli
-except ImportError:
-    # message_data is not installed or contains some ImportError of its own
-    import ixmp
-
-    if ixmp.config.get("no message_data") is not True:
-        print(
-            "Warning: message_data is not installed or cannot be imported; see the "
-            "documentation via --help"
-        )
-
-    # commented: Display verbose information for debugging
-    # from traceback import format_exception
-    #
-    # etype, value, tb = sys.exc_info()
-    # print(
-    #     "",
-    #     *format_exception(etype, value, tb, limit=-1, chain=False)[1:],
-    #     sep="\n",
-    # )
-else:  # pragma: no cover  (needs message_data)
+#: Submodules providing CLI (sub)commands accessible through `mix-models`. Keys are
+#: command names; values are the name of a module containing a function named ``cli``
+#: decorated with @click.command or @click.group, and the short help text for the
+#: command. Each module is imported only when its command is invoked.
+submodules = {
+    "bmt": ("message_ix_models.model.bmt.cli", "MESSAGEix-BMT runs."),
+    "buildings": (
+        "message_ix_models.model.buildings.cli",
+        "MESSAGEix-Buildings model.",
+    ),
+    "cache": ("message_ix_models.util.cache", "Manage cached data."),
+    "circeular": ("message_ix_models.project.circeular.cli", "CircEUlar project."),
+    "edits": ("message_ix_models.project.edits.cli", "EDITS project."),
+    "fetch": ("message_ix_models.util.pooch", "Retrieve data from primary sources."),
+    "material-ix": (
+        "message_ix_models.model.material.cli",
+        "MESSAGEix-Materials variant.",
+    ),
+    "navigate": ("message_ix_models.project.navigate.cli", "NAVIGATE project."),
+    "report": ("message_ix_models.report.cli", "Postprocess results."),
+    "res": (
+        "message_ix_models.model.cli",
+        "MESSAGEix-GLOBIOM reference energy system (RES).",
+    ),
+    "sbatch": (
+        "message_ix_models.util.slurm",
+        "Submit `mix-models ARGS` to a SLURM queue.",
+    ),
+    "ssp": (
+        "message_ix_models.project.ssp.cli",
+        "Shared Socioeconomic Pathways (SSP) project.",
+    ),
+    "techs": (
+        "message_ix_models.model.structure",
+        "Export metadata to technology.csv.",
+    ),
+    "testing": ("message_ix_models.testing.cli", "Manipulate test data."),
+    "transport": (
+        "message_ix_models.model.transport.cli",
+        "MESSAGEix-Transport variant.",
+    ),
+    "water-ix": (
+        "message_ix_models.model.water.cli",
+        "MESSAGEix-Water and Nexus variant.",
+    ),
+}
+
+main.lazy_commands.update(submodules)
+
+
+def _add_message_data(group: LazyGroup) -> None:
+    """Add commands from :mod:`message_data`, if it is installed."""
+    try:
+        import message_data.cli
+    except ImportError:
+        # message_data is not installed or contains some ImportError of its own
+        import ixmp
+
+        if ixmp.config.get("no message_data") is not True:
+            print(
+                "Warning: message_data is not installed or cannot be imported; see the "
+                "documentation via --help"
+            )
+
+        # commented: Display verbose information for debugging
+        # from traceback import format_exception
+        #
+        # etype, value, tb = sys.exc_info()
+        # print(
+        #     "",
+        #     *format_exception(etype, value, tb, limit=-1, chain=False)[1:],
+        #     sep="\n",
+        # )
+        return
+
     # Also add message_data submodules
-    submodules.extend(
-        f"message_data.{name}" for name in message_data.cli.MODULES_WITH_CLI
-    )
+    for name in (f"message_data.{n}" for n in message_data.cli.MODULES_WITH_CLI):
+        # Import the module and retrieve the click.Command object
+        try:
+            __import__(name)
+        except ImportError as e:
+            print(f"{name} not available: {e}")
+            continue
 
-for name in submodules:
-    # Import the module and retrieve the click.Command object
-    try:
-        __import__(name)
-    except ImportError as e:
-        print(f"{name} not available: {e}")
-        continue
+        cmd = getattr(sys.modules[name], "cli")
+
+        # Avoid replacing message-ix-models CLI with message_data CLI
+        if cmd.name in group.commands or cmd.name in group.lazy_commands:
+            log.warning(f"Skip {cmd.name!r} CLI from {name!r}; already defined")
+            continue
 
-    cmd = getattr(sys.modules[name], "cli")
+        group.add_command(cmd)
 
-    # Avoid replacing message-ix-models CLI with message_data CLI
-    if cmd.name in main.commands:  # pragma: no cover  (needs message_data)
-        log.warning(f"Skip {repr(cmd.name)} CLI from {repr(name)}; already defined")
-        continue
 
-    main.add_command(cmd)
+main.add_extra = _add_message_data
 
 
 if __name__ == "__main__":
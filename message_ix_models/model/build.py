@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from time import perf_counter
 
 import ixmp
 import pandas as pd
@@ -52,6 +53,10 @@ def apply_spec(  # noqa: C901
         applying the spec.
     fast : bool
         Do not remove existing parameter data; increases speed on large scenarios.
+    batch : bool
+        If :obj:`True` (default), remove all elements of each set given in
+        ``spec["remove"]`` with a single call to :func:`.strip_par_data`. If
+        :obj:`False`, call :func:`.strip_par_data` once per element.
     quiet : bool
         Only show log messages at level ``ERROR`` and higher. If :obj:`False` (default),
         show log messages at level ``DEBUG`` and higher.
@@ -67,6 +72,7 @@ def apply_spec(  # noqa: C901
     """
     dry_run = options.get("dry_run", False)
     fast = options.get("fast", False)
+    batch = options.get("batch", True)
 
     log.setLevel(logging.ERROR if options.get("quiet", False) else logging.DEBUG)
 
@@ -87,21 +93,25 @@ def apply_spec(  # noqa: C901
     # Existing 'region' codes stored on the Platform associated with `scenario`
     platform_regions = set(scenario.platform.regions()["region"])
 
-    for _, set_name in sets:
+    # Time elapsed for each set
+    times: dict[str, float] = {}
+
+    for N_dims, set_name in sets:
         # Check whether this set is mentioned at all in the spec
         if 0 == sum(map(lambda info: len(info.set[set_name]), spec.values())):
             # Not mentioned; don't do anything
             continue
 
         log.info(f"Set {repr(set_name)}")
+        t0 = perf_counter()
 
-        # Base contents of the set
+        # Base contents of the set, as a hash-indexed set for fast membership checks.
+        # Unpack a multi-dimensional/indexed set to tuples.
         base_set = scenario.set(set_name)
-        # Unpack a multi-dimensional/indexed set to a list of tuples
         base = (
-            list(base_set.itertuples(index=False))
+            set(base_set.itertuples(index=False, name=None))
             if isinstance(base_set, pd.DataFrame)
-            else base_set.tolist()
+            else set(base_set.tolist())
         )
 
         log.info(f"  {len(base)} elements")
@@ -112,34 +122,51 @@ def apply_spec(  # noqa: C901
         log.info(f"  Check {len(require)} required elements")
 
         # Raise an exception about the first missing element
-        missing = list(filter(lambda e: e not in base, require))
+        missing = list(filter(lambda e: _key(e) not in base, require))
         if missing:
             log.error(f"  {len(missing)} elements not found: {missing!r}")
             raise ValueError
 
         # Remove elements and associated parameter values
-        for element in spec["remove"].set[set_name]:
+        remove = spec["remove"].set[set_name]
+        for element in [remove] if batch and len(remove) else remove:
             strip_par_data(
                 scenario,
                 set_name,
                 element,
                 dry_run=dry_run,
                 dump=None if fast else dump,
+                batch=batch,
             )
 
-        # Add elements
+        # Add elements, all in one call
         add = [] if dry_run else spec["add"].set[set_name]
-        for element in add:
-            name = element.id if isinstance(element, Code) else element
-            scenario.add_set(set_name, name)
-            if set_name == "node" and name not in platform_regions:
+        names = [_key(e) for e in add]
+        scenario.add_set(
+            set_name,
+            [list(n) if isinstance(n, tuple) else [n] for n in names]
+            if N_dims
+            else names,
+        )
+        if set_name == "node":
+            for name in filter(lambda n: n not in platform_regions, names):
                 scenario.platform.add_region(name, "region")
 
         if len(add):
             log.info(f"  Add {len(add)} element(s)")
             log.debug("  " + ellipsize(add))
 
-        log.info("  ---")
+        times[set_name] = perf_counter() - t0
+        log.info(f"  --- {times[set_name]:.3f} s")
+
+    if times:
+        log.info(
+            f"{sum(times.values()):.3f} s for {len(times)} set(s); slowest: "
+            + ", ".join(
+                f"{k!r} {v:.3f} s"
+                for k, v in sorted(times.items(), key=lambda kv: -kv[1])[:5]
+            )
+        )
 
     if not fast:
         N_removed = sum(len(d) for d in dump.values())
@@ -166,6 +193,16 @@ def apply_spec(  # noqa: C901
     )
 
 
+def _key(element: Code | Hashable | Sequence[str]) -> Hashable:
+    """Return a hashable key for a set `element` as it appears in a :class:`.Spec`."""
+    if isinstance(element, Code):
+        return element.id
+    elif isinstance(element, list):
+        return tuple(element)
+    else:
+        return element
+
+
 def ellipsize(elements: list) -> str:
     """Generate a short string representation of `elements`.
 
@@ -1,7 +1,9 @@
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 import message_ix
+import pandas as pd
 
 from message_ix_models import Context
 from message_ix_models.model.build import apply_spec
@@ -56,14 +58,23 @@ SPEC_LIST = (
 
 def add_data(scenario: message_ix.Scenario, dry_run: bool = False) -> None:
     """Populate `scenario` with MESSAGEix-Materials data."""
-    # Information about `scenario`
+    add_par_data(scenario, iter_data(scenario), dry_run=dry_run)
+    log.info("done")
+
+
+def iter_data(scenario: message_ix.Scenario) -> Iterator[tuple[str, pd.DataFrame]]:
+    """Generate MESSAGEix-Materials data for :func:`.add_par_data`.
+
+    Each of :data:`DATA_FUNCTIONS` is called only after the data from the previous
+    function have been consumed, and references to those data are dropped.
+    """
     for func in DATA_FUNCTIONS:
-        # Generate or load the data; add to the Scenario
+        # Generate or load the data
         log.info(f"from {func.__name__}()")
         data = func(scenario)
-        data = {k: v for k, v in data.items() if not v.empty}
-        add_par_data(scenario, data, dry_run=dry_run)
-    log.info("done")
+        for par_name in list(data):
+            if not (df := data.pop(par_name)).empty:
+                yield par_name, df
 
 
 def build(
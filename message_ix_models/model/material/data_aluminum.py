@@ -836,7 +836,7 @@ def gen_hist_new_cap(s_info: ScenarioInfo) -> "ParameterData":
             "Tadzhikistan": "Tajikistan",  # common misspelling
         }
     )
-    df_cap["ISO"] = df_cap.Country.apply(lambda c: pycountry.iso_3166_alpha_3(c))
+    df_cap["ISO"] = pycountry.to_iso_3166_alpha_3(df_cap["Country"])
     df_cap["R12"] = add_region_column(df_cap, ("node", "R12.yaml"), iso_column="ISO")
 
     # generate historical_new_capacity for soderberg
@@ -970,9 +970,7 @@ def load_bgs_data(commodity: Literal["aluminum", "alumina"]):
                 "Yugoslavia": "Yugoslavia, (Socialist) Federal Republic of",
             }
         )
-        df_prim["ISO"] = df_prim["Country"].apply(
-            lambda x: pycountry.iso_3166_alpha_3(x)
-        )
+        df_prim["ISO"] = pycountry.to_iso_3166_alpha_3(df_prim["Country"])
         assert df_prim["ISO"].notna().all()
         df_prim.drop("Country", axis=1, inplace=True)
         for year in [i for i in df_prim.columns if isinstance(i, int)]:
@@ -1254,9 +1252,7 @@ def calibrate_2020_furnaces(s_info: ScenarioInfo) -> "ParameterData":
     iai_ref_map_inv = {k: v[0] for k, v in invert_dictionary(iai_ref_map).items()}
     df_iai_cmap = pd.Series(iai_ref_map_inv).to_frame().reset_index()
 
-    df_iai_cmap["ISO"] = df_iai_cmap["index"].apply(
-        lambda x: pycountry.iso_3166_alpha_3(x)
-    )
+    df_iai_cmap["ISO"] = pycountry.to_iso_3166_alpha_3(df_iai_cmap["index"])
     df_iai_cmap.drop(columns="index", inplace=True)
 
     df_ref = load_bgs_data("alumina")
@@ -15,7 +15,10 @@ from .config import Config
 
 
 def pyam_df_from_rep(
-    rep: message_ix.Reporter, reporter_var: str, mapping_df: pd.DataFrame
+    rep: message_ix.Reporter,
+    reporter_var: str,
+    mapping_df: pd.DataFrame,
+    cache: dict[str, pd.DataFrame] | None = None,
 ) -> pd.DataFrame:
     """Queries data from Reporter and maps to IAMC variable names.
 
@@ -27,7 +30,30 @@ def pyam_df_from_rep(
         Registered key of Reporter to query, e.g. "out", "in", "ACT", "emi", "CAP"
     mapping_df
         DataFrame mapping Reporter dimension values to IAMC variable names
+    cache
+        If given, the full (unfiltered) data for `reporter_var` are computed once,
+        stored in `cache`, and reused by later calls with the same `cache`. The
+        mapping is applied in memory. Otherwise, filters are set on `rep` so that only
+        the data in `mapping_df` are computed.
     """
+    mapping_df = mapping_df[["iamc_name", "unit"]]
+
+    if cache is not None:
+        try:
+            df_var = cache[reporter_var]
+        except KeyError:
+            rep.set_filters()
+            df_var = cache[reporter_var] = pd.DataFrame(
+                rep.get(f"{reporter_var}:nl-t-ya-m-c-l")
+            )
+        # Inner join: only data with labels that appear in `mapping_df`
+        return (
+            df_var.join(mapping_df, how="inner")
+            .dropna()
+            .groupby(["nl", "ya", "iamc_name"])
+            .sum(numeric_only=True)
+        )
+
     filters_dict = {
         col: list(mapping_df.index.get_level_values(col).unique())
         for col in mapping_df.index.names
@@ -35,7 +61,7 @@ def pyam_df_from_rep(
     rep.set_filters(**filters_dict)
     df_var = pd.DataFrame(rep.get(f"{reporter_var}:nl-t-ya-m-c-l"))
     df = (
-        df_var.join(mapping_df[["iamc_name", "unit"]])
+        df_var.join(mapping_df)
         .dropna()
         .groupby(["nl", "ya", "iamc_name"])
         .sum(numeric_only=True)
@@ -64,30 +90,29 @@ def format_reporting_df(
             Unit=unit,
         )
     )
-    py_df = pyam.IamDataFrame(df)
-    if py_df.empty:
-        return py_df
-    missing = [
-        variable_prefix + i
-        for i in mappings.iamc_name.unique().tolist()
-        if i not in [i.replace(variable_prefix, "") for i in py_df.variable]
-    ]
+    if df.empty:
+        return pyam.IamDataFrame(df)
+
+    # Fill zeros for any variables in `mappings` without data, for all regions and
+    # years that have data
+    missing = sorted(
+        {variable_prefix + name for name in mappings.iamc_name.unique()}
+        - set(df["variable"])
+    )
     if missing:
-        zero_ts = pyam.IamDataFrame(
-            pd.DataFrame()
-            .assign(
-                variable=missing,
-                region=None,
-                unit=unit,
-                value=0,
-                scenario=scenario_name,
-                model=model_name,
-                year=None,
-            )
-            .pipe(broadcast, region=py_df.region, year=py_df.year)
+        zero = pd.DataFrame(
+            dict(variable=missing, region=None, Year=None, value=0.0)
+        ).pipe(
+            broadcast,
+            region=sorted(df["region"].unique()),
+            Year=sorted(df["Year"].unique()),
         )
-        py_df = pyam.concat([py_df, zero_ts])
-    return py_df
+        df = pd.concat(
+            [df, zero.assign(Model=model_name, Scenario=scenario_name, Unit=unit)],
+            ignore_index=True,
+        )
+
+    return pyam.IamDataFrame(df)
 
 
 def load_config(name: str) -> "Config":
@@ -99,7 +124,10 @@ def load_config(name: str) -> "Config":
 
 
 def run_fe_methanol_nh3_reporting(
-    rep: message_ix.Reporter, model_name: str, scen_name: str
+    rep: message_ix.Reporter,
+    model_name: str,
+    scen_name: str,
+    cache: dict[str, pd.DataFrame] | None = None,
 ) -> pyam.IamDataFrame:
     """Run final energy reporting for ammonia and methanol.
 
@@ -117,11 +145,11 @@ def run_fe_methanol_nh3_reporting(
     """
     nh3_mt_to_gwa = 0.697615
     fe_config = load_config("fe_methanol_ammonia")
-    df_fe = pyam_df_from_rep(rep, fe_config.var, fe_config.mapping)
+    df_fe = pyam_df_from_rep(rep, fe_config.var, fe_config.mapping, cache)
 
     fs_config = load_config("fs1")
     fs_config.iamc_prefix = fe_config.iamc_prefix
-    df_fs = pyam_df_from_rep(rep, fs_config.var, fs_config.mapping)
+    df_fs = pyam_df_from_rep(rep, fs_config.var, fs_config.mapping, cache)
     df_fs.loc[df_fs.index.get_level_values("iamc_name").str.contains("Ammonia")] *= (
         nh3_mt_to_gwa
     )
@@ -138,11 +166,16 @@ def run_fe_methanol_nh3_reporting(
     return py_df
 
 
-def run_ch4_reporting(rep, model_name: str, scen_name: str) -> pyam.IamDataFrame:
+def run_ch4_reporting(
+    rep,
+    model_name: str,
+    scen_name: str,
+    cache: dict[str, pd.DataFrame] | None = None,
+) -> pyam.IamDataFrame:
     """Generate reporting for industry methane emissions."""
     var = "ch4_emi"
     config = load_config(var)
-    df = pyam_df_from_rep(rep, config.var, config.mapping)
+    df = pyam_df_from_rep(rep, config.var, config.mapping, cache)
     py_df = format_reporting_df(
         df, config.iamc_prefix, model_name, scen_name, config.unit, config.mapping
     )
@@ -150,13 +183,16 @@ def run_ch4_reporting(rep, model_name: str, scen_name: str) -> pyam.IamDataFrame
 
 
 def run_fe_reporting(
-    rep: message_ix.Reporter, model: str, scenario: str
+    rep: message_ix.Reporter,
+    model: str,
+    scenario: str,
+    cache: dict[str, pd.DataFrame] | None = None,
 ) -> pd.DataFrame:
     """Generate reporting for industry final energy variables."""
     dfs = []
 
     config = load_config("fe")
-    df = pyam_df_from_rep(rep, config.var, config.mapping)
+    df = pyam_df_from_rep(rep, config.var, config.mapping, cache)
     dfs.append(
         format_reporting_df(
             df, config.iamc_prefix, model, scenario, config.unit, config.mapping
@@ -164,14 +200,16 @@ def run_fe_reporting(
     )
 
     config = load_config("fe_solar")
-    df = pyam_df_from_rep(rep, config.var, config.mapping)
+    df = pyam_df_from_rep(rep, config.var, config.mapping, cache)
     dfs.append(
         format_reporting_df(
             df, config.iamc_prefix, model, scenario, config.unit, config.mapping
         )
     )
 
-    py_df_all = add_chemicals_to_final_energy_variables(dfs, rep, model, scenario)
+    py_df_all = add_chemicals_to_final_energy_variables(
+        dfs, rep, model, scenario, cache
+    )
 
     py_df_all = split_fe_other(rep, py_df_all, model, scenario)
 
@@ -215,10 +253,14 @@ def run_fe_reporting(
 
 
 def add_chemicals_to_final_energy_variables(
-    dfs: List[pyam.IamDataFrame], rep: message_ix.Reporter, model: str, scenario: str
+    dfs: List[pyam.IamDataFrame],
+    rep: message_ix.Reporter,
+    model: str,
+    scenario: str,
+    cache: dict[str, pd.DataFrame] | None = None,
 ) -> pyam.IamDataFrame:
     """Update final energy fuel variables by adding chemicals to aggregates."""
-    dfs.append(run_fe_methanol_nh3_reporting(rep, model, scenario))
+    dfs.append(run_fe_methanol_nh3_reporting(rep, model, scenario, cache))
     py_df_all = pyam.concat(dfs)
     chem_aggs = {
         "Chemicals": [
@@ -419,12 +461,15 @@ def split_fe_other(
 
 
 def run_fs_reporting(
-    rep: message_ix.Reporter, model_name: str, scen_name: str
+    rep: message_ix.Reporter,
+    model_name: str,
+    scen_name: str,
+    cache: dict[str, pd.DataFrame] | None = None,
 ) -> pd.DataFrame:
     """Generate reporting for industry final energy non-energy variables."""
     dfs = []
     hvc_config = load_config("fs2")
-    df_hvc = pyam_df_from_rep(rep, hvc_config.var, hvc_config.mapping)
+    df_hvc = pyam_df_from_rep(rep, hvc_config.var, hvc_config.mapping, cache)
     dfs.append(
         format_reporting_df(
             df_hvc,
@@ -437,7 +482,9 @@ def run_fs_reporting(
     )
 
     nh3_meth_config = load_config("fs1")
-    df_nh3_meth = pyam_df_from_rep(rep, nh3_meth_config.var, nh3_meth_config.mapping)
+    df_nh3_meth = pyam_df_from_rep(
+        rep, nh3_meth_config.var, nh3_meth_config.mapping, cache
+    )
     df_nh3_meth.loc[
         df_nh3_meth.index.get_level_values("iamc_name").str.contains("Ammonia")
     ] *= 0.697615
@@ -612,12 +659,15 @@ def split_mto_feedstock(
 
 
 def run_prod_reporting(
-    rep: message_ix.Reporter, model_name: str, scen_name: str
+    rep: message_ix.Reporter,
+    model_name: str,
+    scen_name: str,
+    cache: dict[str, pd.DataFrame] | None = None,
 ) -> pyam.IamDataFrame:
     """Generate reporting for industry production variables."""
     dfs = []
     config = load_config("prod")
-    df = pyam_df_from_rep(rep, config.var, config.mapping)
+    df = pyam_df_from_rep(rep, config.var, config.mapping, cache)
     df.loc[df.index.get_level_values("iamc_name").str.contains("Methanol")] /= 0.697615
     dfs.append(
         format_reporting_df(
@@ -631,7 +681,7 @@ def run_prod_reporting(
     )
 
     config = load_config("prod_addon")
-    df = pyam_df_from_rep(rep, config.var, config.mapping)
+    df = pyam_df_from_rep(rep, config.var, config.mapping, cache)
     dfs.append(
         format_reporting_df(
             df,
@@ -682,12 +732,17 @@ def run_prod_reporting(
 def run_all_categories(
     rep: message_ix.Reporter, model_name: str, scen_name: str
 ) -> List[pyam.IamDataFrame]:
-    """Generate all industry reporting variables for a given scenario."""
+    """Generate all industry reporting variables for a given scenario.
+
+    Each of the quantities "in", "out", "ACT", etc. is computed once and shared by all
+    categories; see :func:`pyam_df_from_rep`.
+    """
+    cache: dict[str, pd.DataFrame] = {}
     dfs = [
-        run_fs_reporting(rep, model_name, scen_name),
-        run_fe_reporting(rep, model_name, scen_name),
-        run_prod_reporting(rep, model_name, scen_name),
-        run_ch4_reporting(rep, model_name, scen_name),
+        run_fs_reporting(rep, model_name, scen_name, cache),
+        run_fe_reporting(rep, model_name, scen_name, cache),
+        run_prod_reporting(rep, model_name, scen_name, cache),
+        run_ch4_reporting(rep, model_name, scen_name, cache),
     ]
     return dfs
 
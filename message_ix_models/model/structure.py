@@ -1,9 +1,12 @@
 import logging
+import os
+import pickle
 import re
 from collections import ChainMap
 from collections.abc import Mapping, MutableMapping
 from copy import copy
 from functools import cache
+from hashlib import blake2s
 from itertools import product
 
 import click
@@ -32,7 +35,6 @@ def codelists(kind: str) -> list[str]:
     return sorted(path.stem for path in package_data_path(kind).glob("*.yaml"))
 
 
-@cache
 def get_codes(name: str) -> list[Code]:
     """Return codes for the dimension/set `name` in MESSAGE-GLOBIOM scenarios.
 
@@ -51,6 +53,17 @@ def get_codes(name: str) -> list[Code]:
     …results in a region with child codes for Austria (a current country) and the
     formerly-existing country Serbia and Montenegro.
 
+    The codes are constructed once per `name` and stored in memory. They are also
+    stored in pickled form in a file in :attr:`.Config.cache_path`. The file is reused
+    by later Python sessions, until the contents of the YAML file or the installed
+    version of :mod:`message_ix_models`, :mod:`sdmx`, or :mod:`pycountry` change.
+
+    .. note:: Each call returns a new list, but the Code objects in it are shared
+       between calls with the same `name`: :py:`get_codes(name)[0] is
+       get_codes(name)[0]` is :data:`True`. Callers may add or remove items from the
+       returned list without affecting later calls, but should :func:`~copy.copy`
+       any Code before modifying it.
+
     Parameters
     ----------
     name : :class:`str`
@@ -63,6 +76,57 @@ def get_codes(name: str) -> list[Code]:
         :attr:`annotations` attributes. Calling :func:`str` on a code returns its
         :attr:`id`.
     """
+    return list(_get_codes_loaded(name))
+
+
+@cache
+def _get_codes_loaded(name: str) -> list[Code]:
+    """Return the unpickled result of :func:`_get_codes_pickled` for `name`."""
+    return pickle.loads(_get_codes_pickled(name))
+
+
+def _get_codes_pickled(name: str) -> bytes:
+    """Return the result of :func:`_get_codes` for `name` in pickled form.
+
+    The data are read from, or else written to, a file in :attr:`.Config.cache_path`
+    named like :file:`get_codes-{hash}.pkl`, so that it is managed like files written
+    by :func:`.cached`. Nothing is logged, since this occurs as a side effect of many
+    other functions.
+    """
+    from importlib.metadata import version
+
+    from genno.caching import hash_args
+
+    from message_ix_models import __version__
+    from message_ix_models.util.cache import COMPUTER
+
+    # Key from the contents of the YAML file and versions of packages used
+    key = hash_args(
+        name,
+        blake2s(package_data_path(name).with_suffix(".yaml").read_bytes()).hexdigest(),
+        __version__,
+        version("sdmx1"),
+        version("pycountry") if "node" in name else None,
+    )
+    config = COMPUTER.graph["config"]
+    path = config["cache_path"].joinpath(f"get_codes-{key}.pkl")
+
+    if path.exists() and not config.get("cache_skip", False):
+        return path.read_bytes()
+
+    data = pickle.dumps(_get_codes(name))
+
+    # Write to a temporary file, then replace, so the file is never incomplete
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+    return data
+
+
+def _get_codes(name: str) -> list[Code]:
+    """Construct the codes for :func:`get_codes`."""
     # Raw contents of the config file
     config = load_package_data(name)
 
@@ -562,10 +562,12 @@ def get_computer(
     # Structure information for the base model
     if scenario:
         # Retrieve structure information from an existing base model/`scenario`
-        config.base_model_info = ScenarioInfo(scenario)
+        # The structure of a scenario with a solution cannot change, so a snapshot
+        # stored on disk can be reused
+        config.with_solution = scenario.has_solution()
+        config.base_model_info = ScenarioInfo(scenario, snapshot=config.with_solution)
 
         config.with_scenario = True
-        config.with_solution = scenario.has_solution()
     else:
         # Generate a Spec/ScenarioInfo for a non-existent base model/`scenario` as
         # described by `context`
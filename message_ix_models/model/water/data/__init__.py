@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -66,9 +66,15 @@ def add_data(scenario, context: "Context", dry_run=False):
         else DATA_FUNCTIONS_COUNTRY
     )
 
-    for func in data_funcs:
-        # Generate or load the data; add to the Scenario
-        log.info(f"from {func.__name__}()")
-        add_par_data(scenario, func(context), dry_run=dry_run)
+    def _iter_data() -> Iterator[tuple[str, pd.DataFrame]]:
+        for func in data_funcs:
+            # Generate or load the data
+            log.info(f"from {func.__name__}()")
+            data = func(context)
+            # Drop references to data as they are added to the Scenario
+            for par_name in list(data):
+                yield par_name, data.pop(par_name)
+
+    add_par_data(scenario, _iter_data(), dry_run=dry_run)
 
     log.info("done")
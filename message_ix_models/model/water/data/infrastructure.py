@@ -46,6 +46,85 @@ def is_dummy_technology(df_row) -> bool:
     )
 
 
+def _is_dummy(df: pd.DataFrame) -> pd.Series:
+    """Apply :func:`is_dummy_technology` to every row of `df`."""
+    result = pd.Series(True, index=df.index)
+    for col in ("investment_mid", "fix_cost_mid", "var_cost_mid"):
+        if col in df.columns:
+            result &= df[col] == 0.0
+    return result
+
+
+def _pairs(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return row positions (i, j) for all pairs of `n` rows; `i` varies slowest."""
+    return np.repeat(np.arange(n), n), np.tile(np.arange(n), n)
+
+
+def _make_by_row(
+    name: str,
+    info: ScenarioInfo,
+    rows: pd.DataFrame,
+    lifetime: str | float = "technical_lifetime_mid",
+    *,
+    labels: pd.DataFrame | None = None,
+    node_loc: pd.Series | None = None,
+    time: pd.Series | None = None,
+    **columns,
+) -> pd.DataFrame:
+    """Make data for parameter `name` for every row in `rows`.
+
+    The result contains the same data, in a different order, as the following for each
+    row of `rows`, concatenated:
+
+    1. :func:`.make_df` with the row's values from `columns`.
+    2. :func:`.broadcast` over the valid (``year_vtg``, ``year_act``) from
+       :func:`.get_vintage_and_active_years` for the row's technical lifetime, or only
+       ``year_vtg == year_act`` if the row is a dummy technology per
+       :func:`is_dummy_technology`.
+    3. :func:`.broadcast` over the matched `labels`, then `node_loc` and `time`.
+
+    The valid years are computed once for each distinct (lifetime, dummy) pair, and the
+    data for all rows are constructed at once.
+
+    Parameters
+    ----------
+    lifetime :
+        Name of a column in `rows` with the technical lifetime, or a value for all rows.
+    columns :
+        Scalar values, or :class:`pandas.Series`/arrays with 1 value per row of `rows`.
+    """
+    N = len(rows)
+    if N == 0:
+        return pd.DataFrame()
+
+    lt = rows[lifetime] if isinstance(lifetime, str) else pd.Series(lifetime, range(N))
+
+    # Valid (year_vtg, year_act) for each row
+    yv_ya: dict[tuple[float | None, bool], pd.DataFrame] = {}
+    keys = []
+    for value, dummy in zip(lt.tolist(), _is_dummy(rows).tolist()):
+        key = (None if pd.isna(value) else value, dummy)
+        if key not in yv_ya:
+            yv_ya[key] = get_vintage_and_active_years(
+                info, key[0], same_year_only=dummy
+            )
+        keys.append(key)
+
+    # Repeat the values for each row once per valid (year_vtg, year_act)
+    i = np.repeat(np.arange(N), [len(yv_ya[k]) for k in keys])
+    data = {
+        k: v if np.ndim(v) == 0 else pd.Series(v).array.take(i)
+        for k, v in columns.items()
+    }
+    for dim in "year_vtg", "year_act":
+        data[dim] = np.concatenate([yv_ya[k][dim].to_numpy() for k in keys])
+
+    kwargs = dict(node_loc=node_loc, time=time)
+    return make_df(name, **data).pipe(
+        broadcast, labels, **{k: v for k, v in kwargs.items() if v is not None}
+    )
+
+
 def _make_dist_output(
     df_out_dist: pd.DataFrame,
     scenario_info: ScenarioInfo,
@@ -54,61 +133,30 @@ def _make_dist_output(
     sdg: str,
 ) -> pd.DataFrame:
     """Create output DataFrame for distribution technologies."""
-    out_frames = []
-    for _, dist_rows in df_out_dist.iterrows():
-        use_same_year_dist = is_dummy_technology(dist_rows)
-        yv_ya = get_vintage_and_active_years(
+    # SDG scenario: only Mf mode. Baseline: both M1 and Mf modes
+    modes = {"Mf": "out_value_mid"}
+    if sdg == "baseline":
+        modes = {"M1": "out_value_high", **modes}
+
+    out_frames = [
+        _make_by_row(
+            "output",
             scenario_info,
-            dist_rows["technical_lifetime_mid"],
-            same_year_only=use_same_year_dist,
+            df_out_dist,
+            node_loc=df_node["node"],
+            time=sub_time,
+            technology=df_out_dist["tec"],
+            value=df_out_dist[col],
+            unit="MCM",
+            level=df_out_dist["outlvl"],
+            commodity=df_out_dist["outcmd"],
+            mode=mode,
         )
-
-        if sdg != "baseline":
-            # SDG scenario: only Mf mode
-            out_frames.append(
-                make_df(
-                    "output",
-                    technology=dist_rows["tec"],
-                    value=dist_rows["out_value_mid"],
-                    unit="MCM",
-                    level=dist_rows["outlvl"],
-                    commodity=dist_rows["outcmd"],
-                    mode="Mf",
-                )
-                .pipe(broadcast, yv_ya, node_loc=df_node["node"], time=sub_time)
-                .pipe(same_node)
-                .pipe(same_time)
-            )
-        else:
-            # Baseline: both M1 and Mf modes
-            out_frames.append(
-                make_df(
-                    "output",
-                    technology=dist_rows["tec"],
-                    value=dist_rows["out_value_high"],
-                    unit="MCM",
-                    level=dist_rows["outlvl"],
-                    commodity=dist_rows["outcmd"],
-                    mode="M1",
-                )
-                .pipe(broadcast, yv_ya, node_loc=df_node["node"], time=sub_time)
-                .pipe(same_node)
-                .pipe(same_time)
-            )
-            out_frames.append(
-                make_df(
-                    "output",
-                    technology=dist_rows["tec"],
-                    value=dist_rows["out_value_mid"],
-                    unit="MCM",
-                    level=dist_rows["outlvl"],
-                    commodity=dist_rows["outcmd"],
-                    mode="Mf",
-                )
-                .pipe(broadcast, yv_ya, node_loc=df_node["node"], time=sub_time)
-                .pipe(same_node)
-                .pipe(same_time)
-            )
+        .pipe(same_node)
+        .pipe(same_time)
+        for mode, col in modes.items()
+        if len(df_out_dist)
+    ]
 
     return pd.concat(out_frames) if out_frames else pd.DataFrame()
 
@@ -122,139 +170,49 @@ def start_creating_input_dataframe(
     sub_time,
 ) -> pd.DataFrame:
     """Creates an input pd.DataFrame and adds some data to it."""
-    inp_df = pd.DataFrame([])
-    # Input Dataframe for non elec commodities
-    for index, rows in df_non_elec.iterrows():
-        # Check if this is a dummy technology
-        use_same_year = is_dummy_technology(rows)
-
-        inp_df = pd.concat(
-            [
-                inp_df,
-                (
-                    make_df(
-                        "input",
-                        technology=rows["tec"],
-                        value=rows["value_high"],
-                        unit="MCM",
-                        # MCM as all non elec technology have water as input
-                        level=rows["inlvl"],
-                        commodity=rows["incmd"],
-                        mode="M1",
-                        node_loc=df_node["node"],
-                    )
-                    .pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["technical_lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        time=sub_time,
-                    )
-                    .pipe(same_node)
-                    .pipe(same_time)
-                ),
-            ]
+    # Input Dataframe for non elec commodities. MCM as all non elec technology have
+    # water as input
+    frames = [
+        _make_by_row(
+            "input",
+            scenario_info,
+            df_non_elec,
+            labels=pd.DataFrame(dict(node_loc=df_node["node"])),
+            time=sub_time,
+            technology=df_non_elec["tec"],
+            value=df_non_elec["value_high"],
+            unit="MCM",
+            level=df_non_elec["inlvl"],
+            commodity=df_non_elec["incmd"],
+            mode="M1",
         )
-    if sdg != "baseline":
-        for index, rows in df_dist.iterrows():
-            # Check if this is a dummy technology
-            use_same_year = is_dummy_technology(rows)
-
-            inp_df = pd.concat(
-                [
-                    inp_df,
-                    (
-                        make_df(
-                            "input",
-                            technology=rows["tec"],
-                            value=rows["value_mid"],
-                            unit="MCM",
-                            level=rows["inlvl"],
-                            commodity=rows["incmd"],
-                            mode="Mf",
-                        )
-                        .pipe(
-                            broadcast,
-                            get_vintage_and_active_years(
-                                scenario_info,
-                                rows["technical_lifetime_mid"],
-                                same_year_only=use_same_year,
-                            ),
-                            node_loc=df_node["node"],
-                            time=sub_time,
-                        )
-                        .pipe(same_node)
-                        .pipe(same_time)
-                    ),
-                ]
-            )
-    else:
-        for index, rows in df_dist.iterrows():
-            # Check if this is a dummy technology
-            use_same_year = is_dummy_technology(rows)
-
-            # Add M1 mode input
-            inp_df = pd.concat(
-                [
-                    inp_df,
-                    (
-                        make_df(
-                            "input",
-                            technology=rows["tec"],
-                            value=rows["value_high"],
-                            unit="MCM",
-                            level=rows["inlvl"],
-                            commodity=rows["incmd"],
-                            mode="M1",
-                        )
-                        .pipe(
-                            broadcast,
-                            get_vintage_and_active_years(
-                                scenario_info,
-                                rows["technical_lifetime_mid"],
-                                same_year_only=use_same_year,
-                            ),
-                            node_loc=df_node["node"],
-                            time=sub_time,
-                        )
-                        .pipe(same_node)
-                        .pipe(same_time)
-                    ),
-                ]
-            )
-            # Add Mf mode input for baseline to match Mf output mode
-            inp_df = pd.concat(
-                [
-                    inp_df,
-                    (
-                        make_df(
-                            "input",
-                            technology=rows["tec"],
-                            value=rows["value_mid"],
-                            unit="MCM",
-                            level=rows["inlvl"],
-                            commodity=rows["incmd"],
-                            mode="Mf",
-                        )
-                        .pipe(
-                            broadcast,
-                            get_vintage_and_active_years(
-                                scenario_info,
-                                rows["technical_lifetime_mid"],
-                                same_year_only=use_same_year,
-                            ),
-                            node_loc=df_node["node"],
-                            time=sub_time,
-                        )
-                        .pipe(same_node)
-                        .pipe(same_time)
-                    ),
-                ]
-            )
+    ]
+
+    # Distribution technologies. For baseline, add M1 mode input, and Mf mode input to
+    # match Mf output mode
+    modes = {"Mf": "value_mid"}
+    if sdg == "baseline":
+        modes = {"M1": "value_high", **modes}
+
+    frames.extend(
+        _make_by_row(
+            "input",
+            scenario_info,
+            df_dist,
+            node_loc=df_node["node"],
+            time=sub_time,
+            technology=df_dist["tec"],
+            value=df_dist[col],
+            unit="MCM",
+            level=df_dist["inlvl"],
+            commodity=df_dist["incmd"],
+            mode=mode,
+        )
+        for mode, col in modes.items()
+    )
 
-    return inp_df
+    frames = [df.pipe(same_node).pipe(same_time) for df in frames if len(df)]
+    return pd.concat(frames) if frames else pd.DataFrame()
 
 
 def add_infrastructure_techs(context: "Context") -> dict[str, pd.DataFrame]:
@@ -348,39 +306,23 @@ def add_infrastructure_techs(context: "Context") -> dict[str, pd.DataFrame]:
     df_out_dist = df_out[df_out["tec"].isin(techs)]
     df_out = df_out[~df_out["tec"].isin(techs)]
 
-    out_df = pd.DataFrame([])
-    for index, rows in df_out.iterrows():
-        # Check if this is a dummy technology
-        use_same_year = is_dummy_technology(rows)
-
-        out_df = pd.concat(
-            [
-                out_df,
-                (
-                    make_df(
-                        "output",
-                        technology=rows["tec"],
-                        value=rows["out_value_mid"],
-                        unit="MCM",
-                        level=rows["outlvl"],
-                        commodity=rows["outcmd"],
-                        mode="M1",
-                    )
-                    .pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["technical_lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        node_loc=df_node["node"],
-                        time=sub_time,
-                    )
-                    .pipe(same_node)
-                    .pipe(same_time)
-                ),
-            ]
+    out_df = (
+        _make_by_row(
+            "output",
+            scenario_info,
+            df_out,
+            node_loc=df_node["node"],
+            time=sub_time,
+            technology=df_out["tec"],
+            value=df_out["out_value_mid"],
+            unit="MCM",
+            level=df_out["outlvl"],
+            commodity=df_out["outcmd"],
+            mode="M1",
         )
+        .pipe(same_node)
+        .pipe(same_time)
+    )
 
     # Process distribution outputs using helper function
     dist_out = _make_dist_output(
@@ -392,34 +334,17 @@ def add_infrastructure_techs(context: "Context") -> dict[str, pd.DataFrame]:
 
     # Filtering df for capacity factors
     df_cap = df.dropna(subset=["capacity_factor_mid"])
-    cap_df = pd.DataFrame([])
     # Adding capacity factor dataframe
-    for index, rows in df_cap.iterrows():
-        # Check if this is a dummy technology
-        use_same_year = is_dummy_technology(rows)
-
-        cap_df = pd.concat(
-            [
-                cap_df,
-                make_df(
-                    "capacity_factor",
-                    technology=rows["tec"],
-                    value=rows["capacity_factor_mid"],
-                    unit="%",
-                )
-                .pipe(
-                    broadcast,
-                    get_vintage_and_active_years(
-                        scenario_info,
-                        rows["technical_lifetime_mid"],
-                        same_year_only=use_same_year,
-                    ),
-                    node_loc=df_node["node"],
-                    time=sub_time,
-                )
-                .pipe(same_node),
-            ]
-        )
+    cap_df = _make_by_row(
+        "capacity_factor",
+        scenario_info,
+        df_cap,
+        node_loc=df_node["node"],
+        time=sub_time,
+        technology=df_cap["tec"],
+        value=df_cap["capacity_factor_mid"],
+        unit="%",
+    ).pipe(same_node)
 
     results["capacity_factor"] = cap_df
 
@@ -458,33 +383,18 @@ def add_infrastructure_techs(context: "Context") -> dict[str, pd.DataFrame]:
     results["inv_cost"] = inv_cost
 
     # Fixed costs
-    # Prepare data frame for fix_cost
-    fix_cost = pd.DataFrame([])
-    var_cost = pd.DataFrame([])
-
-    for index, rows in df_inv.iterrows():
-        # Check if this is a dummy technology
-        use_same_year = is_dummy_technology(rows)
-
-        fix_cost = pd.concat(
-            [
-                fix_cost,
-                make_df(
-                    "fix_cost",
-                    technology=df_inv["tec"],
-                    value=df_inv["fix_cost_mid"] * USD_M3DAY_TO_USD_MCM,
-                    unit="USD/MCM",
-                ).pipe(
-                    broadcast,
-                    get_vintage_and_active_years(
-                        scenario_info,
-                        rows["technical_lifetime_mid"],
-                        same_year_only=use_same_year,
-                    ),
-                    node_loc=df_node["node"],
-                ),
-            ]
-        )
+    # NB For each row of `df_inv`, data for *all* technologies in `df_inv` are
+    #    generated with the vintage and active years for that row
+    i, j = _pairs(len(df_inv))
+    fix_cost = _make_by_row(
+        "fix_cost",
+        scenario_info,
+        df_inv.iloc[i],
+        node_loc=df_node["node"],
+        technology=df_inv["tec"].array.take(j),
+        value=(df_inv["fix_cost_mid"] * USD_M3DAY_TO_USD_MCM).array.take(j),
+        unit="USD/MCM",
+    )
 
     fix_cost = fix_cost[~fix_cost["technology"].isin(techs)]
 
@@ -493,140 +403,40 @@ def add_infrastructure_techs(context: "Context") -> dict[str, pd.DataFrame]:
     df_var = df_inv[~df_inv["tec"].isin(techs)]
     df_var_dist = df_inv[df_inv["tec"].isin(techs)]
 
-    df_var = df_inv[~df_inv["tec"].isin(techs)]
-    df_var_dist = df_inv[df_inv["tec"].isin(techs)]
-
+    # Variable cost: (rows, mode, value) for each group of technologies
     if context.SDG != "baseline":
-        for index, rows in df_var.iterrows():
-            # Check if this is a dummy technology
-            use_same_year = is_dummy_technology(rows)
-
-            # Variable cost
-            var_cost = pd.concat(
-                [
-                    var_cost,
-                    make_df(
-                        "var_cost",
-                        technology=rows["tec"],
-                        value=rows["var_cost_mid"] * USD_M3DAY_TO_USD_MCM,
-                        unit="USD/MCM",
-                        mode="M1",
-                    ).pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["technical_lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        node_loc=df_node["node"],
-                        time=sub_time,
-                    ),
-                ]
-            )
-
-        # Variable cost for distribution technologies
-        for index, rows in df_var_dist.iterrows():
-            # Check if this is a dummy technology
-            use_same_year = is_dummy_technology(rows)
-
-            var_cost = pd.concat(
-                [
-                    var_cost,
-                    make_df(
-                        "var_cost",
-                        technology=rows["tec"],
-                        value=rows["var_cost_high"] * USD_M3DAY_TO_USD_MCM,
-                        unit="USD/MCM",
-                        mode="Mf",
-                    ).pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["technical_lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        node_loc=df_node["node"],
-                        time=sub_time,
-                    ),
-                ]
-            )
-        results["var_cost"] = var_cost
+        var_cost_args = [
+            (df_var, "M1", df_var["var_cost_mid"]),
+            # Variable cost for distribution technologies
+            (df_var_dist, "Mf", df_var_dist["var_cost_high"]),
+        ]
     else:
-        # Variable cost
-        for index, rows in df_var.iterrows():
-            # Check if this is a dummy technology
-            use_same_year = is_dummy_technology(rows)
-
-            var_cost = pd.concat(
-                [
-                    var_cost,
-                    make_df(
-                        "var_cost",
-                        technology=rows["tec"],
-                        value=df_var["var_cost_mid"] * USD_M3DAY_TO_USD_MCM,
-                        unit="USD/MCM",
-                        mode="M1",
-                    ).pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["technical_lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        node_loc=df_node["node"],
-                        time=sub_time,
-                    ),
-                ]
-            )
-
-        for index, rows in df_var_dist.iterrows():
-            # Check if this is a dummy technology
-            use_same_year = is_dummy_technology(rows)
-
-            var_cost = pd.concat(
-                [
-                    var_cost,
-                    make_df(
-                        "var_cost",
-                        technology=rows["tec"],
-                        value=rows["var_cost_mid"] * USD_M3DAY_TO_USD_MCM,
-                        unit="USD/MCM",
-                        mode="M1",
-                    ).pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["technical_lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        node_loc=df_node["node"],
-                        time=sub_time,
-                    ),
-                ]
-            )
+        # NB For each row of `df_var`, data with that row's technology are generated
+        #    with the values for *all* rows of `df_var`
+        i, j = _pairs(len(df_var))
+        var_cost_args = [
+            (df_var.iloc[i], "M1", df_var["var_cost_mid"].array.take(j)),
+            (df_var_dist, "M1", df_var_dist["var_cost_mid"]),
+            (df_var_dist, "Mf", df_var_dist["var_cost_high"]),
+        ]
 
-            var_cost = pd.concat(
-                [
-                    var_cost,
-                    make_df(
-                        "var_cost",
-                        technology=rows["tec"],
-                        value=rows["var_cost_high"] * USD_M3DAY_TO_USD_MCM,
-                        unit="USD/MCM",
-                        mode="Mf",
-                    ).pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["technical_lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        node_loc=df_node["node"],
-                        time=sub_time,
-                    ),
-                ]
+    var_cost = pd.concat(
+        [
+            _make_by_row(
+                "var_cost",
+                scenario_info,
+                rows,
+                node_loc=df_node["node"],
+                time=sub_time,
+                technology=rows["tec"],
+                value=np.asarray(value) * USD_M3DAY_TO_USD_MCM,
+                unit="USD/MCM",
+                mode=mode,
             )
-        results["var_cost"] = var_cost
+            for rows, mode, value in var_cost_args
+        ]
+    )
+    results["var_cost"] = var_cost
 
     # Add the input dataframe to results
     results["input"] = inp_df
@@ -646,111 +456,42 @@ def prepare_input_dataframe(
     df_elec: pd.DataFrame,
 ) -> defaultdict[Any, list]:
     result_dc = defaultdict(list)
+
+    # Distribution technologies have Mf mode input, plus M1 mode input for baseline.
+    # Other technologies have M1 mode input.
+    dist = df_elec["tec"].isin(techs)
+    modes = [(dist, "Mf", "value_mid")]
+    if context.SDG == "baseline":
+        modes.append((dist, "M1", "value_high"))
+    modes.append((~dist, "M1", "value_high"))
+
     # Unit 1 KWh/m^3 = 10^3 GWh/Km^3 = 1 GWh/MCM,
     # Parkinson et al.
     # which is the only explanation as to how the model solved.
-    for _, rows in df_elec.iterrows():
-        if rows["tec"] in techs:
-            # Check if this is a dummy technology (for distribution techs)
-            use_same_year = is_dummy_technology(rows)
-
-            if context.SDG != "baseline":
-                inp = make_df(
-                    "input",
-                    technology=rows["tec"],
-                    value=rows["value_mid"] * kWh_m3_TO_GWa_MCM,
-                    unit="GWa/MCM",
-                    level="final",
-                    commodity="electr",
-                    mode="Mf",
-                    time_origin="year",
-                    node_loc=df_node["node"],
-                    node_origin=df_node["region"],
-                ).pipe(
-                    broadcast,
-                    get_vintage_and_active_years(
-                        scenario_info,
-                        # 1 because elec commodities don't have technical lifetime
-                        1,
-                        same_year_only=use_same_year,
-                    ),
-                    time=sub_time,
-                )
-
-                result_dc["input"].append(inp)
-            else:
-                inp = make_df(
-                    "input",
-                    technology=rows["tec"],
-                    value=rows["value_mid"] * kWh_m3_TO_GWa_MCM,
-                    unit="GWa/MCM",
-                    level="final",
-                    commodity="electr",
-                    mode="Mf",
-                    time_origin="year",
-                    node_loc=df_node["node"],
-                    node_origin=df_node["region"],
-                ).pipe(
-                    broadcast,
-                    get_vintage_and_active_years(
-                        scenario_info,
-                        # 1 because elec commodities don't have technical lifetime
-                        1,
-                        same_year_only=use_same_year,
-                    ),
-                    time=sub_time,
-                )
-
-                inp = pd.concat(
-                    [
-                        inp,
-                        make_df(
-                            "input",
-                            technology=rows["tec"],
-                            value=rows["value_high"] * kWh_m3_TO_GWa_MCM,
-                            unit="GWa/MCM",
-                            level="final",
-                            commodity="electr",
-                            mode="M1",
-                            time_origin="year",
-                            node_loc=df_node["node"],
-                            node_origin=df_node["region"],
-                        ).pipe(
-                            broadcast,
-                            # 1 because elec commodities don't have technical lifetime
-                            get_vintage_and_active_years(
-                                scenario_info, 1, same_year_only=use_same_year
-                            ),
-                            time=sub_time,
-                        ),
-                    ]
-                )
-
-                result_dc["input"].append(inp)
-        else:
-            # Check if this is a dummy technology (for non-distribution techs)
-            use_same_year = is_dummy_technology(rows)
-
-            inp = make_df(
+    for mask, mode, col in modes:
+        rows = df_elec[mask]
+        if not len(rows):
+            continue
+        result_dc["input"].append(
+            _make_by_row(
                 "input",
+                scenario_info,
+                rows,
+                # 1 because elec commodities don't have technical lifetime
+                1,
+                labels=pd.DataFrame(
+                    dict(node_loc=df_node["node"], node_origin=df_node["region"])
+                ),
+                time=sub_time,
                 technology=rows["tec"],
-                value=rows["value_high"] * kWh_m3_TO_GWa_MCM,
+                value=rows[col] * kWh_m3_TO_GWa_MCM,
                 unit="GWa/MCM",
                 level="final",
                 commodity="electr",
-                mode="M1",
+                mode=mode,
                 time_origin="year",
-                node_loc=df_node["node"],
-                node_origin=df_node["region"],
-            ).pipe(
-                broadcast,
-                get_vintage_and_active_years(
-                    scenario_info, 1, same_year_only=use_same_year
-                ),
-                time=sub_time,
             )
-
-            result_dc["input"].append(inp)
+        )
     return result_dc
 
 
@@ -898,56 +639,31 @@ def add_desalination(context: "Context") -> dict[str, pd.DataFrame]:
 
     results["inv_cost"] = inv_cost
 
-    fix_cost = pd.DataFrame([])
-    var_cost = pd.DataFrame([])
-    for index, rows in df_desal.iterrows():
-        # Check if this is a dummy technology (desalination techs have real costs)
-        use_same_year = is_dummy_technology(rows)
-
-        # Fixed costs
-        # Prepare dataframe for fix_cost
-        fix_cost = pd.concat(
-            [
-                fix_cost,
-                make_df(
-                    "fix_cost",
-                    technology=rows["tec"],
-                    value=rows["fix_cost_mid"] * USD_M3DAY_TO_USD_MCM,
-                    unit="USD/MCM",
-                ).pipe(
-                    broadcast,
-                    get_vintage_and_active_years(
-                        scenario_info,
-                        rows["lifetime_mid"],
-                        same_year_only=use_same_year,
-                    ),
-                    node_loc=df_node["node"],
-                ),
-            ]
-        )
+    # Fixed costs
+    fix_cost = _make_by_row(
+        "fix_cost",
+        scenario_info,
+        df_desal,
+        "lifetime_mid",
+        node_loc=df_node["node"],
+        technology=df_desal["tec"],
+        value=df_desal["fix_cost_mid"] * USD_M3DAY_TO_USD_MCM,
+        unit="USD/MCM",
+    )
 
-        # Variable cost
-        var_cost = pd.concat(
-            [
-                var_cost,
-                make_df(
-                    "var_cost",
-                    technology=rows["tec"],
-                    value=rows["var_cost_mid"] * USD_M3DAY_TO_USD_MCM,
-                    unit="USD/MCM",
-                    mode="M1",
-                ).pipe(
-                    broadcast,
-                    get_vintage_and_active_years(
-                        scenario_info,
-                        rows["lifetime_mid"],
-                        same_year_only=use_same_year,
-                    ),
-                    node_loc=df_node["node"],
-                    time=pd.Series(sub_time),
-                ),
-            ]
-        )
+    # Variable cost
+    var_cost = _make_by_row(
+        "var_cost",
+        scenario_info,
+        df_desal,
+        "lifetime_mid",
+        node_loc=df_node["node"],
+        time=sub_time,
+        technology=df_desal["tec"],
+        value=df_desal["var_cost_mid"] * USD_M3DAY_TO_USD_MCM,
+        unit="USD/MCM",
+        mode="M1",
+    )
 
     # Dummy  Variable cost for salinewater extrqction
     # var_cost = var_cost.append(
@@ -985,141 +701,80 @@ def add_desalination(context: "Context") -> dict[str, pd.DataFrame]:
     cons_time = make_matched_dfs(tl, construction_time=3)
     results["construction_time"] = cons_time["construction_time"]
 
-    from collections import defaultdict
-
-    result_dc = defaultdict(list)
-
-    for index, rows in df_desal.iterrows():
-        # Check if this is a dummy technology (desalination techs have real costs)
-        use_same_year = is_dummy_technology(rows)
-
-        inp = make_df(
-            "input",
-            technology=rows["tec"],
-            value=rows["electricity_input_mid"] * GWa_KM3_TO_GWa_MCM,
-            unit="GWa/MCM",
-            level="final",
-            commodity="electr",
-            mode="M1",
-            time_origin="year",
-            node_loc=df_node["node"],
-            node_origin=df_node["region"],
-        ).pipe(
-            broadcast,
-            get_vintage_and_active_years(
-                scenario_info, rows["lifetime_mid"], same_year_only=use_same_year
-            ),
-            time=pd.Series(sub_time),
-        )
-
-        result_dc["input"].append(inp)
-
-    results_new = {par_name: pd.concat(dfs) for par_name, dfs in result_dc.items()}
-
-    inp_df = results_new["input"]
-
-    # Adding input dataframe
+    # Electricity and heat input
+    labels = pd.DataFrame(dict(node_loc=df_node["node"], node_origin=df_node["region"]))
     df_heat = df_desal[df_desal["heat_input_mid"] > 0]
-
-    result_dc = defaultdict(list)
-
-    for index, rows in df_heat.iterrows():
-        # Check if this is a dummy technology (desalination techs have real costs)
-        use_same_year = is_dummy_technology(rows)
-
-        inp = make_df(
-            "input",
-            technology=rows["tec"],
-            value=rows["heat_input_mid"] * GWa_KM3_TO_GWa_MCM,
-            unit="GWa/MCM",
-            level="final",
-            commodity="d_heat",
-            mode="M1",
-            time_origin="year",
-            node_loc=df_node["node"],
-            node_origin=df_node["region"],
-        ).pipe(
-            broadcast,
-            get_vintage_and_active_years(
-                scenario_info, rows["lifetime_mid"], same_year_only=use_same_year
-            ),
-            time=pd.Series(sub_time),
-        )
-
-        result_dc["input"].append(inp)
-
-    results_new = {par_name: pd.concat(dfs) for par_name, dfs in result_dc.items()}
-
-    inp_df = pd.concat([inp_df, results_new["input"]])
+    inp_df = pd.concat(
+        [
+            _make_by_row(
+                "input",
+                scenario_info,
+                rows,
+                "lifetime_mid",
+                labels=labels,
+                time=sub_time,
+                technology=rows["tec"],
+                value=rows[col] * GWa_KM3_TO_GWa_MCM,
+                unit="GWa/MCM",
+                level="final",
+                commodity=commodity,
+                mode="M1",
+                time_origin="year",
+            )
+            for rows, commodity, col in (
+                (df_desal, "electr", "electricity_input_mid"),
+                (df_heat, "d_heat", "heat_input_mid"),
+            )
+            if len(rows)
+        ]
+    )
 
     # Adding input dataframe
-    for index, rows in df_desal.iterrows():
-        # Check if this is a dummy technology (desalination techs have real costs)
-        use_same_year = is_dummy_technology(rows)
-
-        inp_df = pd.concat(
-            [
-                inp_df,
-                (
-                    make_df(
-                        "input",
-                        technology=rows["tec"],
-                        value=1,
-                        unit="MCM",
-                        level=rows["inlvl"],
-                        commodity=rows["incmd"],
-                        mode="M1",
-                    )
-                    .pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        node_loc=df_node["node"],
-                        time=pd.Series(sub_time),
-                    )
-                    .pipe(same_node)
-                    .pipe(same_time)
-                ),
-            ]
-        )
-
-        inp_df.dropna(inplace=True)
-
-        results["input"] = inp_df
-
-        out_df = pd.concat(
-            [
-                out_df,
-                (
-                    make_df(
-                        "output",
-                        technology=rows["tec"],
-                        value=1,
-                        unit="MCM",
-                        level=rows["outlvl"],
-                        commodity=rows["outcmd"],
-                        mode="M1",
-                    )
-                    .pipe(
-                        broadcast,
-                        get_vintage_and_active_years(
-                            scenario_info,
-                            rows["lifetime_mid"],
-                            same_year_only=use_same_year,
-                        ),
-                        node_loc=df_node["node"],
-                        time=pd.Series(sub_time),
-                    )
-                    .pipe(same_node)
-                    .pipe(same_time)
-                ),
-            ]
-        )
+    inp_df = pd.concat(
+        [
+            inp_df,
+            _make_by_row(
+                "input",
+                scenario_info,
+                df_desal,
+                "lifetime_mid",
+                node_loc=df_node["node"],
+                time=sub_time,
+                technology=df_desal["tec"],
+                value=1,
+                unit="MCM",
+                level=df_desal["inlvl"],
+                commodity=df_desal["incmd"],
+                mode="M1",
+            )
+            .pipe(same_node)
+            .pipe(same_time),
+        ]
+    )
+    results["input"] = inp_df.dropna()
 
-        results["output"] = out_df
+    out_df = pd.concat(
+        [
+            out_df,
+            _make_by_row(
+                "output",
+                scenario_info,
+                df_desal,
+                "lifetime_mid",
+                node_loc=df_node["node"],
+                time=sub_time,
+                technology=df_desal["tec"],
+                value=1,
+                unit="MCM",
+                level=df_desal["outlvl"],
+                commodity=df_desal["outcmd"],
+                mode="M1",
+            )
+            .pipe(same_node)
+            .pipe(same_time),
+        ]
+    )
+    results["output"] = out_df
 
     # putting a lower bound on desalination tecs based on hist capacities
     df_bound = df_hist[df_hist["year"] == 2025]  # firstyear dataabsent
@@ -10,7 +10,6 @@ from warnings import warn
 import genno.config
 import yaml
 from genno import Key
-from genno.compat.pyam import iamc as handle_iamc
 from genno.core.key import single_key
 from ixmp.util import discard_on_error
 from message_ix import Reporter, Scenario
@@ -141,6 +140,8 @@ def iamc(c: Reporter, info):
     """
     # FIXME the upstream key "variable" for the configuration is confusing; choose a
     #       better name
+    from genno.compat.pyam import iamc as handle_iamc
+
     from message_ix_models.report.util import collapse
 
     # Common
@@ -348,7 +349,9 @@ def prepare_reporter(
         retrieve a Scenario.
     reporter : .Reporter, optional
         Existing reporter to extend with computations. If not given, it is created
-        using :meth:`message_ix.Reporter.from_scenario`.
+        using :meth:`message_ix.Reporter.from_scenario`; or, if
+        :attr:`.Config.use_template` is set, from a template prepared for an earlier
+        scenario with the same structure. See :mod:`.report.template`.
 
     Returns
     -------
@@ -368,20 +371,12 @@ def prepare_reporter(
 
     if reporter:
         # Existing `Reporter` provided
-        rep = reporter
-        has_solution = True
         if scenario:
             log.warning(f"{scenario = } argument ignored")
-        scenario = rep.graph["scenario"]
+        scenario = reporter.graph["scenario"]
     else:
         # Retrieve the scenario
         scenario = scenario or context.get_scenario()
-        # Create a new Reporter
-        rep = Reporter.from_scenario(scenario)
-        has_solution = scenario.has_solution()
-
-    # Append the message_data operators
-    rep.require_compat("message_ix_models.report.operator")
 
     # Force re-installation of the function iamc() in this file as the handler for
     # "iamc:" sections in global.yaml. Until message_data.reporting is removed, then
@@ -397,6 +392,38 @@ def prepare_reporter(
         assert context.report.output_dir
         context.report.set_output_dir(context.report.output_dir.joinpath(si.path))
 
+    if reporter:
+        rep, key = _prepare_reporter(context, scenario, reporter)
+    elif context.report.use_template:
+        from .template import prepare
+
+        rep, key = prepare(context, scenario, _prepare_reporter)
+    else:
+        rep, key = _prepare_reporter(context, scenario)
+
+    # Create the output directory
+    context.report.mkdir()
+
+    log.info("…done")
+
+    return rep, key
+
+
+def _prepare_reporter(
+    context: Context, scenario: Scenario, reporter: Reporter | None = None
+) -> tuple[Reporter, "KeyLike | None"]:
+    """Prepare a :class:`.Reporter`; see :func:`prepare_reporter`."""
+    if reporter:
+        rep = reporter
+        has_solution = True
+    else:
+        # Create a new Reporter
+        rep = Reporter.from_scenario(scenario)
+        has_solution = scenario.has_solution()
+
+    # Append the message_data operators
+    rep.require_compat("message_ix_models.report.operator")
+
     # Pass values to genno's configuration; deepcopy to protect from destructive
     # operations
     rep.configure(
@@ -432,11 +459,6 @@ def prepare_reporter(
     else:
         log.info("No key given and no default")
 
-    # Create the output directory
-    context.report.mkdir()
-
-    log.info("…done")
-
     return rep, key
 
 
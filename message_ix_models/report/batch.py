@@ -0,0 +1,248 @@
+"""Report many scenarios, optionally in parallel processes."""
+
+import logging
+import multiprocessing
+import re
+import traceback
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import deepcopy
+from fnmatch import fnmatchcase
+from os import getpid
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from message_ix_models import ScenarioInfo
+
+if TYPE_CHECKING:
+    from message_ix_models import Context
+
+log = logging.getLogger(__name__)
+
+#: Characters that mark a model or scenario name in a URL as a pattern. "?" is not
+#: used, because it begins the query part of a URL.
+GLOB = re.compile(r"[*\[]")
+
+#: Name of the summary file written by :func:`report_batch` in
+#: :attr:`.report.Config.output_dir`.
+SUMMARY = "batch-summary.csv"
+
+#: Context for :func:`_report_one` in a worker process. See :func:`_init_worker`.
+_CONTEXT: "Context | None" = None
+
+
+def _url(si: ScenarioInfo) -> str:
+    return f"ixmp://{si.platform_name}/{si.url}"
+
+
+def expand(
+    scenarios: Iterable["ScenarioInfo | str"], platform_name: str | None = None
+) -> list[ScenarioInfo]:
+    """Return a list of :class:`.ScenarioInfo` for `scenarios`.
+
+    Each of `scenarios` is either a :class:`.ScenarioInfo` or a scenario URL like
+    "ixmp://platform/model/scenario#version". The model and scenario names may contain
+    the shell-style wildcards "*" and "[…]". These are replaced with every matching
+    scenario on the platform: the default versions, or, if a version is given, that
+    version of each matching scenario.
+
+    Parameters
+    ----------
+    platform_name : str, optional
+        Platform for entries that do not give one.
+    """
+    import ixmp
+
+    platforms: dict[str, ixmp.Platform] = {}
+    result = []
+
+    for item in scenarios:
+        si = ScenarioInfo.from_url(item) if isinstance(item, str) else item
+        si.platform_name = si.platform_name or platform_name
+
+        if not GLOB.search(f"{si.model}/{si.scenario}"):
+            result.append(si)
+            continue
+
+        # Match the pattern against the scenarios on the platform
+        name = str(si.platform_name)
+        mp = platforms.setdefault(name, ixmp.Platform(name))
+        df = mp.scenario_list(default=si.version is None)
+        mask = pd.Series(
+            [
+                fnmatchcase(m, str(si.model)) and fnmatchcase(s, str(si.scenario))
+                for m, s in zip(df["model"], df["scenario"])
+            ],
+            index=df.index,
+        )
+        if si.version is not None:
+            mask &= df["version"] == int(si.version)
+
+        matched = df[mask].sort_values(["model", "scenario", "version"])
+        log.info(f"{len(matched)} scenario(s) match {_url(si)}")
+        for row in matched.itertuples():
+            result.append(
+                ScenarioInfo(
+                    model=row.model,
+                    scenario=row.scenario,
+                    version=int(row.version),
+                    platform_name=name,
+                )
+            )
+
+    for mp in platforms.values():
+        mp.close_db()
+
+    return result
+
+
+def _init_worker(context: "Context") -> None:
+    """Store `context` for use by :func:`_report_one` in a worker process."""
+    global _CONTEXT
+    _CONTEXT = context
+
+
+def _report_one(si: ScenarioInfo, context: "Context | None" = None) -> dict:
+    """Report the scenario identified by `si`; return a row for the summary.
+
+    If `context` is not given, the one stored by :func:`_init_worker` is used. The
+    scenario is reported using a copy of `context`, so that changes made while
+    reporting one scenario—for instance, to :attr:`.report.Config.output_dir`—do not
+    affect others. Only the :class:`ixmp.Platform` of `context` is used by the copy,
+    and kept open while consecutive scenarios are on the same platform. Any exception
+    is logged and recorded in the "error" column, instead of being raised.
+    """
+    from . import report
+
+    base = context or _CONTEXT
+    assert base is not None
+
+    url = _url(si)
+    row = dict(url=url, output_dir="", error="", time=0.0, pid=getpid())
+
+    t0 = perf_counter()
+    ctx = deepcopy(base)
+    try:
+        if base.platform_info.get("name") != si.platform_name:
+            base.close_db()
+            base.platform_info = dict(name=si.platform_name)
+        ctx.platform_info = dict(base.platform_info)
+        ctx.core._mp = base.get_platform()
+        ctx.scenario_info = dict(si)
+
+        report(ctx)
+
+        row.update(output_dir=str(ctx.report.output_dir))
+    except Exception as e:
+        log.error(f"Failed to report {url}:\n{traceback.format_exc()}")
+        row.update(error="".join(traceback.format_exception_only(e)).strip())
+    finally:
+        ctx.core._mp = None  # Keep the Platform of `base` open
+        ctx.delete()
+        row.update(time=perf_counter() - t0)
+
+    return row
+
+
+def report_batch(
+    context: "Context",
+    scenarios: Iterable["ScenarioInfo | str"],
+    *,
+    jobs: int = 1,
+    use_template: bool = False,
+) -> pd.DataFrame:
+    """Report many `scenarios`, using :func:`.report` for each.
+
+    Scenarios are reported in up to `jobs` worker processes. Each process opens its
+    own connection to the :class:`ixmp.Platform`, and keeps it for every scenario it
+    reports. With `use_template`, each process also prepares the :class:`.Reporter`
+    once for each distinct scenario structure, and reuses it for later scenarios, if
+    the reporting callbacks allow this; see :attr:`.report.Config.use_template` and
+    :mod:`.report.template`.
+
+    A failure to report one scenario is logged, and does not stop the others. Outputs
+    for each scenario are written to a separate directory under
+    :attr:`.report.Config.output_dir`; see :attr:`.report.Config.use_scenario_path`.
+    As each scenario is completed, a summary is (re)written to the file
+    :data:`SUMMARY` in the same directory.
+
+    Parameters
+    ----------
+    context : .Context
+        Settings for reporting. This is copied, and not modified.
+    scenarios :
+        Scenarios to report. See :func:`expand`.
+    jobs : int, optional
+        Number of worker processes. If 1, all scenarios are reported in the current
+        process.
+    use_template : bool, optional
+        Value for :attr:`.report.Config.use_template`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Summary, with one row per scenario, in the same order as `scenarios`, and the
+        columns:
+
+        - "url" of the scenario.
+        - "output_dir": directory containing the reporting outputs.
+        - "error": empty if the scenario was reported successfully; otherwise a
+          description of the exception raised.
+        - "time": time taken, in seconds.
+        - "pid": ID of the process that reported the scenario.
+    """
+    context = deepcopy(context)
+    context.report.use_template = use_template
+
+    infos = expand(scenarios, context.platform_info.get("name", "default"))
+    order = {_url(si): i for i, si in enumerate(infos)}
+
+    context.report.mkdir()
+    path = context.report.output_dir.joinpath(SUMMARY)
+    rows: list[dict] = []
+
+    def summary() -> pd.DataFrame:
+        return (
+            pd.DataFrame(rows, columns=["url", "output_dir", "error", "time", "pid"])
+            .sort_values("url", key=lambda s: s.map(order))
+            .reset_index(drop=True)
+        )
+
+    def _done(row: dict) -> None:
+        rows.append(row)
+        log.info(
+            f"{'Failed' if row['error'] else 'Reported'} {row['url']} in "
+            f"{row['time']:.1f} s ({len(rows)}/{len(infos)})"
+        )
+        summary().to_csv(path, index=False)
+
+    jobs = min(jobs, len(infos))
+    log.info(f"Report {len(infos)} scenario(s) with {max(jobs, 1)} process(es)")
+
+    if jobs <= 1:
+        for si in infos:
+            _done(_report_one(si, context))
+        context.close_db()
+    else:
+        # Use "spawn", not "fork": a forked process cannot use the JVM of its parent
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(context,),
+        ) as pool:
+            futures = {pool.submit(_report_one, si): si for si in infos}
+            for future in as_completed(futures):
+                try:
+                    row = future.result()
+                except Exception as e:  # For instance, the worker process ended
+                    row = dict(url=_url(futures[future]), error=repr(e), time=0.0)
+                _done(row)
+
+    result = summary()
+    N = (result["error"] != "").sum()
+    log.info(f"{N} of {len(result)} scenario(s) failed; summary in {path}")
+
+    return result
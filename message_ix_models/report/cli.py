@@ -42,9 +42,22 @@ def _modules_arg(context, param, value):
     type=click.Path(writable=True, resolve_path=True, path_type=Path),
     help="Write output to PATH instead of console or default locations.",
 )
+@click.option(
+    "--jobs",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of scenarios to report in parallel.",
+)
+@click.option(
+    "--template/--no-template",
+    default=False,
+    show_default=True,
+    help="With many scenarios, reuse prepared reporters where possible.",
+)
 @click.argument("key", default="message::default")
 @click.pass_obj
-def cli(context, config_file, legacy, cli_output, key, **kwargs):
+def cli(context, config_file, legacy, cli_output, jobs, template, key, **kwargs):
     """Postprocess results.
 
     KEY defaults to the comprehensive report 'message::default', but may also be the
@@ -54,16 +67,23 @@ def cli(context, config_file, legacy, cli_output, key, **kwargs):
     the stem (i.e. name without .yaml extension) of a file in data/report.
 
     With --urls-from-file, read multiple Scenario identifiers from FILE, and report each
-    one. In this usage, --output-path may only be a directory.
+    one. In this usage, --output-path may only be a directory. Model and scenario names,
+    in FILE or given with --url, may contain the wildcards "*" and "[…]" to report
+    every matching scenario. Up to --jobs scenarios are reported at the same time, each
+    in a separate process. A failure to report one scenario does not stop the others;
+    a summary of times and failures is written to batch-summary.csv in the output
+    directory, and the command exits with an error if any scenario failed. With
+    --template, each process prepares the reporter once for each distinct scenario
+    structure and reuses it, if the reporting callbacks allow this.
 
     If --verbose is given to the top-level CLI, the full description of the steps to
     calculate KEY is printed, as well as the entire result, if any.
     """
-    from copy import deepcopy
-
+    from message_ix_models import ScenarioInfo
     from message_ix_models.util._logging import mark_time
 
     from . import report
+    from .batch import GLOB, SUMMARY, report_batch
     from .config import Config
 
     # Update the reporting configuration from command-line parameters
@@ -71,27 +91,24 @@ def cli(context, config_file, legacy, cli_output, key, **kwargs):
         from_file=config_file, key=key, cli_output=cli_output, _legacy=legacy
     )
 
-    # Prepare a list of Context objects, each referring to one Scenario.
-    contexts = []
-
     # - If --urls-from-file was given, then `context.scenarios` will contain a list of
     #   ScenarioInfo objects that point to the platform and (model, scenario, version)
     #   identifiers.
-    # - Otherwise, the user gave identifiers for a single Scenario to the top-level CLI
-    #   (--url/--platform/--model/--scenario/--version) and these are stored in
-    #   `context.platform_info` and `context.scenario_info`.
-    for si in context.scenarios or [context.scenario_info]:
-        ctx = deepcopy(context)
-        ctx.platform_info = dict(
-            name=getattr(
-                si, "platform_name", context.platform_info.get("name", "default")
-            )
+    # - Otherwise, the user gave identifiers for a single Scenario, or a pattern, to the
+    #   top-level CLI (--url/--platform/--model/--scenario/--version) and these are
+    #   stored in `context.platform_info` and `context.scenario_info`.
+    si = ScenarioInfo(**context.scenario_info)
+    if context.scenarios or GLOB.search(f"{si.model}/{si.scenario}"):
+        result = report_batch(
+            context, context.scenarios or [si], jobs=jobs, use_template=template
         )
-        ctx.scenario_info = dict(si)
-        contexts.append(ctx)
-
-    for ctx in contexts:
+        if N := (result["error"] != "").sum():
+            raise click.ClickException(
+                f"Failed to report {N} of {len(result)} scenario(s); see "
+                f"{context.report.output_dir.joinpath(SUMMARY)}"
+            )
+    else:
         mark_time()
-        report(ctx)
+        report(context)
 
     mark_time()
@@ -96,6 +96,10 @@ class Config(ConfigHelper):
     #: name.
     use_scenario_path: bool = True
 
+    #: :data:`True` to prepare the :class:`.Reporter` from a template, if one exists
+    #: for a scenario with the same structure. See :mod:`.report.template`.
+    use_template: bool = False
+
     #: Keyword arguments for :func:`.report.legacy.iamc_report_hackathon.report`, plus
     #: the key "use", which should be :any:`True` if legacy reporting is to be used.
     legacy: dict = field(
@@ -1,5 +1,9 @@
 import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from time import perf_counter
 
 import pandas as pd
 import yaml
@@ -13,9 +17,71 @@ from message_ix_models.util.compat.message_data.utilities import retrieve_region
 
 from . import postprocess
 from . import pp_utils
+from .store import PREFETCH, ScenarioStore
 
 log = logging.getLogger(__name__)
 
+#: Names of module globals in :mod:`.pp_utils` and table definition modules that are
+#: set by :func:`report` and copied to worker processes by :func:`_init_worker`.
+_GLOBALS = (
+    # pp_utils
+    "all_tecs",
+    "all_years",
+    "firstmodelyear",
+    "globalname",
+    "model_nm",
+    "region_id",
+    "regions",
+    "scen_nm",
+    "unit_conversion",
+    "verbose",
+    "years",
+    # Table definitions
+    "kyoto_hist_data",
+    "lu_hist_data",
+    "mu",
+    "pp",
+    "run_history",
+    "urban_perc_data",
+)
+
+
+def _init_worker(state: dict[str, dict]) -> None:
+    """Set module globals in a worker process from `state`."""
+    from importlib import import_module
+
+    for module_name, values in state.items():
+        module = import_module(module_name)
+        for k, v in values.items():
+            setattr(module, k, v)
+
+
+def _run_table(func, args: dict) -> tuple[pd.DataFrame, float]:
+    """Evaluate one reporting table; return the result and the time taken."""
+    t0 = perf_counter()
+    result = func(**args)
+    return result, perf_counter() - t0
+
+
+def _run_tables_parallel(
+    tables: dict, state: dict[str, dict], jobs: int
+) -> dict[str, tuple[pd.DataFrame, float]]:
+    """Evaluate `tables` in up to `jobs` processes, with module globals from `state`.
+
+    Results are returned in the same order as `tables`.
+    """
+    log.info(f"Evaluate {len(tables)} tables in {jobs} processes")
+
+    # Use "spawn", not "fork": a forked process cannot use the JVM of its parent
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(state,),
+    ) as pool:
+        futures = {i: pool.submit(_run_table, *task) for i, task in tables.items()}
+        return {i: f.result() for i, f in futures.items()}
+
 
 def report(
     mp,
@@ -34,6 +100,7 @@ def report(
     kyoto_hist=None,
     lu_hist=None,
     verbose=False,
+    jobs: int = 1,
     *,
     context: Context | None = None,
 ):
@@ -90,6 +157,10 @@ def report(
         Historic land-use GHG emissions for regions.
     verbose : str (default: False)
         Option whther to print onscreen messages.
+    jobs : int (default: 1)
+        Number of processes in which to evaluate reporting tables. If greater than 1,
+        tables are evaluated concurrently, each process using a copy of the model data
+        prefetched by the main process. The results are identical.
     context : .Context
         Only the ``dry_run`` setting is respected. If :data:`True`, configuration is
         read, but nothing is done.
@@ -183,15 +254,23 @@ def report(
     # Set global variables in pp_utils
     # --------------------------------
 
+    # Load each item once; reporting functions then select data from memory
+    ds = ScenarioStore(scen)
+    ds.prefetch(
+        PREFETCH
+        if run_history != "True"
+        else filter(lambda item: item[0] == "par", PREFETCH)
+    )
+
     if run_history != "True":
         # Configures reporting tools to retrieve results from optimization (var)
-        pp = postprocess.PostProcess(scen)
+        pp = postprocess.PostProcess(ds)
         pp_utils.firstmodelyear = scen.firstmodelyear
 
         pp_utils.years = get_optimization_years(scen)
     else:
         # Configures reporting tools to retrieve results from "reference_solution" (par)
-        pp = postprocess.PostProcess(scen, ix=False)
+        pp = postprocess.PostProcess(ds, ix=False)
         pp_utils.years = get_historical_years(scen) + get_optimization_years(scen)
 
     # Passes all model years to reporting tools
@@ -278,21 +357,44 @@ def report(
     # Run reporting tables
     # --------------------
 
-    dfs = {}
+    # Tables to be run, in order
+    tables = {}
     for i in run_tables:
         if run_tables[i]["active"] is True:
-            print("processing Table:", run_tables[i]["root"])
             if (
                 "condition" in run_tables[i]
                 and eval(run_tables[i]["condition"]) is True
             ):
                 continue
-            dfs[i] = (
-                func_dict[run_tables[i]["function"]]()
-                if "args" not in run_tables[i]
-                else func_dict[run_tables[i]["function"]](**run_tables[i]["args"])
+            tables[i] = (
+                func_dict[run_tables[i]["function"]],
+                run_tables[i].get("args", {}),
             )
 
+    if jobs > 1:
+        # Snapshot of the globals of modules used by the table functions
+        modules = {pp_utils, dflt_tbl} | {
+            sys.modules[func.__module__] for func, _ in tables.values()
+        }
+        state = {
+            m.__name__: {k: getattr(m, k) for k in _GLOBALS if hasattr(m, k)}
+            for m in modules
+        }
+        results = _run_tables_parallel(tables, state, jobs)
+    else:
+        results = {}
+        for i, (func, args) in tables.items():
+            print("processing Table:", run_tables[i]["root"])
+            results[i] = _run_table(func, args)
+
+    # Log the time taken by each table, slowest first
+    dfs = {i: df for i, (df, _) in results.items()}
+    times = sorted(((t, i) for i, (_, t) in results.items()), reverse=True)
+    log.info(
+        f"Evaluated {len(times)} tables in {sum(t for t, _ in times):.1f} s:\n"
+        + "\n".join(f"{t:8.2f} s  {run_tables[i]['root']}" for t, i in times)
+    )
+
     # ---------------------------------
     # Convert dataframes to IAMC-format
     # ---------------------------------
@@ -350,6 +452,8 @@ def report(
             df.append(pp_utils.iamc_it(dfs[i], run_tables[i]["root"], mapping))
     df = pd.concat(df, sort=True)
 
+    log.info(f"{ds.hits} queries answered from memory")
+
     # --------------
     # Process output
     # --------------
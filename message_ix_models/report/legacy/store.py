@@ -0,0 +1,184 @@
+"""In-memory store of scenario data for legacy reporting."""
+
+import logging
+from collections.abc import Iterable
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+#: Items retrieved by most legacy reporting tables. These are loaded by
+#: :meth:`ScenarioStore.prefetch` if no other names are given.
+PREFETCH = (
+    ("var", "ACT"),
+    ("var", "CAP"),
+    ("var", "CAP_NEW"),
+    ("var", "EMISS"),
+    ("var", "EXT"),
+    ("var", "PRICE_COMMODITY"),
+    ("par", "capacity_factor"),
+    ("par", "emission_factor"),
+    ("par", "fix_cost"),
+    ("par", "input"),
+    ("par", "inv_cost"),
+    ("par", "output"),
+    ("par", "relation_activity"),
+    ("par", "technical_lifetime"),
+    ("par", "var_cost"),
+)
+
+
+def _labels(values) -> list[str]:
+    """Return `values` as a flat list of :class:`str`, for comparison with labels."""
+    if isinstance(values, str) or not isinstance(values, Iterable):
+        return [str(values)]
+    result = []
+    for v in values:
+        result.extend(_labels(v))
+    return result
+
+
+class ScenarioStore:
+    """Read-only, in-memory view of the data in a :class:`.Scenario`.
+
+    :meth:`par`, :meth:`var`, and :meth:`set` have the same signatures as the methods
+    of :class:`message_ix.Scenario`. The first call for any item retrieves *all* its
+    data from the scenario; later calls, with any `filters`, select from the data in
+    memory. This replaces many small, filtered queries to the backend with one query
+    per item.
+
+    Filters are applied using an index, constructed on first use, of the row
+    positions for each label in each dimension. As with :mod:`ixmp`, filter values
+    may be single labels or lists of labels, and are compared as strings.
+
+    Other attributes and methods, for instance :attr:`.Scenario.model`, are those of
+    the underlying scenario.
+
+    A ScenarioStore can be pickled, for instance to pass to other processes. The data
+    in memory are included, but not the scenario; if needed, a pickled ScenarioStore
+    opens its own connection to the :class:`ixmp.Platform` to reload the scenario.
+
+    Parameters
+    ----------
+    scenario : message_ix.Scenario
+    """
+
+    def __init__(self, scenario):
+        self._scenario = scenario
+        # Identifiers to reload the scenario after unpickling
+        self._info = (
+            scenario.platform.name,
+            scenario.model,
+            scenario.scenario,
+            scenario.version,
+        )
+
+        # Full data, and row positions for each (dimension, label), by item type and
+        # name
+        self._data: dict[tuple[str, str], pd.DataFrame | pd.Series] = {}
+        self._index: dict[tuple[str, str, str], dict[str, np.ndarray]] = {}
+        self._var_list: list[str] | None = None
+
+        #: Number of calls to :meth:`par`, :meth:`var`, and :meth:`set` answered from
+        #: memory.
+        self.hits = 0
+
+    def __getattr__(self, name):
+        if name.startswith("_"):  # Not yet set, e.g. while unpickling
+            raise AttributeError(name)
+        return getattr(self.scenario, name)
+
+    def __getstate__(self):
+        # Pickle only the data, not the scenario or its Platform
+        return dict(self.__dict__, _scenario=None)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    @property
+    def scenario(self):
+        """The underlying :class:`.Scenario`."""
+        if self._scenario is None:
+            import ixmp
+            from message_ix import Scenario
+
+            name, model, scenario, version = self._info
+            log.info(f"Reload ixmp://{name}/{model}/{scenario}#{version}")
+            self._scenario = Scenario(ixmp.Platform(name), model, scenario, version)
+        return self._scenario
+
+    def _get(self, kind: str, name: str) -> pd.DataFrame | pd.Series:
+        """Return all data for item `name` of `kind`, loading it if necessary."""
+        key = (kind, name)
+        try:
+            result = self._data[key]
+        except KeyError:
+            result = self._data[key] = getattr(self.scenario, kind)(name)
+        else:
+            self.hits += 1
+        return result
+
+    def _rows(self, kind: str, name: str, dim: str, values) -> np.ndarray:
+        """Return row positions in the data for `name` with any of `values` on `dim`."""
+        key = (kind, name, dim)
+        try:
+            index = self._index[key]
+        except KeyError:
+            # Map each label to the positions of the rows where it appears
+            labels = self._data[(kind, name)][dim].astype(str)
+            index = self._index[key] = labels.groupby(labels.to_numpy()).indices
+
+        found = [index[v] for v in _labels(values) if v in index]
+        return np.unique(np.concatenate(found)) if found else np.array([], dtype=int)
+
+    def _select(self, kind: str, name: str, filters: dict | None):
+        data = self._get(kind, name)
+
+        if not filters or not isinstance(data, pd.DataFrame):
+            return data.copy()
+
+        rows: np.ndarray | None = None
+        for dim, values in filters.items():
+            if dim not in data.columns:
+                continue  # Match ixmp, which ignores filters on other dimensions
+            r = self._rows(kind, name, dim, values)
+            rows = r if rows is None else np.intersect1d(rows, r, assume_unique=True)
+
+        return data.copy() if rows is None else data.iloc[rows].reset_index(drop=True)
+
+    def par(self, name: str, filters: dict | None = None) -> pd.DataFrame:
+        """Return data for parameter `name`, optionally with `filters`."""
+        return self._select("par", name, filters)
+
+    def var(self, name: str, filters: dict | None = None) -> pd.DataFrame:
+        """Return data for variable `name`, optionally with `filters`."""
+        return self._select("var", name, filters)
+
+    def set(self, name: str, filters: dict | None = None):
+        """Return elements of set `name`, optionally with `filters`."""
+        return self._select("set", name, filters)
+
+    def var_list(self) -> list[str]:
+        """Return the list of variables in the scenario."""
+        if self._var_list is None:
+            self._var_list = list(self.scenario.var_list())
+        return list(self._var_list)
+
+    def prefetch(self, names: Iterable[tuple[str, str]] = PREFETCH) -> None:
+        """Load data for all the (kind, name) items in `names`.
+
+        Items that do not exist in the scenario, for instance variables of an unsolved
+        scenario, are skipped.
+        """
+        t0 = perf_counter()
+        N = 0
+        for kind, name in names:
+            if (kind, name) in self._data:
+                continue
+            try:
+                N += len(self._get(kind, name))
+            except Exception as e:  # Item does not exist or has no solution data
+                log.debug(f"Skip prefetch of {kind} {name!r}: {e!r}")
+        log.info(f"Prefetched {N} rows in {perf_counter() - t0:.1f} s")
@@ -0,0 +1,229 @@
+"""Reuse of prepared reporters across scenarios with the same structure.
+
+:func:`.prepare_reporter` creates a :class:`.Reporter` from a :class:`.Scenario`,
+applies :attr:`.Config.genno_config`, and calls every function from
+:meth:`.Config.iter_callbacks`. When many scenarios with identical structure are
+reported, this produces the same task graph each time.
+
+With :attr:`.Config.use_template`, :func:`prepare` instead stores the prepared graph as
+a serialized template, keyed by a :func:`fingerprint` of the scenario structure and the
+reporting configuration. For each later scenario with the same fingerprint, the
+template is deserialized and only the tasks in :data:`REBIND` are replaced, so the
+cost of preparation is paid once.
+
+Templates are kept in memory, so each process builds its own. This ensures any side
+effects of configuration and callbacks—for instance, definitions of units—also occur
+in every process.
+
+Templates are valid only if the callbacks add tasks that depend on the scenario
+through its structure (sets, and lists of parameters and variables), and through the
+"scenario" and "context" keys. Callbacks that read parameter or variable data from the
+scenario, or other settings of the :class:`.Context`, while preparing the graph, or
+that store other references to the scenario or context in tasks, cannot be used with
+templates. For instance, the callback for :mod:`.model.transport` stores
+:class:`.transport.Config` and information about the scenario in the graph. For this
+reason, templates are used only if every callback is in :data:`SAFE_CALLBACKS`;
+otherwise, every reporter is prepared in full.
+"""
+
+import io
+import logging
+import pickle
+from collections.abc import Callable
+from functools import reduce
+from importlib import import_module
+from importlib.metadata import version
+from types import FunctionType
+from typing import TYPE_CHECKING, Any
+
+from genno.caching import hash_args, hash_code, hash_contents
+from genno.core.graph import Graph
+from genno.core.operator import Operator
+from message_ix import Reporter
+
+if TYPE_CHECKING:
+    from genno.core.key import KeyLike
+    from message_ix import Scenario
+
+    from message_ix_models import Context
+
+log = logging.getLogger(__name__)
+
+#: Keys in a template that are replaced by :func:`load`.
+REBIND = ("context", "scenario")
+
+#: Qualified names of callbacks known to add tasks that depend on the scenario and
+#: context only through its structure and the keys in :data:`REBIND`. Other code
+#: **may** add to this set, if its callbacks satisfy the same condition.
+SAFE_CALLBACKS = {
+    "message_ix_models.report.defaults",
+    "message_ix_models.report.extraction.callback",
+    "message_ix_models.report.plot.callback",
+}
+
+#: Serialized templates, keyed by :func:`fingerprint`. :data:`None` if the reporter
+#: with a certain fingerprint could not be serialized.
+_TEMPLATES: dict[str, bytes | None] = {}
+
+
+def _attr(module: str, qualname: str, wrapped: bool) -> Any:
+    """Return the :class:`genno.Operator` `qualname`, or the function it wraps."""
+    result = reduce(getattr, qualname.split("."), import_module(module))
+    return result.__wrapped__ if wrapped else result
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler for task graphs.
+
+    Tasks refer to :class:`genno.Operator` instances, or to the functions they wrap.
+    The default pickler cannot store either: the class of each Operator is created
+    dynamically; and the module attribute with the name of a wrapped function is the
+    Operator, not the function. This pickler stores both as references to the module
+    attribute.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, Operator):
+            func, wrapped = obj.__wrapped__, False
+        elif isinstance(obj, FunctionType):
+            func, wrapped = obj, True
+        else:
+            return NotImplemented
+
+        try:
+            attr = _attr(func.__module__, func.__qualname__, wrapped)
+        except (AttributeError, ImportError, TypeError):
+            return NotImplemented
+
+        if attr is obj:
+            return _attr, (func.__module__, func.__qualname__, wrapped)
+        return NotImplemented
+
+
+def _callback_id(func: Callable) -> tuple[str, str]:
+    """Return the qualified name of `func` and a hash of its code."""
+    module = getattr(func, "__module__", "")
+    name = getattr(func, "__qualname__", repr(func))
+    return f"{module}.{name}", hash_code(func) if hasattr(func, "__code__") else ""
+
+
+def fingerprint(context: "Context", scenario: "Scenario") -> str:
+    """Return a hash of the structure of `scenario` and the reporting configuration.
+
+    The hash is computed from:
+
+    - The elements of every set in `scenario`; the names of its parameters, equations,
+      and variables; and whether it has a solution.
+    - The name and code of each callback from :meth:`.Config.iter_callbacks`.
+    - :attr:`.Config.genno_config`, except "output_dir", and the contents of the file
+      at its "path", if any; :attr:`.Config.key`; and :attr:`.Config.cli_output`.
+    - :attr:`.Context.model`.
+    - The versions of :mod:`genno`, :mod:`ixmp`, :mod:`message_ix`, and
+      :mod:`message_ix_models`.
+
+    Other code called by the callbacks, or files included by the file at "path", are
+    not hashed.
+    """
+    import message_ix_models.util.cache  # noqa: F401  Hashing of pandas objects
+
+    config = context.report
+
+    genno_config = config.genno_config.copy()
+    genno_config.pop("output_dir", None)
+    if path := genno_config.get("path"):
+        genno_config["path contents"] = hash_contents(path)
+
+    return hash_args(
+        sets={name: scenario.set(name) for name in scenario.set_list()},
+        items=[sorted(f()) for f in (scenario.par_list, scenario.equ_list)]
+        + [sorted(scenario.var_list())],
+        has_solution=scenario.has_solution(),
+        callbacks=list(map(_callback_id, config.iter_callbacks())),
+        genno_config=genno_config,
+        key=str(config.key),
+        cli_output=config.cli_output,
+        model=context.model,
+        versions=[
+            version(p) for p in "genno ixmp message_ix message_ix_models".split()
+        ],
+    )
+
+
+def dump(rep: Reporter, key: "KeyLike | None") -> bytes | None:
+    """Serialize `rep` and `key` as a template.
+
+    The tasks in :data:`REBIND` are omitted. If the graph contains objects that cannot
+    be serialized, for instance a lambda function, a warning is logged and
+    :data:`None` is returned.
+    """
+    state = dict(
+        graph={k: v for k, v in rep.graph.items() if k not in REBIND},
+        key=key,
+        modules=[m.__name__ for m in rep.modules],
+        # Keys as they appear in the graph: either str or genno.Key
+        rebind=[(name, k) for k in rep.graph for name in REBIND if k == name],
+    )
+    buf = io.BytesIO()
+    try:
+        _Pickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(state)
+    except (AttributeError, pickle.PicklingError, TypeError) as e:
+        log.warning(f"Reporter cannot be used as a template: {e}")
+        return None
+    return buf.getvalue()
+
+
+def load(
+    data: bytes, context: "Context", scenario: "Scenario"
+) -> tuple[Reporter, "KeyLike | None"]:
+    """Return a :class:`.Reporter` and key from the template `data`.
+
+    The tasks in :data:`REBIND` are set to `context` and `scenario`, and the
+    "output_dir" configuration to :attr:`.Config.output_dir`.
+    """
+    state = pickle.loads(data)
+
+    rep = Reporter()
+    rep.graph = Graph()
+    rep.graph.update(state["graph"])
+    rep.modules = [import_module(name) for name in state["modules"]]
+
+    values = dict(context=context, scenario=scenario)
+    for name, k in state["rebind"]:
+        rep.graph[k] = values[name]
+    rep.graph["config"]["output_dir"] = context.report.output_dir
+
+    return rep, state["key"]
+
+
+def prepare(
+    context: "Context",
+    scenario: "Scenario",
+    build: Callable[["Context", "Scenario"], tuple[Reporter, "KeyLike | None"]],
+) -> tuple[Reporter, "KeyLike | None"]:
+    """Return a :class:`.Reporter` and key for `scenario`, using a template if any.
+
+    If there is no template for the :func:`fingerprint` of `context` and `scenario`,
+    `build` is called to prepare the reporter, and the result stored as a template.
+    If any callback is not in :data:`SAFE_CALLBACKS`, `build` is always called, and no
+    template is stored.
+    """
+    names = [_callback_id(cb)[0] for cb in context.report.iter_callbacks()]
+    if unsafe := sorted(set(names) - SAFE_CALLBACKS):
+        log.info(f"Callback(s) may depend on the scenario; no template: {unsafe}")
+        return build(context, scenario)
+
+    fp = fingerprint(context, scenario)
+
+    try:
+        data = _TEMPLATES[fp]
+    except KeyError:
+        log.info(f"Build reporter template <{fp[:8]}…>")
+        rep, key = build(context, scenario)
+        _TEMPLATES[fp] = dump(rep, key)
+        return rep, key
+
+    if data is None:
+        return build(context, scenario)
+
+    log.info(f"Use reporter template <{fp[:8]}…>")
+    return load(data, context, scenario)
@@ -6,7 +6,6 @@ from itertools import count
 import pandas as pd
 from dask.core import quote
 from genno import Computer, Key, Keys
-from genno.compat.pyam.util import collapse as genno_collapse
 from genno.core.key import single_key
 from message_ix import Reporter
 from sdmx.model.common import Code
@@ -232,6 +231,8 @@ def collapse(df: pd.DataFrame, var=[]) -> pd.DataFrame:
     collapse_gwp_info
     test_collapse
     """
+    from genno.compat.pyam.util import collapse as genno_collapse
+
     # Convert some dimension labels to title-case strings
     for dim in filter(lambda d: d in df.columns, "clt"):
         df[dim] = df[dim].astype(str).str.title()
@@ -6,7 +6,9 @@ from pytest import param
 
 from message_ix_models import Context
 from message_ix_models.model.material.report.run_reporting import (
+    format_reporting_df,
     load_config,
+    pyam_df_from_rep,
     run,
     run_ch4_reporting,
     run_fe_methanol_nh3_reporting,
@@ -54,6 +56,41 @@ def test_load_config(config_name, exp_len) -> None:
     # TODO Extend assertions
 
 
+def test_format_reporting_df() -> None:
+    config = load_config("ch4_emi")
+    names = config.mapping.iamc_name.unique()
+
+    # Data for only the first variable, 2 regions and 2 years
+    df = pd.DataFrame(
+        [["R12_AFR", 2020, names[0], 1.0], ["R12_CHN", 2030, names[0], 2.0]],
+        columns=["nl", "ya", "iamc_name", "value"],
+    ).set_index(["nl", "ya", "iamc_name"])
+
+    result = format_reporting_df(
+        df, config.iamc_prefix, "m", "s", config.unit, config.mapping
+    )
+
+    # Other variables are filled with zeros for every region and year
+    assert len(names) * 2 * 2 - 2 == len(result)
+    assert 3.0 == result.data["value"].sum()
+    assert {config.iamc_prefix + n for n in names} == set(result.variable)
+
+
+def test_pyam_df_from_rep(reporter: Reporter) -> None:
+    cache: dict = {}
+
+    # Same result with or without a cache of the full quantities; each quantity is
+    # cached once and reused with different mappings
+    for name in "fe", "fe_methanol_ammonia", "fs1":
+        config = load_config(name)
+        pd.testing.assert_frame_equal(
+            pyam_df_from_rep(reporter, config.var, config.mapping),
+            pyam_df_from_rep(reporter, config.var, config.mapping, cache),
+        )
+
+    assert {"in", "out"} == set(cache)
+
+
 @MARK
 def test_run(scenario: Scenario) -> None:
     run(scenario)
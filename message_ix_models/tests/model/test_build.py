@@ -91,11 +91,12 @@ def test_apply_spec2(caplog, scenario: "Scenario", spec: Spec):
     )
 
 
-def test_apply_spec3(caplog, scenario: "Scenario", spec: Spec):
+@pytest.mark.parametrize("batch", [True, False])
+def test_apply_spec3(caplog, scenario: "Scenario", spec: Spec, batch: bool):
     """Actually remove data."""
     spec["remove"].set["node"] = ["new-york"]
 
-    apply_spec(scenario, spec)
+    apply_spec(scenario, spec, batch=batch)
 
     # Messages are logged about removals
     assert_logs(
@@ -130,3 +131,29 @@ def test_apply_spec4(request, caplog, scenario: "Scenario", spec: Spec):
 
     # Nothing logged for the already-existing region ID
     assert not any("already defined" in message for message in caplog.messages)
+
+
+def test_apply_spec5(caplog, scenario: "Scenario", spec: Spec):
+    """Elements of indexed sets are added in bulk and checked as required."""
+    spec.add.set["type_tec"] = ["foo"]
+    spec.add.set["cat_tec"] = [
+        ("foo", "canning_plant"),
+        ["foo", "transport_from_seattle"],
+    ]
+
+    # Function runs
+    apply_spec(scenario, spec)
+
+    # Elements were added
+    assert 2 == len(scenario.set("cat_tec", filters=dict(type_tec=["foo"])))
+    # Time elapsed is logged for each set
+    assert_logs(caplog, "s for 2 set(s); slowest: ")
+
+    # Added elements satisfy a check for required elements, in either form
+    s2 = Spec()
+    s2.require.set["cat_tec"] = [["foo", "canning_plant"], ("foo", "canning_plant")]
+    apply_spec(scenario, s2)
+
+    s2.require.set["cat_tec"].append(("foo", "bar"))
+    with pytest.raises(ValueError):
+        apply_spec(scenario, s2)
@@ -91,6 +91,23 @@ class TestGetCodes:
         assert World is R11_WEU.parent
         assert R11_WEU in World.child
 
+    def test_cache(self, test_context) -> None:
+        """get_codes() returns a new list of shared codes; data are stored on disk."""
+        codes = get_codes("node/R12")
+
+        # Modify the returned list
+        codes.pop(-1)
+
+        # Later results are not affected
+        result = get_codes("node/R12")
+        assert len(codes) + 1 == len(result)
+
+        # Codes are not unpickled again
+        assert codes[0] is result[0]
+
+        # Pickled data are stored in the cache directory
+        assert any(test_context.core.cache_path.glob("get_codes-*.pkl"))
+
     def test_commodities(self):
         data = get_codes("commodity")
 
@@ -1,10 +1,25 @@
+import pandas as pd
 import pytest
+from message_ix import make_df
+from pandas.testing import assert_frame_equal
 
+from message_ix_models import ScenarioInfo
+from message_ix_models.model.structure import get_codes
 from message_ix_models.model.water.data.infrastructure import (
+    _make_by_row,
     add_desalination,
     add_infrastructure_techs,
+    is_dummy_technology,
 )
+from message_ix_models.model.water.utils import get_vintage_and_active_years
 from message_ix_models.tests.model.water.conftest import water_params
+from message_ix_models.util import broadcast, package_data_path
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort the columns and rows of `df`, for comparison ignoring order."""
+    columns = sorted(df.columns)
+    return df[columns].sort_values(columns).reset_index(drop=True)
 
 
 @pytest.mark.parametrize(
@@ -54,3 +69,106 @@ def test_add_desalination(
     # Standard MESSAGE parameter validation
     assert_message_params(result, expected_keys=["input", "output"])
     assert_input_output_structure(result)
+
+
+@pytest.mark.parametrize(
+    "water_context, func, expected",
+    [
+        (
+            water_params("ZMB", SDG="baseline"),
+            add_infrastructure_techs,
+            "add_infrastructure_techs-ZMB-baseline",
+        ),
+        (
+            water_params("ZMB", SDG="not_baseline"),
+            add_infrastructure_techs,
+            "add_infrastructure_techs-ZMB-not_baseline",
+        ),
+        (
+            water_params("ZMB", RCP="7p0"),
+            add_desalination,
+            "add_desalination-ZMB-7p0",
+        ),
+    ],
+    indirect=["water_context"],
+)
+def test_regression(water_context, water_scenario, func, expected: str) -> None:
+    """Data are the same as from the previous implementation, except row order.
+
+    The expected data were generated using the code before it was changed to use
+    :func:`._make_by_row`, which constructed the data one row at a time. They contain
+    all parameters, with a column "name" giving the parameter name.
+    """
+    result = func(context=water_context)
+
+    exp = pd.read_csv(package_data_path("test", "water", f"{expected}.csv"))
+
+    # Same parameters with data
+    assert set(exp["name"]) == {k for k, df in result.items() if len(df)}
+
+    for name, df in exp.groupby("name"):
+        # Columns for this parameter, including those not filled
+        columns = result[name].columns
+        assert_frame_equal(
+            _sorted(df[columns]), _sorted(result[name]), check_dtype=False
+        )
+
+
+def test_make_by_row() -> None:
+    """:func:`._make_by_row` gives the same data as constructing each row separately."""
+    info = ScenarioInfo()
+    info.year_from_codes(get_codes("year/B"))
+
+    rows = pd.DataFrame(
+        dict(
+            tec=["t0", "t1", "t2", "t3"],
+            value=[1.0, 2.0, 3.0, 4.0],
+            technical_lifetime_mid=[30, 5, 30, 10],
+            # Row "t2" is a dummy technology
+            investment_mid=[1.0, 1.0, 0.0, 1.0],
+            fix_cost_mid=[1.0, 1.0, 0.0, 1.0],
+            var_cost_mid=[1.0, 1.0, 0.0, 1.0],
+        ),
+        index=[3, 5, 7, 9],
+    )
+    nodes = pd.Series(["n0", "n1"])
+    time = pd.Series(["year"])
+
+    # Reference: one row at a time
+    expected = pd.concat(
+        [
+            make_df("var_cost", technology=row["tec"], value=row["value"], mode="M1")
+            .pipe(
+                broadcast,
+                get_vintage_and_active_years(
+                    info,
+                    row["technical_lifetime_mid"],
+                    same_year_only=is_dummy_technology(row),
+                ),
+                node_loc=nodes,
+                time=time,
+            )
+            .assign(unit="USD/MCM")
+            for _, row in rows.iterrows()
+        ]
+    )
+
+    result = _make_by_row(
+        "var_cost",
+        info,
+        rows,
+        node_loc=nodes,
+        time=time,
+        technology=rows["tec"],
+        value=rows["value"],
+        unit="USD/MCM",
+        mode="M1",
+    )
+
+    # Same columns and data, except row order
+    assert list(expected.columns) == list(result.columns)
+    assert_frame_equal(_sorted(expected), _sorted(result), check_dtype=False)
+
+    # Dummy technology has only year_vtg == year_act
+    t2 = result.query("technology == 't2'")
+    assert (t2["year_vtg"] == t2["year_act"]).all()
@@ -0,0 +1,105 @@
+import pandas as pd
+import pytest
+from message_ix.testing import make_dantzig
+
+from message_ix_models import ScenarioInfo
+from message_ix_models.report import batch
+from message_ix_models.report.batch import SUMMARY, expand, report_batch
+
+
+def test_expand(request, test_context) -> None:
+    mp = test_context.get_platform()
+    # Use a model name not used by other tests, so that the wildcard below matches
+    # only these scenarios
+    s = make_dantzig(mp).clone(model=request.node.name)
+    s.clone(scenario="clone")
+
+    result = expand(
+        [
+            "model/scenario#1",
+            ScenarioInfo(model="m", scenario="s", platform_name="p"),
+            f"ixmp://{mp.name}/{s.model}/*",
+            f"ixmp://{mp.name}/{s.model}/[c]lone#1",
+        ],
+        platform_name="foo",
+    )
+
+    assert [
+        "ixmp://foo/model/scenario#1",
+        "ixmp://p/m/s#None",
+        f"ixmp://{mp.name}/{s.model}/clone#1",
+        f"ixmp://{mp.name}/{s.model}/{s.scenario}#{s.version}",
+        f"ixmp://{mp.name}/{s.model}/clone#1",
+    ] == [f"ixmp://{si.platform_name}/{si.url}" for si in result]
+
+
+def test_report_batch(tmp_path, test_context) -> None:
+    mp = test_context.get_platform()
+    s0 = make_dantzig(mp, solve=True, quiet=True)
+    s1 = s0.clone(scenario="clone")
+    s1.solve(quiet=True)
+
+    test_context.report.update(genno_config=dict(), key="ACT:nl-t")
+    test_context.report.set_output_dir(tmp_path)
+
+    urls = [f"ixmp://{mp.name}/{s0.model}/*", f"ixmp://{mp.name}/missing/scenario#1"]
+    result = report_batch(test_context, urls)
+
+    # One row per scenario, in order
+    assert 3 == len(result)
+    assert [s1.url, s0.url] == [u.split("/", 3)[-1] for u in result["url"][:2]]
+
+    # The missing scenario fails without affecting the others
+    assert ["", "", "ValueError"] == [e.split(":")[0] for e in result["error"]]
+
+    # Outputs are in one directory per scenario
+    assert all(str(tmp_path) in d and d != str(tmp_path) for d in result["output_dir"])
+
+    # Summary is written
+    assert tmp_path.joinpath(SUMMARY).exists()
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_report_batch_error(tmp_path, test_context, jobs: int) -> None:
+    test_context.report.set_output_dir(tmp_path)
+    urls = [f"ixmp://not-a-platform-{i}/model/scenario#1" for i in range(3)]
+
+    result = report_batch(test_context, urls, jobs=jobs)
+
+    # All scenarios are attempted, in order, and each failure is recorded
+    assert urls == result["url"].tolist()
+    assert result["error"].str.contains("not-a-platform").all()
+    assert (0 <= result["time"]).all()
+
+    # Summary file contains the same information
+    assert tmp_path.joinpath(SUMMARY).read_text().count("not-a-platform") >= 3
+
+
+def test_cli_error(tmp_path, mix_models_cli) -> None:
+    """:program:`mix-models report` exits with an error if any scenario fails."""
+    path = tmp_path.joinpath("urls.txt")
+    path.write_text("\n".join(f"ixmp://not-a-platform-{i}/m/s#1" for i in range(2)))
+
+    result = mix_models_cli.invoke(["report", f"--urls-from-file={path}"])
+
+    assert 1 == result.exit_code
+    assert "Failed to report 2 of 2 scenario(s)" in result.output
+
+
+@pytest.mark.parametrize("args, expected", (([], False), (["--template"], True)))
+def test_cli_template(monkeypatch, tmp_path, mix_models_cli, args, expected) -> None:
+    """:program:`mix-models report` uses templates only with --template."""
+    calls = []
+
+    def mock(context, scenarios, *, jobs, use_template):
+        calls.append(use_template)
+        return pd.DataFrame(dict(error=[""]))
+
+    monkeypatch.setattr(batch, "report_batch", mock)
+
+    path = tmp_path.joinpath("urls.txt")
+    path.write_text("ixmp://not-a-platform/m/s#1")
+    result = mix_models_cli.invoke(["report", f"--urls-from-file={path}"] + args)
+
+    assert 0 == result.exit_code, result.output
+    assert [expected] == calls
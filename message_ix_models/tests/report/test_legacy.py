@@ -1,9 +1,18 @@
 import logging
 import sys
 
+import pandas as pd
 import pytest
+from message_ix.testing import make_dantzig
+from pandas.testing import assert_frame_equal
 
 from message_ix_models.report import report
+from message_ix_models.report.legacy import pp_utils
+from message_ix_models.report.legacy.iamc_report_hackathon import (
+    _run_table,
+    _run_tables_parallel,
+)
+from message_ix_models.report.legacy.store import ScenarioStore
 from message_ix_models.testing import GHA
 
 log = logging.getLogger(__name__)
@@ -38,3 +47,55 @@ def test_legacy_report(test_context, loaded_snapshot):
     # scenario.timeseries()[
     #     "model", "scenario", "region", "variable", "year", "value", "unit"
     # ].to_csv(f"test_legacy_report-{scenario.scenario}.csv", index=False)
+
+
+def test_scenario_store(test_context) -> None:
+    scenario = make_dantzig(test_context.get_platform(), solve=True)
+    ds = ScenarioStore(scenario)
+
+    for kind, name, filters in (
+        ("par", "demand", None),
+        ("par", "demand", {"node": ["new-york", "topeka"]}),
+        ("par", "output", {"node_loc": "seattle", "year_act": [1963]}),
+        ("var", "ACT", {"node_loc": ["seattle"], "mode": ["to_chicago"]}),
+        ("var", "ACT", {"technology": ["transport_from_san-diego"]}),
+        ("set", "cat_year", {"type_year": ["firstmodelyear"]}),
+    ):
+        # Same data as retrieved directly from the scenario
+        exp = getattr(scenario, kind)(name, filters=filters)
+        obs = getattr(ds, kind)(name, filters)
+        cols = list(exp.columns)
+        assert_frame_equal(
+            exp.sort_values(cols).reset_index(drop=True),
+            obs.sort_values(cols).reset_index(drop=True),
+        )
+
+    # Data for "demand" and "ACT" were retrieved only once
+    assert 2 == ds.hits
+
+    # Other attributes are those of the scenario
+    assert scenario.model == ds.model
+
+
+def _table(value: float) -> pd.DataFrame:
+    """Reporting table function for :func:`test_run_tables_parallel`."""
+    return pd.DataFrame(dict(Model=[pp_utils.model_nm], value=[value]))
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_run_tables_parallel(monkeypatch, jobs: int) -> None:
+    tables = {k: (_table, dict(value=v)) for k, v in zip("cab", (1.0, 2.0, 3.0))}
+    state = {pp_utils.__name__: dict(model_nm="foo")}
+
+    if jobs == 1:
+        monkeypatch.setattr(pp_utils, "model_nm", "foo")
+        result = {k: _run_table(*task) for k, task in tables.items()}
+    else:
+        # Module globals are set in worker processes from `state`
+        result = _run_tables_parallel(tables, state, jobs)
+
+    # Results are in the order of `tables`
+    assert list("cab") == list(result)
+    for (k, (df, time)), value in zip(result.items(), (1.0, 2.0, 3.0)):
+        assert ["foo"] == df["Model"].tolist() and [value] == df["value"].tolist()
+        assert 0 <= time
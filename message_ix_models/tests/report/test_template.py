@@ -0,0 +1,149 @@
+import logging
+from time import perf_counter
+from typing import cast
+
+import pytest
+from genno import Quantity
+from ixmp.testing import assert_logs
+from message_ix import Reporter, Scenario
+from message_ix.testing import make_dantzig
+
+from message_ix_models.report import prepare_reporter, template
+from message_ix_models.report.operator import zeros_like
+
+log = logging.getLogger(__name__)
+
+
+def test_dump_load(caplog, test_context) -> None:
+    scenario0, scenario1 = object(), cast(Scenario, object())
+
+    rep0 = Reporter()
+    rep0.require_compat("message_ix_models.report.operator")
+    rep0.add("scenario", scenario0)
+    rep0.add("x:t", Quantity([1.0, 2.0], coords={"t": ["a", "b"]}, units="kg"))
+    # Tasks referring to genno and message_ix_models operators
+    rep0.add("y:t", "add", "x:t", "x:t")
+    rep0.add("z:t", zeros_like, "y:t")
+
+    data = template.dump(rep0, "y:t")
+    assert data is not None
+
+    rep1, key = template.load(data, test_context, scenario1)
+
+    # Same keys, modules, and key to report
+    assert set(rep0.graph) == set(rep1.graph)
+    assert rep0.modules == rep1.modules
+    assert "y:t" == key
+
+    # "scenario" is replaced; "context" is not added
+    assert scenario1 is rep1.graph["scenario"]
+    assert "context" not in rep1.graph
+    assert test_context.report.output_dir == rep1.graph["config"]["output_dir"]
+
+    # Graph is indexed, so keys can be inferred
+    assert "z:t" == rep1.infer_keys("z")
+
+    # Same results
+    for k in "y:t", "z:t":
+        assert (rep0.get(k) == rep1.get(k)).all()
+
+    # Template is not affected by changes to a reporter loaded from it
+    rep1.add("w", "add", "x:t", "y:t")
+    assert "w" not in template.load(data, test_context, scenario1)[0].graph
+
+    # A graph with an anonymous function cannot be dumped
+    rep0.add("w", lambda x: x, "x:t")
+    with assert_logs(caplog, "Reporter cannot be used as a template"):
+        assert template.dump(rep0, "y:t") is None
+
+
+def test_prepare_reporter(caplog, test_context) -> None:
+    mp = test_context.get_platform()
+    s0 = make_dantzig(mp, solve=True, quiet=True)
+    s1 = s0.clone(scenario="clone")
+    s1.solve(quiet=True)
+
+    test_context.report.update(
+        genno_config=dict(), key="ACT:nl-t", use_scenario_path=False, use_template=True
+    )
+
+    # Template is built for the first scenario
+    with caplog.at_level(logging.INFO, logger=template.__name__):
+        rep0, key0 = prepare_reporter(test_context, s0)
+    assert "Build reporter template" in caplog.text
+
+    # …and used for the second
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger=template.__name__):
+        rep1, key1 = prepare_reporter(test_context, s1)
+    assert "Use reporter template" in caplog.text
+
+    assert key0 == key1
+    assert s1 is rep1.graph["scenario"]
+
+    # Same graph and results as a reporter prepared without a template
+    test_context.report.use_template = False
+    rep2, key2 = prepare_reporter(test_context, s1)
+    assert set(rep2.graph) == set(rep1.graph)
+    assert (rep2.get(key2) == rep1.get(key1)).all()
+
+
+def _ssp(rep: Reporter, context) -> None:
+    # Like the .model.transport callback, store a setting of `context` in the graph
+    rep.add("ssp", str(context.transport.ssp))
+
+
+def test_prepare_reporter_unsafe(caplog, test_context) -> None:
+    """Scenarios with different settings give different results."""
+    from message_ix_models.model.transport import Config
+    from message_ix_models.project.ssp import SSP_2024
+
+    mp = test_context.get_platform()
+    s0 = make_dantzig(mp)
+    s1 = s0.clone(scenario="clone")
+
+    test_context.report.update(
+        genno_config=dict(), key="ssp", use_scenario_path=False, use_template=True
+    )
+    test_context.report.register(_ssp)
+
+    results = []
+    for s, ssp in (s0, "1"), (s1, "2"):
+        test_context.transport = Config(ssp=SSP_2024[ssp])
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger=template.__name__):
+            rep, key = prepare_reporter(test_context, s)
+        assert "may depend on the scenario; no template" in caplog.text
+        results.append(rep.get(key))
+
+    assert [str(SSP_2024["1"]), str(SSP_2024["2"])] == results
+
+
+def test_prepare_transport(test_context) -> None:
+    """The :mod:`.model.transport` callback prevents use of a template."""
+    test_context.report.register("model.transport")
+
+    calls = []
+
+    def build(context, scenario):
+        calls.append(scenario)
+        return Reporter(), None
+
+    for scenario in cast(Scenario, object()), cast(Scenario, object()):
+        template.prepare(test_context, scenario, build)
+
+    assert 2 == len(calls)
+
+
+@pytest.mark.parametrize("use_template", (False, True))
+def test_prepare_reporter_time(test_context, use_template) -> None:
+    mp = test_context.get_platform()
+    s = make_dantzig(mp, solve=True, quiet=True)
+
+    test_context.report.update(use_scenario_path=False, use_template=use_template)
+    prepare_reporter(test_context, s)
+
+    t0 = perf_counter()
+    for _ in range(3):
+        prepare_reporter(test_context, s)
+    log.info(f"{use_template = }: {(perf_counter() - t0) / 3:.3f} s per reporter")
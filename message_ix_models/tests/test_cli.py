@@ -1,10 +1,20 @@
 """Basic tests of the command line."""
 
+import logging
+import re
+import subprocess
+import sys
+from importlib import import_module
+
 import ixmp
 import pytest
 from message_ix.testing import make_dantzig
 
 from message_ix_models import util
+from message_ix_models.cli import submodules
+from message_ix_models.testing import GHA
+
+log = logging.getLogger(__name__)
 
 COMMANDS = [
     tuple(),
@@ -65,3 +75,55 @@ def test_cli_export_test_data(monkeypatch, tmp_path, test_context, mix_models_cl
     # The file is created in the expected location
     assert str(dest_file) in result.output
     assert dest_file.exists()
+
+
+@pytest.mark.parametrize("name", sorted(submodules))
+def test_submodules(name: str) -> None:
+    """Names and help text in :data:`.cli.submodules` match the actual commands."""
+    module_name, help = submodules[name]
+    cmd = import_module(module_name).cli
+
+    assert name == cmd.name
+    assert help == cmd.get_short_help_str(limit=1000)
+
+
+#: Modules that must not be imported by :py:`import message_ix_models.cli`.
+NOT_IMPORTED = [
+    "message_ix_models.model.bmt.cli",
+    "message_ix_models.model.buildings.cli",
+    "message_ix_models.model.material.cli",
+    "message_ix_models.model.transport.cli",
+    "message_ix_models.model.water.cli",
+    "message_ix_models.project.navigate.cli",
+    "message_ix_models.project.ssp.cli",
+    "message_ix_models.report.cli",
+    # Large packages needed only by some subcommands
+    "ixmp4",
+    "matplotlib",
+    "pyam",
+]
+
+
+@pytest.mark.skipif(
+    condition=GHA and sys.platform in ("darwin", "win32"), reason="Slow."
+)
+def test_import_time() -> None:
+    """Importing the CLI does not import the modules providing subcommands.
+
+    The time for the import depends on the machine, so it is only logged. The import
+    time budget is checked via :data:`NOT_IMPORTED`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import message_ix_models.cli"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    # Parse lines like "import time:  self [us] | cumulative | imported package"
+    expr = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+    cumulative = {m[4]: int(m[2]) for m in expr.finditer(result.stderr)}
+
+    assert set() == set(NOT_IMPORTED) & set(cumulative)
+
+    log.info(f"Import in {cumulative['message_ix_models.cli'] / 1e6:.2f} s")
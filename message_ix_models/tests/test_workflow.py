@@ -1,11 +1,22 @@
+import logging
 import re
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
 
 import pytest
 from message_ix import make_df
 
 from message_ix_models import Workflow, testing
-from message_ix_models.workflow import WorkflowStep, make_click_command, solve
+from message_ix_models.workflow import (
+    Ledger,
+    WorkflowStep,
+    _run_step,
+    make_click_command,
+    solve,
+)
 
 if TYPE_CHECKING:
     from message_ix import Scenario
@@ -50,6 +61,19 @@ class TestWorkflowStep:
         with pytest.raises(RuntimeError):
             ws(test_context, None)
 
+    def test_input_hash(self) -> None:
+        base = cast("Scenario", _FakeScenario("m", "s", 1))
+
+        def _hash(*args, **kwargs) -> str:
+            return WorkflowStep(*args, **kwargs).input_hash(base)
+
+        # Same for identical inputs, including functools.partial and function kwargs
+        action = partial(changes_b, value=1.0)
+        assert _hash(action, f=solve) == _hash(partial(changes_b, value=1.0), f=solve)
+        # Different for different arguments to the partial, or different kwargs
+        assert _hash(action) != _hash(partial(changes_b, value=2.0))
+        assert _hash(action, f=solve) != _hash(action, f=changes_a)
+
     def test_repr(self) -> None:
         assert "<Step load>" == repr(WorkflowStep(None))
 
@@ -114,6 +138,8 @@ def test_make_click_command(
         for params, output in (
             (["--go", "B"], "nothing returned, workflow will continue with"),
             (["B"], "Write workflow diagram to"),
+            (["--help"], "--jobs INTEGER"),
+            (["--help"], "--force"),
         ):
             # Command runs and exits with 0
             result = mix_models_cli.assert_exit_0(["_test", "run"] + params)
@@ -209,3 +235,154 @@ def test_workflow(
   - None""",
         wf.describe("B"),
     )
+
+
+class _ThreadPool(ThreadPoolExecutor):
+    """Stand-in for :class:`.ProcessPoolExecutor` that uses threads.
+
+    Like a worker process, each task receives copies of its arguments.
+    """
+
+    def __init__(self, max_workers: int, mp_context=None):
+        super().__init__(max_workers)
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(fn, *deepcopy(args), **deepcopy(kwargs))
+
+
+def test_run_parallel(
+    caplog, monkeypatch, request: "pytest.FixtureRequest", test_context: "Context"
+) -> None:
+    """:meth:`.Workflow.run` with `jobs` > 1 runs independent steps concurrently."""
+    import concurrent.futures
+
+    from message_ix_models import Context
+
+    # Worker processes cannot access the in-memory test database, so use threads
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _ThreadPool)
+    # Don't close the connection to the in-memory test database
+    monkeypatch.setattr(Context, "close_db", lambda self: None)
+
+    base = testing.bare_res(request, test_context, solved=False)
+    url = f"ixmp://{base.platform.name}/{base.model}"
+
+    wf = Workflow(test_context)
+    wf.add_step("base", None, target=f"{url}/{base.scenario}")
+    # Two independent steps with the same base
+    wf.add_step("A", "base", changes_a, target=f"{url}/A", clone=True)
+    wf.add_step("C", "base", changes_a, target=f"{url}/C", clone=True)
+    # A step that depends on "A"
+    wf.add_step("B", "A", changes_b, target=f"{url}/B", clone=True, value=2.0)
+    wf.add("all", ["B", "C"])
+
+    with caplog.at_level(logging.INFO, logger="message_ix_models"):
+        s_b, s_c = wf.run("all", jobs=2)
+
+    # All 4 steps are run
+    assert "Run 4 workflow steps with up to 2 processes" in caplog.messages
+    assert {"A", "B", "C", "base"} == {
+        m.split("'")[1] for m in caplog.messages if re.match("Step '.*' produced", m)
+    }
+
+    # "B" ran after "A", on its result
+    assert ("B", "C") == (s_b.scenario, s_c.scenario)
+    assert "test_tech" in s_c.set("technology")
+    assert [2.0] == s_b.par("technical_lifetime")["value"].tolist()
+
+
+def test_run_step(
+    monkeypatch, request: "pytest.FixtureRequest", test_context: "Context"
+) -> None:
+    """:func:`._run_step` retries a step that fails because a scenario is locked."""
+    from message_ix_models import Context
+
+    base = testing.bare_res(request, test_context, solved=False)
+
+    # Don't close the connection to the in-memory test database
+    monkeypatch.setattr(Context, "close_db", lambda self: None)
+
+    calls = []
+
+    def action(c: "Context", s: "Scenario") -> None:
+        calls.append(s.url)
+        if len(calls) == 1:
+            raise RuntimeError(f"Scenario {s.url} is locked by another process")
+
+    step = WorkflowStep(action)
+    info = (
+        dict(name=base.platform.name),
+        dict(model=base.model, scenario=base.scenario),
+    )
+    context = deepcopy(test_context)
+
+    # Step is retried once, then succeeds
+    result = _run_step(step, context, info, retries=1, delay=0.0)
+    assert 2 == len(calls)
+    assert base.scenario == result[1]["scenario"]
+    assert base.version == result[1]["version"]
+
+    # Exception is raised once retries are exhausted
+    calls.clear()
+    with pytest.raises(RuntimeError, match="is locked"):
+        _run_step(step, context, info, retries=0, delay=0.0)
+
+
+class _FakeScenario:
+    """Minimal stand-in for :class:`.Scenario` as used by :class:`.Ledger`."""
+
+    def __init__(self, model: str, scenario: str, version: int):
+        self.platform = SimpleNamespace(name="p")
+        self.model, self.scenario, self.version = model, scenario, version
+        self.url = f"{model}/{scenario}#{version}"
+
+
+def _record(path, worker: int) -> None:
+    ledger = Ledger(path)
+    for i in range(10):
+        s = cast("Scenario", _FakeScenario("m", f"{worker}-{i}", i))
+        ledger.record(s.scenario, "hash", s)
+
+
+def test_ledger_parallel(tmp_path) -> None:
+    """Entries recorded concurrently by several processes are all kept."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = tmp_path.joinpath("ledger.json")
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=4, mp_context=mp_context) as pool:
+        list(pool.map(_record, [path] * 4, range(4)))
+
+    assert 40 == len(Ledger(path).entries)
+
+
+def test_ledger(caplog, tmp_path, wf: "Workflow") -> None:
+    path = tmp_path.joinpath("ledger.json")
+    wf.ledger = Ledger(path)
+
+    # First run executes and records both steps
+    wf.run("B")
+    assert path.exists()
+    assert {"A", "B"} == set(Ledger(path).entries)
+    entry = Ledger(path).entries["B"]
+    assert {"url", "version", "hash", "time"} <= set(entry)
+
+    # Second run skips both steps
+    caplog.clear()
+    s = wf.run("B")
+    assert 2 == sum(m.startswith("Skip <Step") for m in caplog.messages)
+    assert entry["version"] == s.version
+
+    # Changing the keyword arguments of "B" causes only "B" to run again
+    wf.add_step("B", "A", changes_b, replace=True, value=200.0)
+    caplog.clear()
+    wf.run("B")
+    assert ["Skip <Step changes_a()>"] == [
+        m.split(";")[0] for m in caplog.messages if m.startswith("Skip")
+    ]
+
+    # With skip=False, all steps are run
+    wf.ledger = Ledger(path, skip=False)
+    caplog.clear()
+    wf.run("B")
+    assert not any(m.startswith("Skip") for m in caplog.messages)
@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 import pytest
+from pandas.testing import assert_frame_equal
 
 from message_ix_models.tools.costs import MODULE, Config
 from message_ix_models.tools.costs.decay import (
@@ -125,3 +127,71 @@ def test_project_ref_region_inv_costs_using_reduction_rates(
 
     # The first technology year is equal to or greater than the default first model year
     assert config.y0 <= result.first_technology_year.min()
+
+
+def _decay_loop(df_ref: pd.DataFrame, config: Config) -> pd.DataFrame:
+    """Previous implementation of the decay in
+    :func:`.project_ref_region_inv_costs_using_reduction_rates`, for comparison."""
+    for y in config.seq_years:
+        df_ref = df_ref.assign(
+            ycur=lambda x: np.where(
+                y <= config.base_year,
+                x.reg_cost_base_year,
+                (x.reg_cost_base_year - x.b) * np.exp(x.r * (y - config.base_year))
+                + x.b,
+            )
+        ).rename(columns={"ycur": y})
+
+    id_vars = [
+        "message_technology",
+        "scenario",
+        "reference_region",
+        "first_technology_year",
+    ]
+    return (
+        df_ref[id_vars + list(config.seq_years)]
+        .melt(id_vars=id_vars, var_name="year", value_name="inv_cost_ref_region_decay")
+        .assign(year=lambda x: x.year.astype(int))
+        .drop_duplicates()
+    )
+
+
+@pytest.mark.parametrize("module", list(MODULE))
+def test_project_ref_region_decay(module: MODULE) -> None:
+    config = Config(module=module)
+
+    # Regional differentiation data for all technologies in the module and 2 regions
+    t = get_technology_reduction_scenarios_data(config.y0, module).message_technology
+    rng = np.random.default_rng(seed=0)
+    reg_diff = pd.DataFrame(dict(message_technology=np.repeat(t.unique(), 2))).assign(
+        reg_diff_source="weo",
+        reg_diff_technology="x",
+        region=lambda df: np.tile([config.ref_region, "R12_AFR"], len(df) // 2),
+        base_year_reference_region_cost=lambda df: rng.uniform(100.0, 5e3, len(df)),
+        reg_cost_ratio=1.0,
+        reg_cost_base_year=lambda df: df.base_year_reference_region_cost,
+        fix_ratio=0.05,
+    )
+
+    # Function runs
+    result = project_ref_region_inv_costs_using_reduction_rates(reg_diff, config)
+
+    # Results are the same as from the previous implementation
+    df_ref = (
+        reg_diff.query("region == @config.ref_region")
+        .merge(get_technology_reduction_scenarios_data(config.y0, module))
+        .assign(
+            cost_region_reduc_year=lambda x: (
+                x.reg_cost_base_year - (x.reg_cost_base_year * x.cost_reduction)
+            ),
+            b=lambda x: (1 - config.pre_last_year_rate) * x.cost_region_reduc_year,
+            r=lambda x: (
+                (1 / (config.reduction_year - config.base_year))
+                * np.log(
+                    (x.cost_region_reduc_year - x.b) / (x.reg_cost_base_year - x.b)
+                )
+            ),
+            reference_region=config.ref_region,
+        )
+    )
+    assert_frame_equal(_decay_loop(df_ref, config), result, check_exact=True)
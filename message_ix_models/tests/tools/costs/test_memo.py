@@ -0,0 +1,39 @@
+from message_ix_models.tools.costs import MODULE, Config
+from message_ix_models.tools.costs.memo import Memo, memoize, use
+
+CALLS: list[tuple] = []
+
+
+@memoize("module", "node")
+def func(value: int, config: Config) -> tuple:
+    CALLS.append((value, config.module, config.node))
+    return CALLS[-1]
+
+
+def test_memoize() -> None:
+    CALLS.clear()
+    c1, c2 = Config(), Config(scenario="SSP2")
+    c3 = Config(module=MODULE.materials)
+
+    # Without an active memo, the function is called every time
+    func(1, c1)
+    func(1, c1)
+    assert 2 == len(CALLS)
+
+    with use(Memo()) as memo:
+        # Result is computed once for configs with the same "module" and "node"
+        r1 = func(1, c1)
+        assert r1 is func(1, c2) is func(1, config=c1)
+        assert 3 == len(CALLS)
+
+        # …and again for a config that differs in these fields
+        assert r1 is not func(1, c3)
+        assert 4 == len(CALLS)
+
+        # Time taken is recorded for each stored result
+        assert ["func", "func"] == [name for name, _ in memo.times]
+        assert 2 == len(memo)
+
+    # Memo is no longer active
+    func(1, c1)
+    assert 5 == len(CALLS)
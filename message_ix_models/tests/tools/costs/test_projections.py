@@ -1,11 +1,26 @@
+import logging
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
 import pytest
 from message_ix import make_df
+from numpy.polynomial import Polynomial
+from pandas.testing import assert_frame_equal
 
 from message_ix_models import testing
 from message_ix_models.model.structure import get_codelist
-from message_ix_models.tools.costs import MODULE, Config, create_cost_projections
+from message_ix_models.tools.costs import (
+    MODULE,
+    Config,
+    create_cost_projections,
+    create_cost_projections_batch,
+)
+from message_ix_models.tools.costs.projections import _fit_linear
 from message_ix_models.util import add_par_data
 
+log = logging.getLogger(__name__)
+
 pytestmark = pytest.mark.usefixtures("ssp_user_data")
 
 
@@ -166,3 +181,107 @@ def test_ccs_costs(module: MODULE) -> None:
     if not diff.empty:
         print(diff.to_string())
         assert False, msg
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_create_cost_projections_batch(tmp_path, jobs: int) -> None:
+    configs = [
+        Config(module=module, method=method, scenario="LED")
+        for module in (MODULE.energy, MODULE.materials)
+        for method in ("constant", "convergence")
+    ]
+    # Differs from configs[0] only in a field not among the other BATCH_COLUMNS
+    configs.append(Config(method="constant", ref_region="R12_CHN", scenario="LED"))
+
+    # Function runs without error
+    result = create_cost_projections_batch(configs, jobs=jobs, path=tmp_path)
+
+    # Data are the same as from create_cost_projections() for each config
+    for name in "inv_cost", "fix_cost":
+        exp = []
+        for i, c in enumerate(configs):
+            exp.append(
+                create_cost_projections(c)[name].assign(
+                    config=i, module=c.module.name, node=c.node, method=c.method
+                )
+            )
+        assert_frame_equal(pd.concat(exp, ignore_index=True), result[name])
+
+        # Data for each config can be distinguished
+        assert list(range(len(configs))) == sorted(result[name]["config"].unique())
+
+        # Data were written to file
+        assert len(result[name]) == len(pd.read_parquet(tmp_path.joinpath(name)))
+
+    # Time is reported for each config
+    t = result["time"]
+    assert len(configs) == (t.stage == "create_cost_projections").sum()
+
+    # WEO data are read once, or once per batch (per module and ref_region) with
+    # jobs > 1
+    assert (1 if jobs == 1 else 3) == (t.stage == "get_weo_data").sum()
+
+
+def _fit_polynomial(df: pd.DataFrame, y_predict: list[int]) -> pd.DataFrame:
+    """Previous implementation of :func:`._fit_linear`, for comparison."""
+    y_index = pd.Index(y_predict, name="year")
+
+    def _predict(df: pd.DataFrame) -> pd.DataFrame:
+        p = Polynomial.fit(df.year, df.inv_cost_tmp, deg=1)
+        return pd.DataFrame(
+            {"inv_pre_converge_decay": p(np.array(y_predict))}, index=y_index
+        )
+
+    return (
+        df.groupby(["scenario", "message_technology", "region"], group_keys=True)
+        .apply(_predict, include_groups=False)
+        .reset_index()
+    )
+
+
+@pytest.mark.parametrize(
+    "N_tech",
+    (
+        10,
+        pytest.param(1000, marks=pytest.mark.slow),
+    ),
+)
+def test_fit_linear(N_tech: int) -> None:
+    config = Config()
+    y = [config.base_year, config.convergence_year]
+
+    # Random data for 2 periods and many (scenario, technology, region)
+    rng = np.random.default_rng(seed=0)
+    index = pd.MultiIndex.from_product(
+        [["SSP1", "SSP2", "LED"], [f"t{i}" for i in range(N_tech)], list("ABCD"), y],
+        names=["scenario", "message_technology", "region", "year"],
+    )
+    df = pd.DataFrame(
+        dict(inv_cost_tmp=rng.uniform(100.0, 5000.0, len(index))), index=index
+    ).reset_index()
+
+    # Function runs
+    t0 = perf_counter()
+    result = _fit_linear(
+        df,
+        ["scenario", "message_technology", "region"],
+        "year",
+        "inv_cost_tmp",
+        config.seq_years,
+        "inv_pre_converge_decay",
+    )
+    log.info(f"_fit_linear(): {len(df)} rows in {perf_counter() - t0:.3f} s")
+
+    # Results are the same as from the previous implementation
+    t0 = perf_counter()
+    expected = _fit_polynomial(df, config.seq_years)
+    log.info(f"Previous implementation: {perf_counter() - t0:.3f} s")
+
+    assert_frame_equal(expected, result, rtol=1e-12)
+
+    # Fitted values match the data
+    exp = df.set_index(index.names)["inv_cost_tmp"]
+    obs = result.set_index(index.names)["inv_pre_converge_decay"]
+    assert_frame_equal(
+        exp.to_frame(), obs.loc[exp.index].to_frame(name=exp.name), rtol=1e-12
+    )
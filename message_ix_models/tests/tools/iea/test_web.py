@@ -14,9 +14,12 @@ from message_ix_models.tools.iea.web import (
     TRANSFORM,
     generate_code_lists,
     get_mapping,
+    iea_web_data_for_query,
     load_data,
+    to_parquet,
 )
 from message_ix_models.util import HAS_MESSAGE_DATA
+from message_ix_models.util.cache import Cache
 
 if TYPE_CHECKING:
     from message_ix_models import Context
@@ -168,6 +171,60 @@ def test_load_data(test_context, tmp_path, provider, edition):
     assert (set(DIMS) & {"Value"}) < set(result.columns)
 
 
+def test_to_parquet(caplog, monkeypatch, tmp_path, test_context) -> None:
+    monkeypatch.setattr(test_context.core, "cache_path", tmp_path.joinpath("cache"))
+
+    # A file in the IEA fixed-width format, with a label containing a comma and one
+    # line with too few fields
+    path = tmp_path.joinpath("WBIG1.TXT")
+    path.write_text(
+        """\
+AUSTRALI  HARDCOAL  1971  INDPROD   KTOE      1234.5
+AUSTRALI  HARDCOAL  1971  INDPROD   TJ        51687.1
+AUSTRALI  HARDCOAL  2020  INDPROD   TJ        ..
+AUSTRALI  CRUDEOIL  2020  INDPROD   TJ        x
+AUSTRALI  CRUDE, NGL  2020  INDPROD   TJ        3.0
+AUSTRALI  CRUDEOIL  2020  INDPROD
+WORLD     CRUDEOIL  2020  RESIDENT  TJ        2.0
+"""
+    )
+
+    with caplog.at_level(logging.WARNING):
+        result = to_parquet(path)
+
+    # Dataset is in the cache directory, not beside `path`, and is a cache entry
+    assert test_context.core.cache_path == result.parent
+    assert {"WBIG1.TXT"} == {p.name for p in tmp_path.iterdir()} - {"cache"}
+    entries = Cache().entries()
+    assert [result.name] == entries["name"].tolist()
+    assert "iea_web_parquet" == entries["func"][0] and 0 < entries["size"][0]
+
+    # The line with too few fields is skipped and counted
+    assert "Skipped 1 line(s) without 6 fields" in caplog.messages
+
+    # Dataset is partitioned by MEASURE and TIME
+    assert {"MEASURE=KTOE", "MEASURE=TJ"} == {p.name for p in result.iterdir()}
+    assert {"TIME=1971", "TIME=2020"} == {
+        p.name for p in result.joinpath("MEASURE=TJ").iterdir()
+    }
+
+    # Existing dataset is reused
+    mtime = [p.stat().st_mtime for p in result.rglob("*.parquet")]
+    assert result == to_parquet(path)
+    assert mtime == [p.stat().st_mtime for p in result.rglob("*.parquet")]
+    assert 1 == Cache().entries()["hits"][0]
+
+    # Data can be read; only data with MEASURE "TJ" and matching `filters`
+    df = iea_web_data_for_query(
+        tmp_path, "WBIG1.TXT", query_expr="TIME > 0", filters=dict(FLOW=["INDPROD"])
+    )
+    assert DIMS + ["Value"] == list(df.columns)
+    # NA values are dropped
+    assert {"CRUDE, NGL": 3.0, "HARDCOAL": 51687.1} == dict(
+        zip(df["PRODUCT"], df["Value"])
+    )
+
+
 @pytest.mark.usefixtures("iea_eweb_test_data")
 @pytest.mark.parametrize("provider, edition", PROVIDER_EDITION)
 def test_generate_code_lists(tmp_path, provider, edition):
@@ -4,7 +4,14 @@ from typing import TYPE_CHECKING
 import pytest
 from genno import Computer
 
-from message_ix_models.tools.cepii import BACI
+from message_ix_models.tools.cepii import (
+    BACI,
+    LABELS,
+    baci_data_from_files,
+    baci_dataset,
+)
+from message_ix_models.util import path_fallback
+from message_ix_models.util.cache import Cache
 
 if TYPE_CHECKING:
     from message_ix_models import Context
@@ -66,3 +73,33 @@ class TestBACI:
         # Data have the expected dimensions and size
         assert {"t", "i", "j", "k"} == set(result.dims)
         assert size == result.size
+
+
+def test_baci_dataset(monkeypatch, tmp_path, test_context: "Context") -> None:
+    monkeypatch.setattr(test_context.core, "cache_path", tmp_path)
+    paths = sorted(path_fallback("cepii-baci", where="test").glob("*.csv"))
+
+    result = baci_dataset(paths)
+
+    # Dataset is partitioned by year, then by HS chapter
+    assert {"t=1995", "t=1996"} < {p.name for p in result.iterdir()}
+    chapters = result.joinpath("t=1995").iterdir()
+    assert all(p.name.startswith("chapter=") for p in chapters)
+
+    # Distinct labels are stored
+    assert result.joinpath(LABELS).exists()
+
+    # Dataset is a cache entry
+    entries = Cache().entries()
+    assert [result.name] == entries["name"].tolist()
+    assert "baci_parquet" == entries["func"][0] and 0 < entries["size"][0]
+
+    # Existing dataset is reused
+    assert result == baci_dataset(paths)
+    assert 1 == Cache().entries()["hits"][0]
+
+    # Filters select data; "k" labels are stored as integers
+    df = baci_data_from_files(paths, "value", dict(t="199[56]", k="27.*"))
+    assert {1995, 1996} >= set(df["t"].unique())
+    assert df["k"].astype(str).str.fullmatch("27.*").all()
+    assert ["t", "i", "j", "k", "v"] == list(df.columns)
@@ -1,5 +1,18 @@
+import os
+import tarfile
+
+import pandas as pd
+import pytest
+from genno.testing import assert_qty_equal
+
 from message_ix_models.project.advance.data import LOCATION, NAME
-from message_ix_models.tools.iamc import describe
+from message_ix_models.tools.iamc import (
+    _filter,
+    _sidecar,
+    describe,
+    iamc_like_data_for_query,
+    to_quantity,
+)
 from message_ix_models.tools.iamc.structure import CL_SCENARIO_DIAGNOSTIC
 from message_ix_models.util import MESSAGE_MODELS_PATH, package_data_path
 
@@ -24,10 +37,6 @@ class TestCL_SCENARIO_DIAGNOSTIC:
 
 
 def test_describe(test_context):
-    import tarfile
-
-    import pandas as pd
-
     path = package_data_path("test", *LOCATION)
     with tarfile.open(path, "r:*") as tf:
         data = pd.read_csv(tf.extractfile(NAME), engine="pyarrow").rename(
@@ -52,3 +61,54 @@ def test_describe(test_context):
     # from message_ix_models.util.sdmx import write
 
     # write(sm, basename="ADVANCE")
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    (
+        (None, None),
+        ("True", None),
+        ("Model != ''", None),
+        ("VARIABLE == 'foo'", "is_in(VARIABLE"),
+        ("'foo' == VARIABLE and UNIT > 'a'", "is_in(VARIABLE"),
+        ("VARIABLE == 'foo' or UNIT > 'a'", None),
+        ("VARIABLE == 'foo' or UNIT == 'kg'", "(is_in(VARIABLE"),
+        ("(False or (SCENARIO in ['a', 'b']))", "(false or is_in(SCENARIO"),
+        ("VARIABLE == @foo", None),
+        ("NOT_A_COLUMN == 'foo'", None),
+    ),
+)
+def test_filter(query, expected) -> None:
+    result = _filter(query, ["MODEL", "SCENARIO", "VARIABLE", "UNIT"])
+    if expected is None:
+        assert result is None
+    else:
+        assert str(result).startswith(expected)
+
+
+def test_iamc_like_data_for_query(test_context, tmp_path) -> None:
+    # Copy the ADVANCE test data to a temporary file
+    path = tmp_path.joinpath(NAME)
+    with tarfile.open(package_data_path("test", *LOCATION), "r:*") as tf:
+        member = tf.extractfile(NAME)
+        assert member is not None
+        path.write_bytes(member.read())
+    data = pd.read_csv(path, engine="pyarrow")
+
+    # Query for one time series
+    m, s, v = data.iloc[0][["MODEL", "SCENARIO", "VARIABLE"]]
+    query = f"MODEL == {m!r} and SCENARIO == {s!r} and VARIABLE == {v!r}"
+
+    sidecar = _sidecar(path, None)
+
+    # Function runs; result is the same as from the full data
+    result = iamc_like_data_for_query(path, query, non_iso_3166="keep")
+    assert_qty_equal(to_quantity(data, query=query, non_iso_3166="keep"), result)
+
+    # The same sidecar file is used for a different query
+    assert sidecar == _sidecar(path, None)
+
+    # Modifying the file gives a new sidecar file
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert sidecar != _sidecar(path, None)
@@ -1,14 +1,24 @@
+import json
 import logging
+import os
+import subprocess
+import sys
 from copy import deepcopy
+from time import perf_counter, time
 
+import numpy as np
+import pandas as pd
 import pytest
 import sdmx.model.v21 as sdmx_model
 import xarray as xr
-from genno.caching import hash_args
+from genno import Quantity
+from genno.caching import hash_args, hash_code
 from ixmp.testing import assert_logs
 
 from message_ix_models import ScenarioInfo
 from message_ix_models.util import cache, cached
+from message_ix_models.util.cache import INDEX, STATS, Cache
+from message_ix_models.util.config import parse_size
 
 log = logging.getLogger(__name__)
 
@@ -23,6 +33,94 @@ class TestEncoder:
         expected = "40a0735385448dcbe745904ebfec7255995ca451"
         assert expected == hash_args(codes0, bar="baz") == hash_args(codes1, bar="baz")
 
+    @staticmethod
+    def _quantity(N: int, units: str = "kg") -> Quantity:
+        """Return a Quantity with about `N` random values on 3 dimensions."""
+        n = round(N ** (1 / 3))
+        index = pd.MultiIndex.from_product(
+            [[f"n{i}" for i in range(n)], [f"t{i}" for i in range(n)], range(n)],
+            names=["n", "t", "y"],
+        )
+        values = np.random.default_rng(seed=0).random(len(index))
+        return Quantity(pd.Series(values, index=index), name="foo", units=units)
+
+    def test_quantity(self) -> None:
+        q = self._quantity(1000)
+        key = hash_args(q)
+
+        # Same data, separately constructed, gives the same key
+        assert key == hash_args(self._quantity(1000))
+
+        # Different values, labels, units, or name give different keys
+        q1 = q.copy()
+        q1.iloc[-1] += 1.0
+        assert key != hash_args(q1)
+        s = pd.Series(q.to_series()).rename(index={"t9": "t10"}, level="t")
+        assert key != hash_args(Quantity(s, name="foo", units="kg"))
+        assert key != hash_args(self._quantity(1000, units="t"))
+        assert key != hash_args(Quantity(q, name="bar"))
+
+        # The key is the same in another Python process, with a different seed for the
+        # built-in hash()
+        code = (
+            "from genno.caching import hash_args;"
+            "import message_ix_models.util.cache;"
+            "from message_ix_models.tests.util.test_cache import TestEncoder;"
+            "print(hash_args(TestEncoder._quantity(1000)))"
+        )
+        env = os.environ | dict(PYTHONHASHSEED="12345")
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, env=env, text=True
+        )
+        assert key == result.stdout.strip()
+
+    def test_pandas(self) -> None:
+        df = pd.DataFrame(dict(a=[1, 2], b=["x", "y"]))
+        key = hash_args(df)
+
+        assert key == hash_args(df.copy())
+        assert key != hash_args(df.assign(b=["x", "z"]))
+        assert key != hash_args(df.set_index("a"))
+        assert key != hash_args(df["a"])
+
+        # MultiIndex: a subset hashes the same as the same data constructed directly,
+        # though its levels contain unused labels
+        s = df.assign(c=[3, 4]).set_index(["a", "b"])["c"]
+        assert hash_args(s.iloc[:1]) == hash_args(s.iloc[:1].copy())
+        expected = pd.Series(
+            [3], index=pd.MultiIndex.from_tuples([(1, "x")], names=["a", "b"]), name="c"
+        )
+        assert hash_args(expected) == hash_args(s.iloc[:1])
+
+    @pytest.mark.parametrize(
+        "N",
+        (
+            10**4,
+            10**5,
+            pytest.param(10**6, marks=pytest.mark.slow),
+            pytest.param(10**7, marks=pytest.mark.slow),
+        ),
+    )
+    def test_quantity_benchmark(self, N: int) -> None:
+        q = self._quantity(N)
+
+        t0 = perf_counter()
+        hash_args(q)
+        t = perf_counter() - t0
+        log.info(f"Hash {len(q)} values in {t:.3f} s")
+
+        if N > 10**5:
+            return  # Previous method is too slow to compare; only log
+
+        # Previous method: one Python tuple per label, encoded to JSON
+        t0 = perf_counter()
+        hash_args(tuple(q.to_series().to_dict()))
+        t_previous = perf_counter() - t0
+        log.info(f"Previous method: {t_previous:.3f} s")
+
+        # Faster than the previous method on the same machine; typically 30–50 times
+        assert 2 * t < t_previous
+
 
 def test_cache_skip(test_context) -> None:
     """:attr:`.Config.cache_skip` updates :data:`.cache.COMPUTER`."""
@@ -123,3 +221,185 @@ def test_cached(caplog, test_context, tmp_path) -> None:
 
     with pytest.raises(TypeError, match="Object of type Foo is not JSON serializable"):
         func1(arg=Foo())
+
+
+@pytest.fixture
+def cache_path(test_context, tmp_path):
+    pre = test_context.core.cache_path
+    test_context.core.cache_path = tmp_path.joinpath("cache")
+    test_context.core.cache_path.mkdir(parents=True, exist_ok=True)
+    try:
+        yield test_context.core.cache_path
+    finally:
+        test_context.core.cache_path = pre
+
+
+def test_cached_stats(cache_path) -> None:
+    @cached
+    def func2(x):
+        return x
+
+    for _ in range(3):
+        func2(1)
+    func2(2)
+
+    # Statistics are recorded
+    assert 2 == STATS["func2"].hits
+    assert 2 == STATS["func2"].misses
+    assert 0 < STATS["func2"].bytes_read
+
+    # Cache entries are listed
+    entries = Cache().entries()
+    assert 2 == len(entries)
+    assert {"func2"} == set(entries["func"])
+    assert 2 == entries["hits"].sum()
+
+
+def test_cached_parquet(cache_path) -> None:
+    pytest.importorskip("pyarrow")
+
+    def func3():
+        return pd.DataFrame(dict(a=[1, 2], b=["x", "y"]))
+
+    df0 = cached(func3)()
+    df1 = cached(func3)()  # Loaded from the cache
+    pd.testing.assert_frame_equal(df0, df1)
+
+    # Stored as Parquet, with the same name as genno.caching.decorate() gives
+    key = hash_args(hash_code(func3))
+    assert [f"func3-{key}.parquet"] == Cache().entries()["name"].tolist()
+
+
+def test_record(cache_path) -> None:
+    c = Cache()
+    a, b = (f"func-{x * 40}.pickle" for x in "ab")
+    for name in a, b:
+        cache_path.joinpath(name).touch()
+
+    # A new file is written to the index at once
+    c.record(a, compute_time=2.0)
+    expected = {a: dict(compute_time=2.0, hits=0, time_saved=0.0)}
+    assert expected == c._read_index()
+
+    # Hits are not written until flushed
+    assert 1.5 == c.record(a, load_time=0.5)
+    assert expected == c._read_index()
+    c.flush()
+    assert {a: dict(compute_time=2.0, hits=1, time_saved=1.5)} == c._read_index()
+
+    # Uses written by another process are kept
+    index = c._read_index()
+    index[b] = dict(compute_time=1.0, hits=0, time_saved=0.0)
+    cache_path.joinpath(INDEX).write_text(json.dumps(index))
+    c.record(a, load_time=1.0)
+    c.flush()
+    index = c._read_index()
+    assert 2 == index[a]["hits"] and 1.0 == index[b]["compute_time"]
+
+    # Rewriting a file resets its entry
+    c.record(a, compute_time=3.0)
+    assert dict(compute_time=3.0, hits=0, time_saved=0.0) == c._read_index()[a]
+
+    # Entries for files that no longer exist are discarded on pruning
+    cache_path.joinpath(b).unlink()
+    assert [] == c.prune()
+    assert {a} == set(c._read_index())
+
+
+def test_prune(cache_path) -> None:
+    @cached
+    def func4(x):
+        return "x" * 1000
+
+    for i in range(4):
+        func4(i)
+        # Mark each entry as used 1 day earlier than the next
+        path = Cache().entries()["name"].iloc[-1]
+        t = time() - (4 - i) * 86400
+        os.utime(cache_path.joinpath(path), (t, t))
+
+    c = Cache()
+    size = c.entries()["size"].iloc[0]
+
+    # Dry run: nothing removed
+    assert 2 == len(c.prune(max_age=2.5, dry_run=True))
+    assert 4 == len(c.entries())
+
+    # Removes the 2 least recently used
+    removed = c.prune(max_size=2 * size)
+    assert 2 == len(removed) and 2 == len(c.entries())
+    assert not any(p.exists() for p in removed)
+
+    # Removes entries not used in the last 1.5 days
+    assert 1 == len(c.prune(max_age=1.5))
+
+
+def test_write_dir(cache_path) -> None:
+    c = Cache()
+    a, b = (f"func-{x * 40}.parquet" for x in "ab")
+
+    # Contents are written to a temporary directory, then renamed
+    with c.write_dir(a) as tmp:
+        assert tmp.parent == cache_path and not cache_path.joinpath(a).exists()
+        tmp.joinpath("data").write_bytes(b"x" * 1000)
+
+    # The directory is a cache entry, with the total size of its files
+    entries = c.entries()
+    assert [a] == entries["name"].tolist() and 1000 == entries["size"][0]
+    assert "compute_time" in c._read_index()[a]
+
+    # A directory written meanwhile by another process is kept
+    with c.write_dir(a) as tmp:
+        tmp.joinpath("other").touch()
+    assert {"data"} == {p.name for p in cache_path.joinpath(a).iterdir()}
+
+    # On error, nothing is written
+    with pytest.raises(RuntimeError), c.write_dir(b):
+        raise RuntimeError
+    assert {a, INDEX} == {p.name for p in cache_path.iterdir()}
+
+    # Directories are pruned
+    assert [cache_path.joinpath(a)] == c.prune(max_size=0)
+    assert {INDEX} == {p.name for p in cache_path.iterdir()}
+
+
+@pytest.mark.parametrize(
+    "value, expected", (("500", 500), ("2k", 2048), ("1.5 GB", 1.5 * 2**30), (3, 3))
+)
+def test_parse_size(value, expected) -> None:
+    assert expected == parse_size(value)
+
+
+@cached
+def func6(x, y="a"):
+    return [x, y]
+
+
+def test_cli(monkeypatch, cache_path, mix_models_cli) -> None:
+    # Context created by the CLI uses the same cache path
+    monkeypatch.setenv("MESSAGE_MODELS_CACHE", str(cache_path))
+
+    @cached
+    def func5():
+        return 1
+
+    func5()
+
+    result = mix_models_cli.assert_exit_0(["cache", "list"])
+    assert "func5" in result.output
+
+    # --max-age=0 is not ignored
+    args = ["cache", "prune", "--max-age=0", "--dry-run"]
+    result = mix_models_cli.assert_exit_0(args)
+    assert "func5-" in result.output
+
+    result = mix_models_cli.assert_exit_0(["cache", "prune", "--max-size=0"])
+    assert "func5-" in result.output
+    assert 0 == len(Cache().entries())
+
+    # Cache is populated for a function and arguments
+    args = ["cache", "warm", f"{__name__}.func6", "x=[1, 2]", "y=foo"]
+    mix_models_cli.assert_exit_0(args)
+    assert 1 == STATS["func6"].misses
+    assert [[1, 2], "foo"] == func6(x=[1, 2], y="foo")
+    assert 1 == STATS["func6"].hits
@@ -0,0 +1,60 @@
+import json
+
+import pandas as pd
+import pytest
+
+from message_ix_models.util import pycountry
+from message_ix_models.util.pycountry import (
+    MEMO,
+    iso_3166_alpha_3,
+    to_iso_3166_alpha_3,
+)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    (
+        ("Austria", "AUT"),
+        ("Korea", "KOR"),
+        ("R12_AFR", None),
+    ),
+)
+def test_iso_3166_alpha_3(name, expected) -> None:
+    assert expected == iso_3166_alpha_3(name)
+
+
+@pytest.mark.parametrize("missing", ("discard", "keep"))
+def test_to_iso_3166_alpha_3(monkeypatch, test_context, missing) -> None:
+    # Start with an empty memo
+    monkeypatch.setattr(pycountry, "_memo", {})
+    path = test_context.core.cache_path.joinpath(MEMO)
+    path.unlink(missing_ok=True)
+
+    values = pd.Series(
+        ["Austria", "R12_AFR", "Korea", None, "Austria", "Russia"],
+        index=list("abcdef"),
+        name="REGION",
+    )
+
+    result = to_iso_3166_alpha_3(values, missing=missing)
+
+    # Same result as applying the scalar function to each value
+    expected = values.apply(
+        lambda v: v and (iso_3166_alpha_3(v) or (v if missing == "keep" else None))
+    )
+    pd.testing.assert_series_equal(expected, result)
+
+    # Results of lookups are stored on disk, keyed by standard name
+    names = json.loads(path.read_text())["names"]
+    assert {"Austria", "R12_AFR", "Korea, Republic of", "Russian Federation"} == set(
+        names
+    )
+    assert names["R12_AFR"] is None
+
+    # The memo is used in a new process / after clearing the in-memory memo
+    monkeypatch.setattr(pycountry, "_memo", {})
+    names["Austria"] = "FOO"
+    path.write_text(json.dumps(dict(json.loads(path.read_text()), names=names)))
+    assert "FOO" == to_iso_3166_alpha_3(values).iloc[0]
+
+    path.unlink()
@@ -17,6 +17,8 @@ from message_ix_models.model.structure import get_codes, process_technology_code
 from message_ix_models.util import as_codes
 from message_ix_models.util._dataclasses import asdict as asdict_backport
 
+log = logging.getLogger(__name__)
+
 
 class TestScenarioInfo:
     @pytest.fixture(scope="class")
@@ -173,6 +175,33 @@ class TestScenarioInfo:
         assert 1963 == info.y0
         assert [1963, 1964, 1965] == info.Y
 
+    def test_snapshot(self, monkeypatch, test_context) -> None:
+        """ScenarioInfo initialized from a snapshot of an existing Scenario."""
+        mp = test_context.get_platform()
+        scenario = make_dantzig(mp, multi_year=True)
+
+        # First call reads from the scenario and stores a snapshot
+        info0 = ScenarioInfo(scenario, snapshot=True)
+
+        # Second call does not retrieve any set contents
+        def _fail(*args, **kwargs):
+            raise AssertionError("Scenario.set() called")
+
+        monkeypatch.setattr(scenario, "set", _fail)
+        info1 = ScenarioInfo(scenario, snapshot=True)
+
+        # Results are identical
+        assert dict(info0) == dict(info1)
+        assert info0.set.keys() == info1.set.keys() and info0.N == info1.N
+        for name, value in info0.set.items():
+            if isinstance(value, pd.DataFrame):  # ≥2-D set
+                assert_frame_equal(value, info1.set[name])
+            else:
+                assert value == info1.set[name]
+        assert info0.y0 == info1.y0 and info0.Y == info1.Y
+        assert_frame_equal(info0.yv_ya, info1.yv_ya)
+        assert_frame_equal(info0.par["duration_period"], info1.par["duration_period"])
+
     def test_from_url(self):
         si = ScenarioInfo.from_url("m/s#123")
         assert "m" == si.model
@@ -210,6 +239,56 @@ class TestScenarioInfo:
             si1.update(si0)
         assert "demand" not in si1.par
 
+    def test_update_unhashable(self) -> None:
+        si0 = ScenarioInfo()
+        si0.set["foo"] = ["a", ["b", "c"], Code(id="d")]
+        si1 = ScenarioInfo()
+        si1.set["foo"] = ["d", ["b", "c"], "e", "e", ["f"]]
+
+        si0.update(si1)
+
+        # Duplicates in either `si0` or `si1` are not added; order is preserved
+        assert ["a", ["b", "c"], "d", "e", ["f"]] == si0.set["foo"]
+
+    def test_update_benchmark(self) -> None:
+        """:meth:`.update` and :meth:`.Spec.merge` scale linearly with set size.
+
+        With N = 10⁴–10⁵, the size of sets like ``technology`` and ``relation`` in
+        merged specs for full, R12 models is approximated.
+        """
+        from time import perf_counter
+
+        def merge_time(N: int) -> float:
+            # Two specs with N codes in each of 4 sets, half of which overlap
+            specs = []
+            for offset in (0, N // 2):
+                s = Spec()
+                for name in "commodity", "relation", "technology":
+                    s.add.set[name] = [
+                        Code(id=f"{name} {offset + i}") for i in range(N)
+                    ]
+                s.add.set["node"] = [f"R12_{i}" for i in range(12)]
+                specs.append(s)
+
+            # Shortest of several repetitions, to reduce the effect of other load
+            times = []
+            for _ in range(3):
+                t0 = perf_counter()
+                result = Spec.merge(*specs)
+                times.append(perf_counter() - t0)
+            log.info(f"Merge 2 × {N} codes in {min(times):.3f} s")
+
+            for name in "commodity", "relation", "technology":
+                assert 3 * N // 2 == len(result.add.set[name])
+            assert 12 == len(result.add.set["node"])
+
+            return min(times)
+
+        # Time scales linearly, not quadratically, with N: 8 × the codes take about 8
+        # × as long, not 64 ×. The bound allows for timing noise.
+        N = 1000
+        assert merge_time(8 * N) / merge_time(N) < 24
+
     @pytest.mark.parametrize(
         "codelist, y0, N_all, N_Y, y_m1, dp_checks",
         [
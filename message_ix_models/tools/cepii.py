@@ -3,7 +3,10 @@
 CEPII is the “Centre d’études prospectives et d’informations internationales” (fr).
 """
 
+import json
 import logging
+import os
+import re
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -12,13 +15,14 @@ import genno
 import numpy as np
 
 from message_ix_models.tools.exo_data import BaseOptions, ExoDataSource, register_source
-from message_ix_models.util import MappingAdapter, cached, path_fallback, silence_log
+from message_ix_models.util import MappingAdapter, cached, path_fallback
 from message_ix_models.util.pooch import SOURCE, fetch
 
 if TYPE_CHECKING:
     from pathlib import Path
     from re import Pattern
 
+    import pyarrow.dataset
     from genno.types import AnyQuantity, Key
     from pandas import DataFrame
 
@@ -142,9 +146,12 @@ class BACI(ExoDataSource):
            subdirectory of the cache directory. The extracted size is about 7.9 GiB,
            containing about 2.6 × 10⁸ observations.
         3. Call :func:`.baci_data_from_files` to read the data files and apply
-           :attr:`.Options.measure` and :attr:`.Options.filter_pattern`. The function is
-           decorated with :func:`.cached`, so identical parameters and file paths result
-           in a cache hit.
+           :attr:`.Options.measure` and :attr:`.Options.filter_pattern`. On first use,
+           this converts the data files to a Parquet dataset using
+           :func:`.baci_dataset`; later calls with any parameters read only the parts
+           of the dataset that match. The function is also decorated with
+           :func:`.cached`, so identical parameters and file paths result in a cache
+           hit.
         4. Convert to :class:`genno.Quantity` and return.
         """
 
@@ -177,32 +184,157 @@ class BACI(ExoDataSource):
         return base_key[0]
 
 
+#: Name of the file in each dataset written by :func:`baci_dataset` that lists the
+#: distinct labels on each dimension. The leading underscore means that
+#: :mod:`pyarrow.dataset` does not read it as part of the data.
+LABELS = "_labels.json"
+
+
+def _partitioning() -> "pyarrow.dataset.Partitioning":
+    """Partitioning of the datasets written by :func:`baci_dataset`.
+
+    The data are partitioned by year (:math:`t`) and by HS chapter: the first two of
+    the 6 digits of the product code (:math:`k`).
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(
+        pa.schema([("t", pa.uint16()), ("chapter", pa.uint8())]), flavor="hive"
+    )
+
+
+def baci_dataset(paths: list["Path"]) -> "Path":
+    """Convert the :class:`.BACI` data files at `paths` to a Parquet dataset.
+
+    The dataset is a directory in :attr:`.Config.cache_path` named like
+    :file:`baci_parquet-{hash}.parquet`, where `hash` is computed from the names,
+    modification times, and sizes of `paths`. If it already exists, it is not converted
+    again. It is listed and pruned by :class:`.Cache` like other cache entries. The
+    dataset:
+
+    - is partitioned according to :func:`_partitioning`.
+    - has columns for the dimensions with the integer types from :data:`DTYPE`, plus
+      the measures "v" and "q".
+    - contains a file :data:`LABELS` with the distinct labels on each dimension.
+
+    The files are read incrementally, so that memory use does not depend on their
+    size.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the dataset directory.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv
+    import pyarrow.dataset as ds
+    from genno.caching import hash_args
+
+    from message_ix_models.util.cache import COMPUTER, Cache
+
+    paths = sorted(paths)
+    key = hash_args([(str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in paths])
+    cache = Cache(COMPUTER.graph["config"]["cache_path"])
+    result = cache.path.joinpath(f"baci_parquet-{key}.parquet")
+    if result.exists():
+        os.utime(result)  # Mark as recently used
+        cache.record(result.name, load_time=0.0)
+        return result
+
+    log.info(f"Convert {len(paths)} BACI data files to {result}")
+
+    # Types of the dimensions; the measures are read as str, see below
+    dims = [(d, pa.from_numpy_dtype(t)) for d, t in DTYPE.items()]
+    column_types = dict(dims + [("v", pa.string()), ("q", pa.string())])
+    schema = pa.schema(
+        dims + [("v", pa.float64()), ("q", pa.float64()), ("chapter", pa.uint8())]
+    )
+
+    labels: dict[str, set] = {d: set() for d in DTYPE}
+
+    def batches():
+        for path in paths:
+            reader = pyarrow.csv.open_csv(
+                path,
+                read_options=pyarrow.csv.ReadOptions(block_size=2**24),
+                convert_options=pyarrow.csv.ConvertOptions(
+                    column_types=column_types, include_columns=list(column_types)
+                ),
+            )
+            for batch in reader:
+                columns = {name: batch.column(name) for name in batch.schema.names}
+                for d in DTYPE:
+                    labels[d].update(pc.unique(columns[d]).to_pylist())
+                # Missing values appear as "NA", with or without padding
+                for m in "vq":
+                    value = pc.utf8_trim_whitespace(columns[m])
+                    columns[m] = pc.cast(
+                        pc.if_else(
+                            pc.is_in(value, value_set=pa.array(["", "NA"])),
+                            pa.scalar(None, pa.string()),
+                            value,
+                        ),
+                        pa.float64(),
+                    )
+                columns["chapter"] = pc.cast(
+                    pc.divide(columns["k"], pa.scalar(10_000, pa.uint32())), pa.uint8()
+                )
+                yield pa.RecordBatch.from_arrays(list(columns.values()), schema=schema)
+
+    with cache.write_dir(result.name) as tmp:
+        ds.write_dataset(
+            batches(),
+            tmp,
+            schema=schema,
+            format="parquet",
+            partitioning=_partitioning(),
+            max_rows_per_group=2**17,
+            max_open_files=2**10,
+        )
+        tmp.joinpath(LABELS).write_text(
+            json.dumps({d: sorted(v) for d, v in labels.items()})
+        )
+
+    return result
+
+
 @cached
 def baci_data_from_files(
     paths: list["Path"], measure: str, filters: dict[str, "str | Pattern"]
 ) -> "DataFrame":
     """Read the :class:`.BACI` data from files.
 
-    :func:`dask.dataframe.read_csv` and pyarrow are used for better performance.
-    :data:`DTYPE` is used to specify columns and dtypes.
+    The files are first converted using :func:`baci_dataset`. Then, for each dimension
+    in `filters`, the regular expression is matched against the distinct labels on
+    that dimension, and only rows with matching labels are read. Filters on the year
+    (:math:`t`) and product (:math:`k`) dimensions also select partitions of the
+    dataset, so that only the files for the matching years and HS chapters are read.
     """
-    import dask.dataframe as dd
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+
+    path = baci_dataset(paths)
+    labels = json.loads(path.joinpath(LABELS).read_text())
+
+    # Filter expression
+    expr = None
+    for dim, pattern in filters.items():
+        matched = [v for v in labels[dim] if re.fullmatch(pattern, str(v))]
+        e = pc.field(dim).isin(matched)
+        if dim == "k":
+            # HS chapters of the matching products
+            e &= pc.field("chapter").isin(sorted({v // 10_000 for v in matched}))
+        expr = e if expr is None else (expr & e)
 
     col = measure[0]  # First character of the measure ID -> "v" or "q" column name
 
-    with silence_log("fsspec.local"):
-        ddf = dd.read_csv(
-            paths,
-            engine="pyarrow",
-            dtype=DTYPE | {col: float},
-            usecols=list(BACI.Options.dims) + [col],
-        )
-
-        # Apply filters for each dimension before/during compute()
-        for dim, expr in filters.items():
-            ddf = ddf[ddf[dim].astype(str).str.fullmatch(expr)]
-
-        result = ddf.compute()
+    result = (
+        ds.dataset(path, format="parquet", partitioning=_partitioning())
+        .to_table(columns=list(BACI.Options.dims) + [col], filter=expr)
+        .to_pandas()
+    )
 
     log.info(f"{len(result)} observations")
     return result
@@ -1,8 +1,9 @@
 from .config import MODULE, Config
-from .projections import create_cost_projections
+from .projections import create_cost_projections, create_cost_projections_batch
 
 __all__ = [
     "MODULE",
     "Config",
     "create_cost_projections",
+    "create_cost_projections_batch",
 ]
@@ -6,6 +6,7 @@ import pandas as pd
 from message_ix_models.util import package_data_path
 
 from .config import MODULE, Config
+from .memo import memoize
 from .regional_differentiation import get_raw_technology_mapping, subset_module_map
 
 
@@ -355,6 +356,16 @@ def get_technology_reduction_scenarios_data(
     return df
 
 
+@memoize(
+    "base_year",
+    "final_model_year",
+    "module",
+    "node",
+    "pre_last_year_rate",
+    "reduction_year",
+    "ref_region",
+    "y0",
+)
 def project_ref_region_inv_costs_using_reduction_rates(
     regional_diff_df: pd.DataFrame, config: Config
 ) -> pd.DataFrame:
@@ -412,44 +423,33 @@ def project_ref_region_inv_costs_using_reduction_rates(
         )
     )
 
-    for y in config.seq_years:
-        df_ref = df_ref.assign(
-            ycur=lambda x: np.where(
-                y <= config.base_year,
-                x.reg_cost_base_year,
-                (x.reg_cost_base_year - x.b) * np.exp(x.r * (y - config.base_year))
-                + x.b,
-            )
-        ).rename(columns={"ycur": y})
+    # Decay of costs for all rows (axis 0) and periods (axis 1) at once
+    years = np.array(config.seq_years)
+    base, b, r = (
+        df_ref[c].to_numpy()[:, None] for c in ("reg_cost_base_year", "b", "r")
+    )
+    value = np.where(
+        years <= config.base_year,
+        base,
+        (base - b) * np.exp(r * (years - config.base_year)) + b,
+    )
 
+    # Convert to long format, with all rows for the first period, then the next, etc.
+    id_vars = [
+        "message_technology",
+        "scenario",
+        "reference_region",
+        "first_technology_year",
+    ]
     df_inv_ref = (
-        df_ref.drop(
-            columns=[
-                "b",
-                "r",
-                "reg_diff_source",
-                "reg_diff_technology",
-                "region",
-                "base_year_reference_region_cost",
-                "reg_cost_ratio",
-                "reg_cost_base_year",
-                "fix_ratio",
-                "reduction_rate",
-                "cost_reduction",
-                "cost_region_reduc_year",
-            ]
-        )
-        .melt(
-            id_vars=[
-                "message_technology",
-                "scenario",
-                "reference_region",
-                "first_technology_year",
-            ],
-            var_name="year",
-            value_name="inv_cost_ref_region_decay",
+        df_ref[id_vars]
+        .iloc[np.tile(np.arange(len(df_ref)), len(years))]
+        .reset_index(drop=True)
+        .assign(
+            year=np.repeat(years, len(df_ref)),
+            inv_cost_ref_region_decay=value.ravel(order="F"),
         )
-        .assign(year=lambda x: x.year.astype(int))
-    ).drop_duplicates()
+        .drop_duplicates()
+    )
 
     return df_inv_ref
@@ -8,10 +8,12 @@ import pandas as pd
 from message_ix_models import Context
 
 from .config import Config
+from .memo import memoize
 
 log = logging.getLogger(__name__)
 
 
+@memoize("node", "ref_region")
 def process_raw_ssp_data(context: Context, config: Config) -> pd.DataFrame:
     """Retrieve SSP data as required for :mod:`.tools.costs`.
 
@@ -125,6 +127,15 @@ def process_raw_ssp_data(context: Context, config: Config) -> pd.DataFrame:
     return result
 
 
+@memoize(
+    "base_year",
+    "module",
+    "node",
+    "ref_region",
+    "scenario",
+    "scenario_version",
+    "y0",
+)
 def adjust_cost_ratios_with_gdp(
     region_diff_df: "pd.DataFrame", config: Config
 ) -> "pd.DataFrame":
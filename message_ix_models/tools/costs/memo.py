@@ -0,0 +1,83 @@
+"""In-memory memo of intermediate results for :func:`.create_cost_projections_batch`.
+
+Functions decorated with :func:`memoize` behave as usual, unless a :class:`Memo` is
+active. Then, each result is computed once and stored in the memo; later calls with the
+same key return the stored result.
+"""
+
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Memo(dict):
+    """Store of intermediate results.
+
+    Keys are tuples of the function name and values of the :class:`.Config` fields given
+    to :func:`memoize`.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        #: Time taken to compute each stored result: a list of 2-tuples of (function
+        #: name, time in seconds), in the order the results were computed.
+        self.times: list[tuple[str, float]] = []
+
+
+#: The active :class:`Memo`, if any. See :func:`use`.
+_MEMO: Memo | None = None
+
+
+@contextmanager
+def use(memo: Memo) -> Iterator[Memo]:
+    """Context manager: make `memo` active within the ``with`` block."""
+    global _MEMO
+
+    prior, _MEMO = _MEMO, memo
+    try:
+        yield memo
+    finally:
+        _MEMO = prior
+
+
+def memoize(*fields: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator: store results of a function in the active :class:`Memo`, if any.
+
+    If `fields` are given, the decorated function must take a :class:`.Config` as its
+    `config` argument or last positional argument. Results are stored using the values
+    of these fields as a key, so the fields must determine the result completely,
+    including via any other arguments.
+
+    Stored results are returned to every caller, so must not be modified in place.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            if _MEMO is None:
+                return func(*args, **kwargs)
+
+            config = kwargs.get("config", args[-1] if args else None)
+            key = (func.__name__,) + tuple(getattr(config, f) for f in fields)
+            try:
+                return _MEMO[key]
+            except KeyError:
+                pass
+
+            t0 = perf_counter()
+            result = _MEMO[key] = func(*args, **kwargs)
+            _MEMO.times.append((func.__name__, perf_counter() - t0))
+            log.debug(f"Store {key!r}")
+            return result
+
+        return wrapper
+
+    return decorator
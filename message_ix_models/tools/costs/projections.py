@@ -1,14 +1,19 @@
 import logging
-from collections.abc import Mapping
+import multiprocessing
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from itertools import product
+from pathlib import Path
+from time import perf_counter
 
 import numpy as np
 import pandas as pd
-from numpy.polynomial import Polynomial
 
 from .config import Config
 from .decay import project_ref_region_inv_costs_using_reduction_rates
 from .gdp import adjust_cost_ratios_with_gdp
+from .memo import Memo, use
 from .regional_differentiation import apply_regional_differentiation
 
 log = logging.getLogger(__name__)
@@ -48,6 +53,49 @@ def _maybe_query_scenario_version(df: pd.DataFrame, config: "Config") -> pd.Data
     return df.query("scenario_version in @scen_vers")
 
 
+def _fit_linear(
+    df: pd.DataFrame, by: list[str], x: str, y: str, x_new, name: str
+) -> pd.DataFrame:
+    """Fit a line to `x` and `y` in each group of `df` and predict for `x_new`.
+
+    The least-squares fits for all groups are computed at once, in closed form, from
+    sums over the rows of each group. This gives the same results as fitting a
+    degree-1 :class:`numpy.polynomial.Polynomial` to each group, to within floating
+    point precision.
+
+    Returns
+    -------
+    pandas.DataFrame
+        with columns `by`, `x`, and `name`. There is one row for each group and value of
+        `x_new`, sorted by `by`.
+    """
+    groups = df.groupby(by)
+    codes = groups.ngroup().to_numpy()
+    mask = codes >= 0  # Exclude rows with missing labels in `by`
+    codes = codes[mask]
+    xv = df[x].to_numpy(dtype=float)[mask]
+    yv = df[y].to_numpy(dtype=float)[mask]
+
+    # Means, and sums of products of deviations from the means, for each group
+    n = np.bincount(codes)
+    x_mean = np.bincount(codes, xv) / n
+    y_mean = np.bincount(codes, yv) / n
+    dx = xv - x_mean[codes]
+    slope = np.bincount(codes, dx * (yv - y_mean[codes])) / np.bincount(codes, dx**2)
+
+    # Predict for all groups (axis 0) and `x_new` (axis 1)
+    x_new = np.asarray(x_new)
+    value = y_mean[:, None] + slope[:, None] * (x_new - x_mean[:, None])
+
+    return (
+        groups.size()
+        .index.to_frame(index=False)
+        .loc[lambda df: df.index.repeat(len(x_new))]
+        .reset_index(drop=True)
+        .assign(**{x: np.tile(x_new, len(n)), name: value.ravel()})
+    )
+
+
 def create_projections_constant(config: "Config"):
     """Create cost projections using assuming constant regional cost ratios.
 
@@ -257,30 +305,17 @@ def create_projections_converge(config: "Config"):
         .drop_duplicates()
     )
 
-    y_predict = np.array(config.seq_years)
-    y_index = pd.Index(config.seq_years, name="year")
-
-    def _predict(df: pd.DataFrame) -> pd.Series:
-        """Fit a degree-3 polynomial to `df` and predict for :attr:`.seq_years`."""
-        # Fit
-        p = Polynomial.fit(df.year, df.inv_cost_tmp, deg=1)
-
-        # - Predict using config.seq_years.
-        # - Assemble a single-column data frame with "year" as the index name.
-        return pd.DataFrame({"inv_pre_converge_decay": p(y_predict)}, index=y_index)
-
-    # Columns for grouping and merging
-    cols = ["scenario", "message_technology", "region"]
-
-    # Apply polynomial regression to costs at base year and convergence year
+    # Apply linear regression to costs at base year and convergence year
     # (interpolating)
-    df_pre_converge_costs = (
+    df_pre_converge_costs = _fit_linear(
         df_tmp_costs.query(
             "year == @config.base_year or year == @config.convergence_year"
-        )
-        .groupby(cols[:3], group_keys=True)
-        .apply(_predict)
-        .reset_index()
+        ),
+        ["scenario", "message_technology", "region"],
+        "year",
+        "inv_cost_tmp",
+        config.seq_years,
+        "inv_pre_converge_decay",
     )
 
     # Get final investment costs
@@ -688,3 +723,129 @@ def create_cost_projections(config: "Config") -> Mapping[str, pd.DataFrame]:
         df_inv, df_fom = create_iamc_outputs(df_inv, df_fom)
 
     return {"inv_cost": df_inv, "fix_cost": df_fom}
+
+
+#: Columns added by :func:`create_cost_projections_batch` to identify the
+#: :class:`.Config` that produced each row. "config" is the index of the Config in the
+#: `configs` argument, and is unique even for configs that differ only in other fields,
+#: such as :attr:`~.Config.ref_region` or :attr:`~.Config.base_year`. The others are
+#: the name of :attr:`~.Config.module`, :attr:`~.Config.node`, and
+#: :attr:`~.Config.method`, for convenience.
+BATCH_COLUMNS = ["config", "module", "node", "method"]
+
+
+def _run_batch(
+    configs: list["Config"],
+) -> list[tuple[Mapping[str, pd.DataFrame], list[tuple[str, float]]]]:
+    """Run :func:`create_cost_projections` for each of `configs`, sharing one memo.
+
+    Returns, for each config, the projections and the time taken for each stage.
+    """
+    from message_ix_models import Context
+
+    try:
+        Context.get_instance(-1)
+    except IndexError:  # In a worker process; needed by adjust_cost_ratios_with_gdp()
+        Context()
+
+    result = []
+    with use(Memo()) as memo:
+        for config in configs:
+            N, t0 = len(memo.times), perf_counter()
+            data = create_cost_projections(config)
+            times = memo.times[N:] + [("create_cost_projections", perf_counter() - t0)]
+            result.append((data, times))
+
+    return result
+
+
+def create_cost_projections_batch(
+    configs: Iterable["Config"], *, jobs: int = 1, path: Path | None = None
+) -> Mapping[str, pd.DataFrame]:
+    """Get investment and fixed cost projections for many `configs`.
+
+    The result is the same as calling :func:`create_cost_projections` for each of
+    `configs` and concatenating the results, but faster:
+
+    - Intermediate results that are the same for many configs—for instance, from
+      :func:`.apply_regional_differentiation` and the input data it reads—are computed
+      once and shared; see :mod:`.costs.memo`.
+    - If `jobs` is greater than 1, configs with the same :attr:`~.Config.base_year`,
+      :attr:`~.Config.module`, :attr:`~.Config.node`, and :attr:`~.Config.ref_region`
+      form one batch, and batches are run in up to `jobs` processes. Intermediate
+      results are shared only within each batch.
+
+    Parameters
+    ----------
+    configs :
+        Configurations for :func:`create_cost_projections`. These should all have the
+        same :attr:`~.Config.format`.
+    jobs :
+        Maximum number of processes.
+    path :
+        If given, also write "inv_cost" and "fix_cost" as Parquet datasets to
+        subdirectories of `path`, partitioned by the "config" column.
+
+    Returns
+    -------
+    dict
+        Keys are:
+
+        - "inv_cost" and "fix_cost": data from :func:`create_cost_projections` for all
+          `configs`, with additional columns :data:`BATCH_COLUMNS`: the index of each
+          config in `configs`, and the name of its :attr:`~.Config.module`,
+          :attr:`~.Config.node`, and :attr:`~.Config.method`.
+        - "time": the time in seconds for each config and stage, with columns
+          :data:`BATCH_COLUMNS`, "scenario", "stage", and "time". Each shared
+          intermediate result appears only once, for the first config that used it.
+    """
+    configs = list(configs)
+
+    # Group configs into batches
+    batches: dict[tuple, list[int]] = defaultdict(list)
+    for i, c in enumerate(configs):
+        key = (c.base_year, c.module, c.node, c.ref_region) if jobs > 1 else ()
+        batches[key].append(i)
+    log.info(f"Project costs for {len(configs)} configs in {len(batches)} batch(es)")
+
+    # Run batches, in worker processes if `jobs` > 1
+    tasks = [[configs[i] for i in indices] for indices in batches.values()]
+    if jobs > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            results = list(pool.map(_run_batch, tasks))
+    else:
+        results = list(map(_run_batch, tasks))
+
+    # Restore the order of `configs`
+    data: list[Mapping[str, pd.DataFrame]] = [{}] * len(configs)
+    times: list[tuple[int, str, float]] = []
+    for indices, batch_result in zip(batches.values(), results):
+        for i, (d, t) in zip(indices, batch_result):
+            data[i] = d
+            times.extend((i, stage, time) for stage, time in t)
+
+    # Labels for each config
+    labels = [(i, c.module.name, c.node, c.method) for i, c in enumerate(configs)]
+
+    result: dict[str, pd.DataFrame] = {}
+    for name in "inv_cost", "fix_cost":
+        result[name] = pd.concat(
+            [
+                d[name].assign(**dict(zip(BATCH_COLUMNS, labels[i])))
+                for i, d in enumerate(data)
+            ],
+            ignore_index=True,
+        )
+        if path:
+            result[name].to_parquet(path.joinpath(name), partition_cols=["config"])
+
+    result["time"] = pd.DataFrame(
+        [labels[i] + (configs[i].scenario, stage, time) for i, stage, time in times],
+        columns=BATCH_COLUMNS + ["scenario", "stage", "time"],
+    )
+    log.info(f"Total time by stage:\n{result['time'].groupby('stage').time.sum()}")
+
+    return result
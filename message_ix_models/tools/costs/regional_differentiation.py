@@ -11,6 +11,7 @@ from message_ix_models.util import package_data_path
 from message_ix_models.util.node import adapt_R11_R12
 
 from .config import MODULE, Config
+from .memo import memoize
 
 log = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ def get_weo_region_map(regions: str) -> Mapping[str, str]:
     return {n.id: str(n.get_annotation(id="iea-weo-region").text) for n in nodes}
 
 
+@memoize()
 def get_weo_data() -> pd.DataFrame:
     """Read in raw WEO investment/capital costs and O&M costs data.
 
@@ -140,6 +142,7 @@ def get_weo_data() -> pd.DataFrame:
     return df_merged
 
 
+@memoize()
 def get_intratec_data() -> pd.DataFrame:
     """Read in raw Intratec data.
 
@@ -616,6 +619,7 @@ def get_intratec_regional_differentiation(node: str, ref_region: str) -> pd.Data
     return df_reg_ratios
 
 
+@memoize("base_year", "module", "node", "ref_region")
 def apply_regional_differentiation(config: "Config") -> pd.DataFrame:
     """Apply regional differentiation depending on mapping source.
 
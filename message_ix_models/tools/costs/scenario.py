@@ -1,6 +1,8 @@
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from message_ix_models.tools.costs.projections import create_cost_projections
 from message_ix_models.util import add_par_data
 
@@ -13,44 +15,31 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-def _replace_inner(group: "DataFrame", par: str, base_year: int) -> "DataFrame":
-    if par == "inv_cost":
-        base_year_value = group.loc[group["year_vtg"] == base_year, "value"]
-        if not base_year_value.empty:
-            group.loc[group["year_vtg"] < base_year, "value"] = base_year_value.iloc[0]
-    elif par == "fix_cost":
-        for year_vtg in group["year_vtg"].unique():
-            if year_vtg < base_year:
-                for year_act in group["year_act"].unique():
-                    # If year_act is greater than or equal to base_year, replace the
-                    # value with the year_vtg = base year value at the same year_act
-                    if year_act >= base_year:
-                        base_year_value = group.loc[
-                            (group["year_vtg"] == base_year)
-                            & (group["year_act"] == year_act),
-                            "value",
-                        ]
-                        if not base_year_value.empty:
-                            group.loc[
-                                (group["year_vtg"] == year_vtg)
-                                & (group["year_act"] == year_act),
-                                "value",
-                            ] = base_year_value.iloc[0]
-                    # If year_act is less than base_year, replace the value with the
-                    # base year value at year_vtg = base_year and year_act = base_year
-                    elif year_act < base_year:
-                        base_year_value = group.loc[
-                            (group["year_vtg"] == base_year)
-                            & (group["year_act"] == base_year),
-                            "value",
-                        ]
-                        if not base_year_value.empty:
-                            group.loc[
-                                (group["year_vtg"] == year_vtg)
-                                & (group["year_act"] == year_act),
-                                "value",
-                            ] = base_year_value.iloc[0]
-    return group
+def _replace(df: "DataFrame", par: str, base_year: int) -> "DataFrame":
+    """Replace values before `base_year`; see :func:`replace_pre_base_year_cost`.
+
+    Replacement values for all rows are looked up with a single merge.
+    """
+    # Dimensions identifying the replacement value for each row
+    dims = ["technology", "node_loc"] + (["year_act"] if par == "fix_cost" else [])
+
+    # Values with year_vtg = base_year
+    base = df.loc[df["year_vtg"] == base_year, dims + ["value"]].drop_duplicates(dims)
+
+    # Rows to be replaced. For fix_cost, year_act before base_year takes the value at
+    # year_vtg = year_act = base_year; other year_act the value at the same year_act.
+    pre = (df["year_vtg"] < base_year).to_numpy()
+    target = df.loc[pre, dims]
+    if par == "fix_cost":
+        target = target.assign(year_act=target["year_act"].clip(lower=base_year))
+    merged = target.merge(base, on=dims, how="left", indicator=True)
+
+    # Replace only where a base year value exists
+    found = (merged["_merge"] == "both").to_numpy()
+    value = df["value"].to_numpy(copy=True)
+    value[np.flatnonzero(pre)[found]] = merged["value"].to_numpy()[found]
+
+    return df.assign(value=value)
 
 
 def replace_pre_base_year_cost(
@@ -82,16 +71,9 @@ def replace_pre_base_year_cost(
     if par not in ("fix_cost", "inv_cost"):
         raise ValueError("Parameter must be either 'inv_cost' or 'fix_cost'")
 
-    return (
-        scen.par(par)
-        .groupby(["technology", "node_loc"])
-        # include_groups=False is default in pandas 3.0, not in 2.x
-        # TODO Remove once pandas 3.x is the minimum supported version
-        .apply(
-            _replace_inner, par=par, base_year=config.base_year, include_groups=False
-        )
-        .reset_index()
-        .sort_values(["year_vtg"] + (["year_act"] if par == "fix_cost" else []))
+    years = ["year_vtg"] + (["year_act"] if par == "fix_cost" else [])
+    return _replace(scen.par(par), par, config.base_year).sort_values(
+        years + ["technology", "node_loc"]
     )
 
 
@@ -78,11 +78,13 @@ class GFEI(ExoDataSource):
 
     def get(self) -> "AnyQuantity":
         import genno.operator
+        import pandas as pd
 
-        from message_ix_models.util.pycountry import iso_3166_alpha_3
+        from message_ix_models.util.pycountry import to_iso_3166_alpha_3
 
         def relabel_n(qty: "TQuantity") -> "TQuantity":
-            labels = {n: iso_3166_alpha_3(n) for n in qty.coords["n"].data}
+            n = pd.Series(qty.coords["n"].data)
+            labels = dict(zip(n, to_iso_3166_alpha_3(n)))
             return genno.operator.relabel(qty, {"n": labels})
 
         # - Read the CSV file, rename columns.
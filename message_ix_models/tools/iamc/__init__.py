@@ -1,7 +1,13 @@
 """Tools for working with IAMC-structured data."""
 
+import ast
+import logging
+import operator
+import os
 import re
 from collections.abc import MutableMapping
+from functools import reduce
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import genno
@@ -10,14 +16,17 @@ from sdmx.message import StructureMessage
 from sdmx.model import common, v21
 
 from message_ix_models.util import cached
-from message_ix_models.util.pycountry import iso_3166_alpha_3
+from message_ix_models.util.pycountry import to_iso_3166_alpha_3
 
 if TYPE_CHECKING:
     import pathlib
 
     import pandas.api.typing
+    import pyarrow.compute
     from genno.types import AnyQuantity
 
+log = logging.getLogger(__name__)
+
 __all__ = [
     "compare",
     "describe",
@@ -203,10 +212,7 @@ def describe(data: pd.DataFrame, extra: str | None = None) -> StructureMessage:
 
 
 def _assign_n(df: pd.DataFrame, *, missing: Literal["keep", "discard"]) -> pd.DataFrame:
-    if missing == "discard":
-        return df.assign(n=df["REGION"].apply(iso_3166_alpha_3))
-    else:
-        return df.assign(n=df["REGION"].apply(lambda v: iso_3166_alpha_3(v) or v))
+    return df.assign(n=to_iso_3166_alpha_3(df["REGION"], missing=missing))
 
 
 def _drop_unique(
@@ -228,7 +234,200 @@ def _raise_empty(df: pd.DataFrame, *, query: str) -> pd.DataFrame:
     return df
 
 
+#: Dimensions by which data in :func:`_sidecar` files are sorted, so that row groups
+#: contain few distinct labels and filters on these dimensions skip most of them.
+SIDECAR_SORT = ("MODEL", "SCENARIO", "VARIABLE")
+
+#: Number of rows per row group in :func:`_sidecar` files.
+SIDECAR_ROW_GROUP_SIZE = 10_000
+
+
+def _sidecar(
+    path: "pathlib.Path", archive_member: str | None, **kwargs
+) -> "pathlib.Path":
+    """Return the path to a Parquet copy of the data at `path`, creating it if needed.
+
+    The file is stored in :attr:`.Config.cache_path` and named like
+    :file:`iamc_sidecar-{hash}.parquet`, where `hash` is computed from the resolved
+    `path`, its modification time and size, `archive_member`, and `kwargs`. A changed
+    source file thus gives a new sidecar file; the old one is removed by
+    :meth:`.Cache.prune` like other cache entries.
+
+    Rows are sorted by the :data:`SIDECAR_SORT` dimensions and stored in row groups of
+    :data:`SIDECAR_ROW_GROUP_SIZE` rows, with statistics, so that :func:`_filter`
+    expressions on these dimensions read only the matching row groups.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from genno.caching import hash_args
+
+    from message_ix_models.util.cache import COMPUTER, Cache
+
+    stat = path.stat()
+    key = hash_args(
+        str(path.resolve()), stat.st_mtime_ns, stat.st_size, archive_member, **kwargs
+    )
+    cache = Cache(COMPUTER.graph["config"]["cache_path"])
+    result = cache.path.joinpath(f"iamc_sidecar-{key}.parquet")
+
+    if result.exists():
+        os.utime(result)  # Mark as recently used
+        cache.record(result.name, load_time=0.0)
+        return result
+
+    log.info(f"Convert {path} to {result.name}")
+    t0 = perf_counter()
+
+    # Identify the source object/buffer to read from
+    if archive_member:
+        if path.suffix.rpartition(".")[2] in ("gz", "xz"):
+            # A single member in an LZMA-compressed tar archive that has ≥1 members
+            import tarfile
+
+            tf = tarfile.open(path, mode="r:*")
+            source: Any = tf.extractfile(archive_member)
+        else:
+            # A single member in a ZIP archive that has ≥1 members
+            import zipfile
+
+            zf = zipfile.ZipFile(path)
+            source = zf.open(archive_member)
+    else:
+        # A direct path, possibly compressed
+        source = path
+
+    kwargs.setdefault("engine", "pyarrow")
+    df = pd.read_csv(source, **kwargs)
+
+    # Sort by the columns matching SIDECAR_SORT, in any case
+    by = [c for d in SIDECAR_SORT for c in df.columns if c.upper() == d]
+    table = pa.Table.from_pandas(
+        df.sort_values(by, kind="stable") if by else df, preserve_index=False
+    )
+
+    # Write to a temporary file, then replace, so the sidecar is never incomplete
+    cache.path.mkdir(parents=True, exist_ok=True)
+    tmp = result.with_name(f"{result.name}.{os.getpid()}")
+    pq.write_table(table, tmp, row_group_size=SIDECAR_ROW_GROUP_SIZE)
+    tmp.replace(result)
+    cache.record(result.name, compute_time=perf_counter() - t0)
+
+    return result
+
+
+def _values(node: ast.expr) -> list | None:
+    """Return the literal value(s) of `node`, or :any:`None` if it is not a literal."""
+    try:
+        value = ast.literal_eval(node)
+    except (TypeError, ValueError):  # Not a literal, e.g. a column name
+        return None
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _translate_boolop(
+    node: ast.BoolOp, columns: list[str]
+) -> "pyarrow.compute.Expression | None":
+    """Translate ``and`` or ``or`` for :func:`_filter`."""
+    parts = [_translate(v, columns) for v in node.values]
+    if isinstance(node.op, ast.And):
+        # Discard parts that cannot be translated; the rest still hold
+        known = [p for p in parts if p is not None]
+        return reduce(operator.and_, known) if known else None
+    elif any(p is None for p in parts):
+        return None  # Any part of a disjunction may match all rows
+    return reduce(operator.or_, parts)
+
+
+def _translate_compare(
+    node: ast.Compare, columns: list[str]
+) -> "pyarrow.compute.Expression | None":
+    """Translate ``==`` or ``in`` for :func:`_filter`."""
+    import pyarrow.compute as pc
+
+    if len(node.ops) != 1 or not isinstance(node.ops[0], (ast.Eq, ast.In)):
+        return None
+
+    left, right = node.left, node.comparators[0]
+    if isinstance(right, ast.Name) and isinstance(node.ops[0], ast.Eq):
+        left, right = right, left
+    if not (isinstance(left, ast.Name) and left.id in columns):
+        return None
+    values = _values(right)
+    return None if values is None else pc.field(left.id).isin(values)
+
+
+def _translate(
+    node: ast.expr, columns: list[str]
+) -> "pyarrow.compute.Expression | None":
+    """Translate `node` for :func:`_filter`."""
+    import pyarrow.compute as pc
+
+    if isinstance(node, ast.BoolOp):
+        return _translate_boolop(node, columns)
+    elif isinstance(node, ast.Compare):
+        return _translate_compare(node, columns)
+    elif isinstance(node, ast.Constant) and isinstance(node.value, bool):
+        return None if node.value else pc.scalar(False)
+    return None
+
+
+def _filter(
+    query: str | None, columns: list[str]
+) -> "pyarrow.compute.Expression | None":
+    """Translate a :meth:`pandas.DataFrame.query` string to a :mod:`pyarrow` filter.
+
+    Only ``==`` and ``in`` comparisons of a name in `columns` to literal values, and
+    the constants :any:`True` and :any:`False`, combined using ``and`` and ``or``, are
+    translated. Other parts of `query` are treated as matching all rows, so the
+    filter selects a *superset* of the rows selected by `query`; `query` must still be
+    applied to the result.
+
+    Returns
+    -------
+    pyarrow.compute.Expression or None
+        :any:`None` if `query` cannot be translated, or matches all rows.
+    """
+    if query is None:
+        return None
+    try:
+        return _translate(ast.parse(query.strip(), mode="eval").body, columns)
+    except SyntaxError:  # Uses pandas-specific syntax, e.g. "@" or backticks
+        return None
+
+
 @cached
+def _read_sidecar(
+    path: "pathlib.Path",
+    query: str,
+    *,
+    drop: list[str] | None,
+    non_iso_3166: Literal["keep", "discard"],
+    replace: dict | None,
+    unique: str,
+) -> "AnyQuantity":
+    """Read the subset of `path` matching `query` and pass it to :func:`to_quantity`."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = pq.read_schema(path).names
+    try:
+        table = pq.read_table(path, filters=_filter(query, columns))
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        # E.g. comparison of a numeric column to a str; read all rows
+        log.debug(f"Cannot filter on read ({e!r}); read all rows")
+        table = pq.read_table(path)
+    log.debug(f"Read {table.num_rows} rows from {path.name}")
+
+    return to_quantity(
+        table.to_pandas(),
+        query=query,
+        drop=drop,
+        non_iso_3166=non_iso_3166,
+        replace=replace,
+        unique=unique,
+    )
+
+
 def iamc_like_data_for_query(
     path: "pathlib.Path",
     query: str,
@@ -244,13 +443,20 @@ def iamc_like_data_for_query(
 
     The steps involved are:
 
-    1. Read the data file. Additional `kwargs` are passed to :func:`pandas.read_csv`.
-       By default (unless `kwargs` explicitly give a different value), pyarrow is used
-       for better performance.
-    2. Pass the result through :func:`to_quantity`, with the parameters `query`,
+    1. On first use, read the data file and store a copy in Parquet format in
+       :attr:`.Config.cache_path`. Additional `kwargs` are passed to
+       :func:`pandas.read_csv`. By default (unless `kwargs` explicitly give a different
+       value), pyarrow is used for better performance. The copy is reused by all
+       later calls with any `query`, until the modification time or size of the file
+       at `path` changes.
+    2. Read from the copy only the rows that may match `query`. Comparisons like
+       ``VARIABLE == 'foo'`` or ``Scenario in ['bar', 'baz']`` in `query` are used to
+       skip stored row groups without reading them.
+    3. Pass the result through :func:`to_quantity`, with the parameters `query`,
        `drop`, `non_iso_3166`, `replace`, and `unique`.
-    3. Cache the result using :obj:`.cached`. Subsequent calls with the same arguments
-       will yield the cached result rather than repeating steps (1) and (2).
+    4. Cache the result using :obj:`.cached`. Subsequent calls with the same arguments
+       and an unchanged file will yield the cached result rather than repeating steps
+       (2) and (3).
 
     Parameters
     ----------
@@ -264,31 +470,9 @@ def iamc_like_data_for_query(
     genno.Quantity
         of the same structure returned by :func:`to_quantity`.
     """
-    import pandas as pd
-
-    # Identify the source object/buffer to read from
-    if archive_member:
-        if path.suffix.rpartition(".")[2] in ("gz", "xz"):
-            # A single member in an LZMA-compressed tar archive that has ≥1 members
-            import tarfile
-
-            tf = tarfile.open(path, mode="r:*")
-            source: Any = tf.extractfile(archive_member)
-        else:
-            # A single member in a ZIP archive that has ≥1 members
-            import zipfile
-
-            zf = zipfile.ZipFile(path)
-            source = zf.open(archive_member)
-    else:
-        # A direct path, possibly compressed
-        source = path
-
-    kwargs.setdefault("engine", "pyarrow")
-
-    return to_quantity(
-        pd.read_csv(source, **kwargs),
-        query=query,
+    return _read_sidecar(
+        _sidecar(path, archive_member, **kwargs),
+        query,
         drop=drop,
         non_iso_3166=non_iso_3166,
         replace=replace,
@@ -320,7 +504,7 @@ def to_quantity(
      6. Assert that the `unique` columns each contain exactly 1 unique value, then
         drop these columns. This means that `query` **must** result in data with unique
         values for these dimensions.
-     7. Transform "REGION" codes via :func:`.iso_3166_alpha_3` to an "n" dimension
+     7. Transform "REGION" codes via :func:`.to_iso_3166_alpha_3` to an "n" dimension
         containing ISO 3166-1 alpha-3 codes. If `non_iso_3166`, preserve codes that do
         not appear in the standard.
      8. Drop entire time series where (7) does not yield an "n" code.
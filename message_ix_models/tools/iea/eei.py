@@ -260,7 +260,7 @@ def melt(df: pd.DataFrame) -> pd.DataFrame:
 
 @cached
 def iea_eei_data_raw(path, non_iso_3166: Literal["keep", "discard"] = "discard"):
-    from message_ix_models.util.pycountry import iso_3166_alpha_3
+    from message_ix_models.util.pycountry import to_iso_3166_alpha_3
 
     xf = pd.ExcelFile(path)
 
@@ -302,7 +302,7 @@ def iea_eei_data_raw(path, non_iso_3166: Literal["keep", "discard"] = "discard")
     return (
         pd.concat(dfs)
         .fillna("__NA")
-        .assign(n=lambda df: df["Country"].apply(iso_3166_alpha_3))
+        .assign(n=lambda df: to_iso_3166_alpha_3(df["Country"]))
         .drop("Country", axis=1)
     )
 
@@ -1,11 +1,12 @@
 """Tools for IEA (Extended) World Energy Balance (WEB) data."""
 
 import logging
-from collections.abc import Hashable, Iterable, Mapping
+import os
+from collections.abc import Hashable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from enum import Flag
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Literal
 
 import genno
 import pandas as pd
@@ -20,13 +21,14 @@ from message_ix_models.util import (
     package_data_path,
     path_fallback,
 )
-from message_ix_models.util._logging import silence_log
 from message_ix_models.util.zipfile import extract_if_newer
 
 if TYPE_CHECKING:
     import os
 
     import genno
+    import pyarrow
+    import pyarrow.dataset
     from genno.types import AnyQuantity, TQuantity
 
     from message_ix_models.util.common import MappingAdapter
@@ -78,6 +80,17 @@ COUNTRY_NAME = {
 #: Dimensions of the data.
 DIMS = ["COUNTRY", "PRODUCT", "TIME", "FLOW", "MEASURE"]
 
+#: Dimensions by which the Parquet datasets written by :func:`to_parquet` are
+#: partitioned.
+PARTITION = ["MEASURE", "TIME"]
+
+#: Values in the data files that are read as null/NaN.
+NA_VALUES = ["..", "c", "x"]
+
+#: Number of lines of a fixed-width data file to convert at once, in
+#: :func:`to_parquet`.
+CHUNK_SIZE = 2**20
+
 #: Mapping from (provider, year, time stamp) → set of file name(s) containing data.
 FILES = {
     ("IEA", "2024"): (  # Timestamped 20240725T0830
@@ -211,12 +224,19 @@ class IEA_EWEB(ExoDataSource):
 
     def get(self) -> "AnyQuantity":
         """Load and process the data."""
-        # - Load the data.
+        # - Load the data, reading only the selected product(s) and flow(s).
         # - Convert to pd.Series, then genno.Quantity.
         # - Map dimensions.
         # - Apply `indexers` to select.
         opt = self.options
-        load_kw = dict(provider=opt.provider, edition=opt.edition, path=self.path)
+        filters = {
+            dim.upper(): [value] if isinstance(value, str) else list(value)
+            for dim, value in self.indexers.items()
+            if dim != "MEASURE"
+        }
+        load_kw = dict(
+            provider=opt.provider, edition=opt.edition, path=self.path, filters=filters
+        )
         rename: Mapping[Hashable, Hashable] = {
             "COUNTRY": "n",
             "TIME": "y",
@@ -318,21 +338,154 @@ def fwf_to_csv(path: Path, progress: bool = False) -> Path:  # pragma: no cover
     return path_out
 
 
+def _schema() -> "pyarrow.Schema":
+    """Schema of the datasets written by :func:`to_parquet`."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [(d, pa.int64() if d == "TIME" else pa.string()) for d in DIMS]
+        + [("Value", pa.float64())]
+    )
+
+
+def _partitioning() -> "pyarrow.dataset.Partitioning":
+    """Partitioning of the datasets written by :func:`to_parquet`."""
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    schema = _schema()
+    return ds.partitioning(
+        pa.schema([schema.field(d) for d in PARTITION]), flavor="hive"
+    )
+
+
+def to_parquet(path: Path, progress: bool = False) -> Path:
+    """Convert an IEA WEB data file to a Parquet dataset.
+
+    The dataset is a directory in :attr:`.Config.cache_path` named like
+    :file:`iea_web_parquet-{hash}.parquet`, where `hash` is computed from the resolved
+    `path`, its modification time, and its size. If it already exists, it is not
+    converted again. It is listed and pruned by :class:`.Cache` like other cache
+    entries. The dataset is partitioned by MEASURE and TIME, such that
+    :func:`iea_web_data_for_query` reads only the files for the requested MEASURE.
+    Within each file, the COUNTRY, FLOW, and PRODUCT columns are dictionary-encoded.
+    Values in :data:`NA_VALUES` are stored as nulls.
+
+    `path` may be in the IEA fixed-width (.TXT) or CSV format. Either is read in
+    chunks of :data:`CHUNK_SIZE` lines, so that memory use does not depend on the size
+    of the file. In the fixed-width format, fields are separated by 2 or more spaces.
+    Lines with a different number of fields than expected are skipped, and the number
+    skipped is logged.
+    """
+    import re
+    from itertools import islice
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv
+    import pyarrow.dataset as ds
+    from genno.caching import hash_args
+
+    from message_ix_models.util.cache import COMPUTER, Cache
+
+    # Output path
+    stat = path.stat()
+    key = hash_args(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    cache = Cache(COMPUTER.graph["config"]["cache_path"])
+    path_out = cache.path.joinpath(f"iea_web_parquet-{key}.parquet")
+    if path_out.exists():
+        log.info(f"Skip conversion of {path}; use {path_out}")
+        os.utime(path_out)  # Mark as recently used
+        cache.record(path_out.name, load_time=0.0)
+        return path_out
+
+    schema = _schema()
+
+    def fwf_batches() -> Iterable["pa.RecordBatch"]:
+        # Split on runs of 2 or more spaces; labels may contain single spaces
+        expr = re.compile("  +")
+        na = pa.array(NA_VALUES)
+        skipped = 0
+
+        with open(path, encoding="utf-8") as f:
+            lines: Iterator[str] = f
+            if progress:
+                from tqdm import tqdm
+
+                lines = iter(tqdm(f, desc=f"{path} → {path_out}"))
+
+            while chunk := list(islice(lines, CHUNK_SIZE)):
+                rows = [expr.split(line.strip()) for line in chunk if line.strip()]
+                valid = [r for r in rows if len(r) == len(schema)]
+                if len(valid) < len(rows) and not skipped:
+                    example = next(r for r in rows if len(r) != len(schema))
+                    log.warning(f"Skip line(s) in {path} like {'  '.join(example)!r}")
+                skipped += len(rows) - len(valid)
+
+                columns = [pa.array(c, pa.string()) for c in zip(*valid)]
+                if not columns:
+                    continue
+                value = pc.if_else(
+                    pc.is_in(columns[5], value_set=na),
+                    pa.scalar(None, pa.string()),
+                    columns[5],
+                )
+                yield pa.RecordBatch.from_arrays(
+                    columns[:2]
+                    + [pc.cast(columns[2], pa.int64())]
+                    + columns[3:5]
+                    + [pc.cast(value, pa.float64())],
+                    schema=schema,
+                )
+
+        if skipped:
+            log.warning(f"Skipped {skipped} line(s) without {len(schema)} fields")
+
+    def csv_batches() -> Iterable["pa.RecordBatch"]:
+        yield from pyarrow.csv.open_csv(
+            path,
+            read_options=pyarrow.csv.ReadOptions(block_size=2**24),
+            convert_options=pyarrow.csv.ConvertOptions(
+                column_types=schema,
+                include_columns=schema.names,
+                null_values=NA_VALUES + [f"{v} " for v in NA_VALUES],
+            ),
+        )
+
+    with cache.write_dir(path_out.name) as tmp:
+        ds.write_dataset(
+            fwf_batches() if path.suffix == ".TXT" else csv_batches(),
+            tmp,
+            schema=schema,
+            format="parquet",
+            partitioning=_partitioning(),
+            file_options=ds.ParquetFileFormat().make_write_options(
+                use_dictionary=["COUNTRY", "FLOW", "PRODUCT"]
+            ),
+            max_rows_per_group=2**16,
+            max_open_files=2**10,
+        )
+
+    return path_out
+
+
 @cached
 def iea_web_data_for_query(
-    base_path: Path, *filenames: str, query_expr: str
+    base_path: Path,
+    *filenames: str,
+    query_expr: str,
+    filters: Mapping[str, list[str]] | None = None,
 ) -> pd.DataFrame:
-    """Load data from `base_path` / `filenames` in IEA WEB formats."""
-    import dask.dataframe as dd
-
-    names_to_read = []  # Filenames to pass to dask.dataframe
-    # Keyword arguments for read_csv()
-    # - Certain values appearing in (IEA, 2024) are mapped to NaN.
-    # - The Value column is numeric.
-    args: dict[str, Any] = dict(
-        dtype={"Value": float},
-        na_values=[".. ", "c ", "x "],
-    )
+    """Load data from `base_path` / `filenames` in IEA WEB formats.
+
+    Each file is converted using :func:`to_parquet`. Only data with MEASURE "TJ" and
+    with labels in `filters`, if any, are read from the resulting datasets; then
+    `query_expr` is applied.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+
+    datasets = []
 
     # Iterate over origin filenames
     for filename in filenames:
@@ -345,20 +498,26 @@ def iea_web_data_for_query(
             target_dir = cache.COMPUTER.graph["config"]["cache_path"].joinpath("iea")
             path, *_ = extract_if_newer(path, target_dir=target_dir)
 
-        if path.suffix == ".TXT":  # pragma: no cover
-            names_to_read.append(fwf_to_csv(path, progress=True))
-            args.update(header=None, names=DIMS + ["Value"])
-        else:
-            names_to_read.append(path)
-            args.update(header=0, usecols=DIMS + ["Value"])
+        datasets.append(
+            ds.dataset(
+                to_parquet(path, progress=True),
+                format="parquet",
+                partitioning=_partitioning(),
+            )
+        )
 
-    with silence_log("fsspec.local"):
-        ddf = dd.read_csv(names_to_read, engine="pyarrow", **args)
-        ddf = ddf[ddf["MEASURE"] == "TJ"]
-        # NB compute() must precede query(), else "ValueError: The columns in the
-        # computed data do not match the columns in the provided metadata" occurs with
-        # the CSV-formatted data.
-        result = ddf.compute().query(query_expr).dropna(subset=["Value"])
+    # Filter expression: MEASURE "TJ" and any of the labels in `filters`
+    expr = pc.field("MEASURE") == "TJ"
+    for dim, labels in (filters or {}).items():
+        expr &= pc.field(dim).isin(labels)
+
+    result = (
+        ds.dataset(datasets)
+        .to_table(columns=DIMS + ["Value"], filter=expr)
+        .to_pandas()
+        .query(query_expr)
+        .dropna(subset=["Value"])
+    )
 
     log.info(f"{len(result)} observations")
     return result
@@ -369,6 +528,7 @@ def load_data(
     edition: str,
     query_expr="MEASURE == 'TJ' and TIME >= 1980",
     path: Path | None = None,
+    filters: Mapping[str, list[str]] | None = None,
 ) -> pd.DataFrame:
     """Load data from the IEA World Energy Balances.
 
@@ -383,6 +543,9 @@ def load_data(
     base_path : os.Pathlike, optional
         Path containing :data:`.FILES`. If not provided, locations within
         :mod:`message_data` or :mod:`message_ix_models` are used.
+    filters : dict, optional
+        Mapping from dimensions (for instance "PRODUCT") to lists of labels. Only data
+        with these labels are read. See :func:`iea_web_data_for_query`.
 
     Returns
     -------
@@ -393,7 +556,7 @@ def load_data(
     if "test" in path.parts:
         log.warning(f"Reading random data from {path}")
     return iea_web_data_for_query(
-        path, *FILES[(provider, edition)], query_expr=query_expr
+        path, *FILES[(provider, edition)], query_expr=query_expr, filters=filters
     )
 
 
@@ -459,10 +622,9 @@ def get_mapping(provider: str, edition: str) -> "MappingAdapter":
             cl = read(f"IEA:{concept}_{provider}({edition})")
             pycountry.COUNTRY_NAME.update(COUNTRY_NAME)
 
-            maps[dim] = list()
-            for code in cl:
-                new_id = pycountry.iso_3166_alpha_3(code.id) or code.id
-                maps[dim].append((code.id, new_id))
+            ids = pd.Series([code.id for code in cl])
+            new_ids = pycountry.to_iso_3166_alpha_3(ids, missing="keep")
+            maps[dim] = list(zip(ids, new_ids))
 
     return MappingAdapter(maps)
 
@@ -1,14 +1,24 @@
 import logging
 from collections import ChainMap, defaultdict
-from collections.abc import Collection, Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import (
+    Collection,
+    Hashable,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
 from datetime import datetime
 from functools import partial, singledispatch
 from hashlib import blake2s
 from itertools import count
+from math import prod
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 import message_ix
+import numpy as np
 import pandas as pd
 import pint
 
@@ -91,50 +101,138 @@ log = logging.getLogger(__name__)
 
 
 def add_par_data(
-    scenario: message_ix.Scenario, data: "ParameterData", dry_run: bool = False
+    scenario: message_ix.Scenario,
+    data: "ParameterData | Iterable[tuple[str, pd.DataFrame]]",
+    dry_run: bool = False,
+    chunk_size: int | None = None,
 ) -> int:
     """Add `data` to `scenario`.
 
     Parameters
     ----------
     data
-        Any mapping with keys that are valid :mod:`message_ix` parameter names, and
-        values that are pd.DataFrame or other arguments valid for
-        :meth:`message_ix.Scenario.add_par`.
+        Either:
+
+        - Any mapping with keys that are valid :mod:`message_ix` parameter names, and
+          values that are pd.DataFrame or other arguments valid for
+          :meth:`message_ix.Scenario.add_par`.
+        - An iterable of 2-tuples of (parameter name, data), for instance a generator.
+          Data are added as they are produced, so the caller need not hold all data in
+          memory at once. The same parameter name may appear more than once.
     dry_run : optional
         Only show what would be done.
+    chunk_size : optional
+        If given, add at most this many rows in each call to
+        :meth:`~message_ix.Scenario.add_par`. Must be at least 1.
+
+    Before data are added, the "unit" column is normalized: empty strings are replaced
+    with "-", and :class:`pint.Unit` objects with their abbreviated string form. Each
+    distinct unit is handled once per parameter. The "value" column is converted to a
+    numeric type, if it is not one already. For each parameter, the number of rows,
+    rows added per second, and estimated peak size of the data in memory are logged.
+
+    Returns
+    -------
+    int
+        Total number of rows added.
 
     See also
     --------
     strip_par_data
     """
     # TODO optionally add units automatically
-    # TODO allow units column entries to be pint.Unit objects
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be None or ≥ 1; got {chunk_size!r}")
 
     total = 0
+    # Statistics for each parameter: rows, time elapsed, largest size in memory
+    stats: dict[str, list] = defaultdict(lambda: [0, 0.0, 0])
+    # Normalized units for each parameter, keyed by the original values
+    units: dict[str, dict[Any, Any]] = defaultdict(dict)
+
+    for par_name, values in data.items() if isinstance(data, Mapping) else data:
+        t0 = perf_counter()
 
-    for par_name, values in data.items():
         N = values.shape[0]
         log.info(f"{N} rows in {repr(par_name)}")
-        log.debug("\n" + values.to_string(max_rows=5))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("\n" + values.to_string(max_rows=5))
 
         total += N
+        stats[par_name][0] += N
+        stats[par_name][2] = max(stats[par_name][2], _memory_usage(values))
 
         if dry_run:
             continue
 
-        # Work around iiasa/ixmp#425
-        values["unit"] = values["unit"].str.replace("^$", "-", regex=True)
+        _normalize_par_data(values, units[par_name])
 
+        # Add all data at once, or in chunks of at most `chunk_size` rows
+        chunks = (
+            [values]
+            if chunk_size is None
+            else (values.iloc[i : i + chunk_size] for i in range(0, N, chunk_size))
+        )
         try:
-            scenario.add_par(par_name, values)
+            for chunk in chunks:
+                scenario.add_par(par_name, chunk)
         except Exception:  # pragma: no cover
             print(values.head())
             raise
 
+        stats[par_name][1] += perf_counter() - t0
+
+    if not dry_run:
+        for par_name, (N, seconds, size) in stats.items():
+            log.info(
+                f"{par_name!r}: {N} rows in {seconds:.2f} s ({N / (seconds or 1):.0f} "
+                f"rows/s); peak ≈ {size / 2**20:.1f} MiB in memory"
+            )
+
     return total
 
 
+def _memory_usage(values: pd.DataFrame, sample: int = 1000) -> int:
+    """Estimate the size of `values` in memory, in bytes.
+
+    This is like :py:`values.memory_usage(index=False, deep=True).sum()`, except the
+    size of the contents of object columns is estimated from the first `sample` rows.
+    Thus it is fast for large data.
+    """
+    result = values.memory_usage(index=False, deep=False)
+    head = values.iloc[:sample]
+    for col in values.select_dtypes(include=["object", "string"]).columns:
+        size = head[col].memory_usage(index=False, deep=True)
+        result[col] = size * len(values) // max(len(head), 1)
+    return int(result.sum())
+
+
+def _normalize_unit(unit: Any) -> Any:
+    """Return a normalized `unit` for :func:`_normalize_par_data`."""
+    if isinstance(unit, pint.Unit):
+        return f"{unit:~}" or "-"
+    # Work around iiasa/ixmp#425
+    return "-" if isinstance(unit, str) and unit == "" else unit
+
+
+def _normalize_par_data(values: pd.DataFrame, units: dict[Any, Any]) -> None:
+    """Normalize the "unit" and "value" columns of `values` in place.
+
+    `units` maps original to normalized units. Each distinct unit in `values` not
+    already in `units` is normalized with :func:`_normalize_unit` and added to it.
+    """
+    if "unit" in values.columns:
+        distinct = values["unit"].unique()
+        for u in filter(lambda u: u not in units, distinct):
+            units[u] = _normalize_unit(u)
+        # Replace the column only if ≥1 unit is changed
+        if any(units[u] is not u for u in distinct):
+            values["unit"] = values["unit"].map({u: units[u] for u in distinct})
+
+    if "value" in values.columns and values["value"].dtype.kind not in "fiu":
+        values["value"] = pd.to_numeric(values["value"])
+
+
 def aggregate_codes(df: pd.DataFrame, dim: str, codes):  # pragma: no cover
     """Aggregate `df` along dimension `dim` according to `codes`."""
     raise NotImplementedError
@@ -166,7 +264,8 @@ def broadcast(
     ----------
     labels : pandas.DataFrame
         Each column (dimension) corresponds to one in `df`. Each row represents one
-        matched set of labels for those dimensions.
+        matched set of labels for those dimensions. If `labels` has no rows, the
+        result has no rows.
     kwargs
         Keys are dimensions. Values are labels along that dimension to fill.
 
@@ -202,26 +301,29 @@ def broadcast(
     7   m1   node B          t    2.2
     """
 
+    # Dimensions filled by `labels`
+    filled: set[str] = set()
+
     def _check_dim(d):
         try:
-            if not df[d].isna().all():
+            if d in filled or not df[d].isna().all():
                 raise ValueError(f"Dimension {d} was not empty\n\n{df.head()}")
         except KeyError:
             raise ValueError(f"Dimension {d} not among {list(df.columns)}")
 
+    # Sets of labels to broadcast over; the first varies fastest in the result
+    factors = []
+
     # Broadcast using matched labels for 1+ dimensions from a data frame
     if labels is not None:
         # Check the dimensions
         for dim in labels.columns:
             _check_dim(dim)
-        # Concatenate 1 copy of `df` for each row in `labels`
-        df = pd.concat(
-            [df.assign(**row) for _, row in labels.iterrows()],
-            ignore_index=True,
-            sort=False,
-        )
+        filled.update(labels.columns)
+        factors.append(labels)
 
     # Next, broadcast other dimensions given as keyword arguments
+    dims: list[str] = []
     for dim, levels in kwargs.items():
         _check_dim(dim)
         if len(levels) == 0:
@@ -229,18 +331,32 @@ def broadcast(
                 f"Don't broadcast over {repr(dim)}; labels {levels} have length 0"
             )
             continue
+        dims.insert(0, dim)
+        factors.append(pd.DataFrame({dim: pd.Index(levels)}))
 
-        # - Duplicate the data
-        # - Drop the existing column named 'dim'
-        # - Re-add the column from the constructed MultiIndex
-        # - Reindex for sequential row numbers
-        df = (
-            pd.concat([df] * len(levels), keys=levels, names=[dim], sort=False)
-            .drop(dim, axis=1)
-            .reset_index(dim)
-            .reset_index(drop=True)
-        )
-    return df
+    if not factors:
+        return df
+
+    # Number of copies of `df`: 1 for each combination of labels
+    M = prod(map(len, factors))
+
+    # Duplicate the existing data, except broadcast dimensions. Construct each column
+    # of the result once, instead of copying all of `df` for each label.
+    i = np.tile(np.arange(len(df)), M)
+    data = {c: df[c].array.take(i) for c in df.columns if c not in dims}
+
+    # Fill the broadcast dimensions. Each label of each factor is repeated `inner`
+    # times, and this sequence is tiled to the length of the result.
+    inner = len(df)
+    for f in factors:
+        M //= max(len(f), 1)
+        i = np.tile(np.repeat(np.arange(len(f)), inner), M)
+        data.update({c: f[c].array.take(i) for c in f.columns})
+        inner *= len(f)
+
+    # Same column order as from repeated pd.concat(): broadcast dimensions first
+    columns = dims + [c for c in df.columns if c not in dims]
+    return pd.DataFrame({c: data[c] for c in columns})
 
 
 def check_support(context, settings=dict(), desc: str = "") -> None:
@@ -806,23 +922,35 @@ def show_versions() -> str:
     return buf.getvalue()
 
 
-# FIXME Reduce complexity from 14 to ≤13
 def strip_par_data(  # noqa: C901
     scenario: message_ix.Scenario,
     set_name: str,
-    element: str,
+    element: Any,
     dry_run: bool = False,
     dump: "MutableParameterData | None" = None,
+    batch: bool = False,
 ) -> int:
     """Remove `element` from `set_name` in scenario, optionally dumping to `dump`.
 
     Parameters
     ----------
+    element : str or sequence of str
+        Element to remove. For an indexed set, a sequence of labels, one per dimension.
+        If `batch` is :data:`True`, a collection of such elements.
     dry_run : bool, optional
         If :data:`True`, only show what would be done.
     dump : dict, optional
         If provided, stripped data are stored in this dictionary. Otherwise, they are
         discarded.
+    batch : bool, optional
+        If :data:`True`, remove all the elements in `element` together: for each
+        parameter, data for all the elements are retrieved with one call to
+        :meth:`.Scenario.par` per dimension indexed by `set_name` and removed with one
+        call to :meth:`.Scenario.remove_par`; then the elements are removed with one
+        call to :meth:`.Scenario.remove_set`. This is much faster than calling
+        :func:`strip_par_data` once per element, particularly with
+        :class:`ixmp.JDBCBackend` and a remote database. The number of rows removed
+        and an estimate of the time saved are logged.
 
     Returns
     -------
@@ -833,15 +961,24 @@ def strip_par_data(  # noqa: C901
     --------
     add_par_data
     """
+    elements = list(element) if batch else [element]
+    if not elements:
+        return 0
+
     par_list = scenario.par_list()
     no_data = set()  # Names of parameters with no data being stripped
     total = 0  # Total observations stripped
 
+    # Number of backend calls made, and that would be made by removing 1 element at a
+    # time. Used to estimate the time saved by `batch`.
+    calls = [0, 0]
+    t0 = perf_counter()
+
     if dump is None:
         pars: Iterable[str] = []  # Don't iterate over parameters unless dumping
     else:
         log.info(
-            f"Remove data with {set_name}={element!r}"
+            f"Remove data with {set_name}={elements if batch else element!r}"
             + (" (DRY RUN)" if dry_run else "")
         )
         # Iterate over parameters with ≥1 dimensions indexed by `set_name`
@@ -854,42 +991,52 @@ def strip_par_data(  # noqa: C901
             )
             continue
 
-        # Iterate over dimensions indexed by `set_name`
+        # Check for contents of par_name that include any of `elements`, once for each
+        # dimension indexed by `set_name`
+        idx_names = scenario.idx_names(par_name)
+        data = []
         for dim, _ in filter(
             lambda item: item[1] == set_name,
-            zip(scenario.idx_names(par_name), scenario.idx_sets(par_name)),
+            zip(idx_names, scenario.idx_sets(par_name)),
+        ):
+            data.append(scenario.par(par_name, filters={dim: elements}))
+            calls[0] += 1
+            # 1 call per element to retrieve; 1 more to remove, if there are any data
+            calls[1] += len(elements) + (0 if dry_run else data[-1][dim].nunique())
+
+        # Rows with `elements` in 2+ dimensions appear more than once
+        par_data = pd.concat(data, ignore_index=True)
+        if len(data) > 1:
+            par_data = par_data.drop_duplicates(subset=idx_names, ignore_index=True)
+
+        N = len(par_data)
+        total += N
+
+        if N == 0:
+            # No data; no need to do anything further
+            no_data.add(par_name)
+            continue
+        elif dump is not None:
+            dump[par_name] = pd.concat([dump.get(par_name, pd.DataFrame()), par_data])
+
+        log.info(f"  {N} rows in {par_name!r}")
+
+        # Show some debug info
+        for col in filter(
+            lambda c: c != set_name and c in par_data.columns,
+            ("commodity", "level", "technology"),
         ):
-            # Check for contents of par_name that include `element`
-            par_data = scenario.par(par_name, filters={dim: element})
-            N = len(par_data)
-            total += N
-
-            if N == 0:
-                # No data; no need to do anything further
-                no_data.add(par_name)
-                continue
-            elif dump is not None:
-                dump[par_name] = pd.concat(
-                    [dump.get(par_name, pd.DataFrame()), par_data]
-                )
-
-            log.info(f"  {N} rows in {par_name!r}")
-
-            # Show some debug info
-            for col in filter(
-                lambda c: c != set_name and c in par_data.columns,
-                ("commodity", "level", "technology"),
-            ):
-                log.info(f"  with {col}={sorted(par_data[col].unique())}")
-
-            if dry_run:
-                continue
-
-            # Actually remove the data
-            scenario.remove_par(par_name, key=par_data)
-
-            # NB would prefer to do the following, but raises an exception:
-            # scenario.remove_par(par_name, key={set_name: [value]})
+            log.info(f"  with {col}={sorted(par_data[col].unique())}")
+
+        if dry_run:
+            continue
+
+        # Actually remove the data
+        scenario.remove_par(par_name, key=par_data)
+        calls[0] += 1
+
+        # NB would prefer to do the following, but raises an exception:
+        # scenario.remove_par(par_name, key={set_name: [value]})
 
     if not dry_run and dump is not None:
         log.info(f"  {total} rows total")
@@ -897,13 +1044,53 @@ def strip_par_data(  # noqa: C901
         log.debug(f"No data removed from {len(no_data)} other parameters")
 
     if not dry_run:
-        log.info(f"Remove {element!r} from set {set_name!r}")
-        try:
-            scenario.remove_set(set_name, element)
-        except Exception as e:
-            if "does not have an element" in str(e):
-                log.info("  …not found")
-            else:  # pragma: no cover
-                raise
+        _remove_set_elements(scenario, set_name, elements)
+        calls[0] += 1
+        calls[1] += len(elements)
+
+    if batch and calls[0]:
+        # Estimate the time saved assuming a constant time per backend call
+        elapsed = perf_counter() - t0
+        saved = elapsed * (calls[1] / calls[0] - 1)
+        log.info(
+            f"  {total} rows {'to remove' if dry_run else 'removed'} for "
+            f"{len(elements)} elements in {elapsed:.1f} s; ≈{saved:.1f} s saved versus "
+            "1 element at a time"
+        )
 
     return total
+
+
+def _remove_set_elements(
+    scenario: message_ix.Scenario, set_name: str, elements: list
+) -> None:
+    """Remove `elements` from `set_name` with one call to :meth:`.remove_set`.
+
+    Elements not in the set are logged and skipped.
+    """
+    existing = scenario.set(set_name)
+    keys: list[Hashable]
+    if isinstance(existing, pd.DataFrame):
+        # Indexed set: each element is a sequence of labels
+        present = set(existing.itertuples(index=False, name=None))
+        keys = [tuple(map(str, e)) for e in elements]
+    else:
+        present = set(existing)
+        keys = [str(e) for e in elements]
+
+    found = [k for k in keys if k in present]
+    if len(keys) == 1:
+        log.info(f"Remove {keys[0]!r} from set {set_name!r}")
+    else:
+        log.info(f"Remove {len(found)} elements from set {set_name!r}")
+    if missing := [k for k in keys if k not in present]:
+        log.info("  …not found" + ("" if len(keys) == 1 else f": {missing}"))
+    if not found:
+        return
+
+    scenario.remove_set(
+        set_name,
+        pd.DataFrame(found, columns=existing.columns)
+        if isinstance(existing, pd.DataFrame)
+        else found,
+    )
@@ -0,0 +1,60 @@
+"""Locks on files shared between processes.
+
+:func:`file_lock` uses only the standard library, so that it works on every platform
+supported by :mod:`message_ix_models`. The lock is a separate file, created with
+:data:`os.O_EXCL` so that only one process can hold it at a time.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+
+@contextmanager
+def file_lock(
+    path: os.PathLike, *, timeout: float = 60.0, stale: float = 300.0
+) -> Iterator[None]:
+    """Hold an exclusive lock on `path` while the ``with`` block runs.
+
+    The lock is the file :file:`{path}.lock`. If this already exists, the caller waits
+    until it is removed by the process holding it.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Seconds to wait for the lock before raising :class:`TimeoutError`.
+    stale : float, optional
+        A lock file older than this many seconds is assumed to be left by a process
+        that ended without removing it, and is removed.
+    """
+    lock = Path(path).with_name(f"{Path(path).name}.lock")
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            pass
+
+        try:
+            if time.time() - lock.stat().st_mtime > stale:
+                log.warning(f"Remove stale lock {lock}")
+                lock.unlink(missing_ok=True)
+                continue
+        except FileNotFoundError:  # Removed by the process that held it
+            continue
+
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Could not acquire {lock} within {timeout} s")
+        time.sleep(0.01)
+
+    try:
+        yield
+    finally:
+        lock.unlink(missing_ok=True)
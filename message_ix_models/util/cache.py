@@ -6,26 +6,57 @@ included in the computed cache key:
 
 - :class:`sdmx.model.IdentifiableArtefact`, including :class:`.Code`: hashed as their
   string representation / ID.
+- :class:`.Quantity`, :class:`pandas.DataFrame`, and :class:`pandas.Series`: hashed
+  from the underlying arrays of labels and values, plus the name and units of a
+  Quantity.
 - :class:`ixmp.Platform`, :class:`xarray.Dataset`: ignored, with a warning logged.
 - :class:`.ScenarioInfo`: only the :attr:`~ScenarioInfo.set` entries are hashed.
+
+Each cached result is stored in a file named like :file:`{func}-{hash}.pickle` (or
+:file:`.parquet`) in :attr:`.Config.cache_path`, where `hash` is computed from the
+code of the function and its arguments, as by :func:`genno.caching.decorate`. Parquet
+datasets written with :meth:`Cache.write_dir` are directories with names of the same
+form. :class:`Cache` manages these files and directories: it lists them, records their
+use, and prunes them according to :attr:`.Config.cache_max_size` and
+:attr:`.Config.cache_max_age`, least recently used first. The :program:`mix-models
+cache` CLI command gives access to the same features.
 """
 
+import ast
 import json
 import logging
-from collections.abc import Callable
-from dataclasses import is_dataclass
+import multiprocessing.util
+import os
+import re
+import shutil
+import tempfile
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, is_dataclass
+from datetime import datetime, timedelta
 from enum import Enum
+from functools import update_wrapper
+from hashlib import blake2b
+from pathlib import Path
+from time import perf_counter
 from types import FunctionType
 
+import click
 import genno.caching
 import ixmp
+import numpy as np
+import pandas as pd
 import sdmx.model
 import xarray as xr
 from genno import Computer
+from genno.caching import hash_args, hash_code
 
 from message_ix_models.types import AnyQuantity
 
 from ._dataclasses import asdict
+from ._lock import file_lock
+from .config import parse_size
 from .context import Context
 from .scenarioinfo import ScenarioInfo
 
@@ -38,8 +69,61 @@ COMPUTER = Computer()
 # Show genno how to hash function arguments seen in message_ix_models
 
 
+def _update_array(h: "blake2b", values) -> None:
+    """Update `h` with the dtype and contents of the 1-D array-like `values`."""
+    arr = values if isinstance(values, np.ndarray) else np.asarray(values)
+    if arr.dtype.kind in "biufcmM":
+        # Numeric, boolean, or datetime: the raw buffer
+        h.update(arr.dtype.str.encode())
+        h.update(np.ascontiguousarray(arr).view(np.uint8).data)
+    else:
+        # Strings, other objects, or pandas extension types: pandas' own hash of each
+        # element, which does not depend on the Python session
+        s = pd.Series(values, copy=False)
+        h.update(str(s.dtype).encode())
+        h.update(pd.util.hash_pandas_object(s, index=False).to_numpy())
+
+
+def _hash_pandas(o: pd.Series | pd.DataFrame, *extra: str) -> str:
+    """Return a hash of the index and values of `o`, plus `extra` strings.
+
+    The index and values are hashed from the underlying :mod:`numpy` arrays, without
+    constructing Python objects for each element. For a :class:`pandas.MultiIndex`,
+    the hash is of the labels on each level and the integer codes that refer to them,
+    after removing unused labels—for instance, those left after selecting a subset.
+    """
+    h = blake2b(digest_size=20)
+    for item in (type(o).__name__,) + extra + tuple(map(str, o.index.names)):
+        h.update(item.encode() + b"\0")
+
+    # Index
+    if isinstance(o.index, pd.MultiIndex):
+        index = o.index.remove_unused_levels()
+        for level, codes in zip(index.levels, index.codes):
+            _update_array(h, level)
+            _update_array(h, codes)
+    else:
+        _update_array(h, o.index)
+
+    # Values
+    if isinstance(o, pd.DataFrame):
+        for name, column in o.items():
+            h.update(str(name).encode() + b"\0")
+            _update_array(h, column.array)
+    else:
+        _update_array(h, o.array)
+
+    return h.hexdigest()
+
+
+@genno.caching.Encoder.register(pd.DataFrame)
+@genno.caching.Encoder.register(pd.Series)
+def _pandas(o: pd.DataFrame | pd.Series):
+    return _hash_pandas(o)
+
+
 def _quantity(o: "AnyQuantity"):
-    return tuple(o.to_series().to_dict())
+    return _hash_pandas(o.to_series(), str(o.name), f"{o.units}")
 
 
 try:
@@ -93,6 +177,307 @@ def _si(o: ScenarioInfo):
 genno.caching.Encoder.ignore(xr.DataArray, xr.Dataset, ixmp.Platform)
 
 
+#: Name of the file in :attr:`.Config.cache_path` with information about entries.
+INDEX = "_index.json"
+
+#: Expression matching names of cache files. These are the names used by
+#: :func:`genno.caching.decorate`, and by :meth:`Cache.write_dir` for directories.
+ENTRY_EXPR = re.compile(
+    r"(?P<func>.+)-(?P<hash>[0-9a-f]{40})\.(?P<format>parquet|pickle|pkl)"
+)
+
+#: Number of recorded uses of cache files after which :meth:`Cache.record` writes them
+#: to :data:`INDEX`. Other uses are written at the end of the process.
+FLUSH_EVERY = 100
+
+
+@dataclass
+class Stats:
+    """Cache statistics for one function."""
+
+    #: Number of calls that returned cached data.
+    hits: int = 0
+    #: Number of calls that ran the function and cached the result.
+    misses: int = 0
+    #: Total size of cache files read and written, in bytes.
+    bytes_read: int = 0
+    bytes_written: int = 0
+    #: Total time saved by cache hits, in seconds: the time taken to compute the
+    #: cached data, less the time to load it.
+    time_saved: float = 0.0
+
+
+#: Statistics for the current process, keyed by function name.
+STATS: dict[str, Stats] = defaultdict(Stats)
+
+#: Contents of :data:`INDEX` in each cache directory, as last read or written by this
+#: process, plus recorded uses not yet written. See :meth:`Cache.record`.
+_INDEX: dict[Path, dict[str, dict]] = dict()
+
+#: Uses of cache files recorded by this process and not yet written to :data:`INDEX`.
+_PENDING: dict[Path, dict[str, dict]] = defaultdict(dict)
+
+
+class Cache:
+    """Manage the files in a cache directory.
+
+    Parameters
+    ----------
+    path : os.PathLike, optional
+        Cache directory. Default: the current :attr:`.Config.cache_path`.
+    """
+
+    def __init__(self, path: os.PathLike | None = None):
+        self.path = Path(path or COMPUTER.graph["config"]["cache_path"])
+
+    def _read_index(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.joinpath(INDEX).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return dict()
+
+    def record(
+        self,
+        name: str,
+        *,
+        compute_time: float | None = None,
+        load_time: float | None = None,
+    ) -> float:
+        """Record a use of the cache file `name`.
+
+        Either `compute_time` or `load_time` is given:
+
+        - `compute_time`: the file was (re)written, with data that took this many
+          seconds to compute.
+        - `load_time`: the file was used instead of computing the data, and took this
+          many seconds to load.
+
+        Uses with `compute_time` are written to :data:`INDEX` at once, so that hits
+        recorded later by other processes are counted. Uses with `load_time` are kept
+        in memory, and written by :meth:`flush`: after :data:`FLUSH_EVERY` uses, and at
+        the end of the process.
+
+        Returns
+        -------
+        float
+            For a use with `load_time`, the seconds saved; otherwise 0.
+        """
+        if self.path not in _INDEX:
+            _INDEX[self.path] = self._read_index()
+        info = _INDEX[self.path].setdefault(name, {})
+        pending = _PENDING[self.path].setdefault(name, dict(hits=0, time_saved=0.0))
+
+        if compute_time is not None:
+            info.update(compute_time=compute_time, hits=0, time_saved=0.0)
+            pending.update(compute_time=compute_time, hits=0, time_saved=0.0)
+            self.flush()
+            return 0.0
+
+        saved = info.get("compute_time", 0.0) - (load_time or 0.0)
+        for d in info, pending:
+            d.update(
+                hits=d.get("hits", 0) + 1, time_saved=d.get("time_saved", 0) + saved
+            )
+
+        if sum(map(len, _PENDING.values())) >= FLUSH_EVERY:
+            self._maintain()
+        return saved
+
+    def flush(self, discard: Iterable[str] = ()) -> None:
+        """Write uses recorded by :meth:`record` to :data:`INDEX`.
+
+        The index file is locked while it is updated, so that uses recorded by other
+        processes using the same cache directory are kept. Entries for the files named
+        in `discard` are removed.
+        """
+        pending = _PENDING.pop(self.path, {})
+        if not (pending or discard):
+            return
+
+        index_path = self.path.joinpath(INDEX)
+        with file_lock(index_path):
+            index = self._read_index()
+            for name, values in pending.items():
+                info = index.setdefault(name, {})
+                if "compute_time" in values:  # File was (re)written; discard old info
+                    info.clear()
+                info.update(
+                    values,
+                    hits=info.get("hits", 0) + values["hits"],
+                    time_saved=info.get("time_saved", 0.0) + values["time_saved"],
+                )
+            for name in discard:
+                index.pop(name, None)
+
+            # Write to a temporary file, then replace, so the index is never incomplete
+            tmp = index_path.with_name(f"{INDEX}.{os.getpid()}")
+            tmp.write_text(json.dumps(index, indent=2))
+            tmp.replace(index_path)
+        _INDEX[self.path] = index
+
+    def _maintain(self) -> None:
+        """:meth:`flush`; then :meth:`prune`, if limits are configured."""
+        self.flush()
+        config = COMPUTER.graph["config"]
+        max_size, max_age = config.get("cache_max_size"), config.get("cache_max_age")
+        if max_size is not None or max_age is not None:
+            self.prune(max_size=max_size, max_age=max_age)
+
+    def entries(self) -> pd.DataFrame:
+        """Return information about cached data.
+
+        Returns
+        -------
+        pandas.DataFrame
+            with one row per cache file or directory, sorted from least to most
+            recently used, and the columns:
+
+            - "name": file name.
+            - "func": name of the cached function.
+            - "format": "parquet" or "pickle".
+            - "size": size in bytes; for a directory, the total of the files in it.
+            - "used": time of the last write or cache hit.
+            - "compute_time": seconds taken to compute the data, if known.
+            - "hits": number of cache hits recorded, if known.
+            - "time_saved": seconds saved by the recorded cache hits, if known.
+        """
+        self.flush()
+        index = self._read_index()
+        columns = "name func format size used compute_time hits time_saved".split()
+
+        data = []
+        for path in self.path.iterdir() if self.path.exists() else []:
+            if not (match := ENTRY_EXPR.fullmatch(path.name)):
+                continue
+            stat = path.stat()
+            size = (
+                sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+                if path.is_dir()
+                else stat.st_size
+            )
+            info = index.get(path.name, {})
+            data.append(
+                [
+                    path.name,
+                    match.group("func"),
+                    match.group("format"),
+                    size,
+                    datetime.fromtimestamp(stat.st_mtime),
+                    info.get("compute_time", float("nan")),
+                    info.get("hits", 0),
+                    info.get("time_saved", 0.0),
+                ]
+            )
+
+        return (
+            pd.DataFrame(data, columns=columns)
+            .sort_values(["used", "name"])
+            .reset_index(drop=True)
+        )
+
+    def prune(
+        self,
+        max_size: int | None = None,
+        max_age: float | None = None,
+        dry_run: bool = False,
+    ) -> list[Path]:
+        """Delete cache files to stay within a size and age budget.
+
+        Files not used within `max_age` days are deleted. Then, if the total size of
+        the remaining files exceeds `max_size` bytes, files are deleted in order from
+        least to most recently used until it does not.
+
+        Returns
+        -------
+        list of Path
+            Files deleted (or, with `dry_run`, to be deleted).
+        """
+        entries = self.entries()
+
+        # Files older than max_age
+        remove = pd.Series(False, index=entries.index)
+        if max_age is not None:
+            remove |= entries["used"] < datetime.now() - timedelta(days=max_age)
+
+        # Least recently used files beyond max_size, counting from the most recent
+        if max_size is not None:
+            size = entries["size"].where(~remove, 0)[::-1].cumsum()[::-1]
+            remove |= size > max_size
+
+        result = [self.path.joinpath(name) for name in entries["name"][remove]]
+        N, total = len(result), entries["size"][remove].sum()
+        log.info(
+            f"{'(DRY RUN) ' if dry_run else ''}Remove {N} cache files, {total} bytes"
+        )
+
+        if not dry_run:
+            for path in result:
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+            # Also discard index entries for files removed by other means
+            self.flush(discard=set(self._read_index()) - set(entries["name"][~remove]))
+
+        return result
+
+    @contextmanager
+    def write_dir(self, name: str) -> Iterator[Path]:
+        """Write a directory entry `name`, for instance a Parquet dataset.
+
+        Yields a new, empty temporary directory in :attr:`path`. If the block completes
+        without error, the temporary directory is renamed to `name`, so that the entry
+        is never incomplete, and the time taken is recorded with :meth:`record`. If
+        another process has meanwhile written `name`, its entry is kept and the
+        temporary directory is discarded.
+
+        Example
+        -------
+        >>> cache = Cache()
+        >>> path = cache.path.joinpath(f"my_func-{key}.parquet")
+        >>> if not path.exists():
+        ...     with cache.write_dir(path.name) as tmp:
+        ...         pyarrow.dataset.write_dataset(data, tmp, format="parquet")
+        """
+        path = self.path.joinpath(name)
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=self.path, prefix=f"{name}."))
+        t0 = perf_counter()
+        try:
+            yield tmp
+            compute_time = perf_counter() - t0
+            try:
+                tmp.rename(path)
+            except OSError:
+                if not path.exists():
+                    raise
+                log.info(f"Keep {name} written by another process")
+            else:
+                self.record(name, compute_time=compute_time)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _at_exit() -> None:
+    """Flush and prune every cache directory with uses recorded by this process."""
+    for path in list(_PENDING):
+        try:
+            Cache(path)._maintain()
+        except Exception as e:  # pragma: no cover
+            log.warning(f"Could not update {path.joinpath(INDEX)}: {e!r}")
+
+
+def _register_at_exit(*args) -> None:
+    # In a forked child process, uses recorded by the parent are written by the parent
+    _PENDING.clear()
+    # Unlike atexit, this also runs at the end of multiprocessing child processes
+    multiprocessing.util.Finalize(None, _at_exit, exitpriority=10)
+
+
+_register_at_exit()
+multiprocessing.util.register_after_fork(_at_exit, _register_at_exit)
+
+
 def cached(func: Callable) -> Callable:
     """Decorator to cache the return value of a function `func`.
 
@@ -102,12 +487,68 @@ def cached(func: Callable) -> Callable:
 
     When :attr:`.Config.cache_skip` is :any:`True`, `func` is always called.
 
+    Cache files are named and written as by :func:`genno.caching.decorate`, except
+    that each file is first written in a temporary directory, then moved into place, so
+    that other processes never read an incomplete file. Each call
+    is counted in :data:`STATS`, and recorded using :meth:`.Cache.record`. If
+    :attr:`.Config.cache_max_size` or :attr:`.Config.cache_max_age` is set, the cache
+    is pruned after every :data:`.FLUSH_EVERY` uses, and at the end of the process.
+
     See also
     --------
     :doc:`genno:cache` in the :mod:`genno` documentation
     """
-    # Use the genno internals to wrap the function
-    cached_load = genno.caching.decorate(func, computer=COMPUTER)
+    # Hash of the function code: changes to the code give different cache keys
+    code_hash = hash_code(func)
+    name = func.__name__
+
+    def cached_load(*args, **kwargs):
+        config = COMPUTER.graph["config"]
+        cache = Cache(config["cache_path"])
+
+        # Same file name as genno.caching.decorate()
+        key = hash_args(*args, code_hash, **kwargs)
+        base = cache.path.joinpath(f"{name}-{key}")
+        short_name = f"{name}(<{key[:8]}…>)"
+        stats = STATS[name]
+
+        path = None
+        if not config.get("cache_skip", False):
+            path = next(
+                filter(Path.exists, map(base.with_suffix, (".parquet", ".pickle"))),
+                None,
+            )
+
+        if path:
+            log.info(f"Cache hit for {short_name}")
+            t0 = perf_counter()
+            data = genno.caching._read(path)
+            os.utime(path)  # Mark as recently used
+
+            stats.hits += 1
+            stats.bytes_read += path.stat().st_size
+            stats.time_saved += cache.record(path.name, load_time=perf_counter() - t0)
+            return data
+
+        log.info(f"Cache miss for {short_name}")
+        t0 = perf_counter()
+        data = func(*args, **kwargs)
+        elapsed = perf_counter() - t0
+
+        # Write to a temporary directory, then replace, so the file is never incomplete
+        cache.path.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=cache.path) as tmp:
+            genno.caching._write(Path(tmp, base.name), data)
+            written = next(Path(tmp).iterdir())
+            path = base.with_suffix(written.suffix)
+            os.replace(written, path)
+        stats.misses += 1
+        stats.bytes_written += path.stat().st_size
+        cache.record(path.name, compute_time=elapsed)
+
+        return data
+
+    update_wrapper(cached_load, func)
 
     if cached_load.__doc__ is not None:
         # Determine the indent
@@ -121,3 +562,84 @@ def cached(func: Callable) -> Callable:
         )
 
     return cached_load
+
+
+@click.group("cache")
+def cli():
+    """Manage cached data.
+
+    Data are cached in files under the directory given by --cache-path.
+    """
+
+
+@cli.command("list")
+@click.option("--func", help="Show only entries for this function.")
+def list_(func):
+    """List cache entries and statistics per function."""
+    entries = Cache().entries()
+    if func:
+        entries = entries.query("func == @func")
+
+    with pd.option_context("display.max_rows", None, "display.width", None):
+        print(entries.to_string(index=False))
+        print(
+            "\nTotals per function:\n",
+            entries.groupby("func")[["size", "hits", "time_saved"]]
+            .sum()
+            .assign(entries=entries.groupby("func").size())
+            .to_string(),
+        )
+
+
+@cli.command("inspect")
+@click.argument("name")
+def inspect_(name):
+    """Show information about and contents of the cache file NAME."""
+    entries = Cache().entries().set_index("name")
+    print(entries.loc[name].to_string(), "", sep="\n")
+    print(repr(genno.caching._read(Cache().path.joinpath(name))))
+
+
+@cli.command("prune")
+@click.option("--max-size", help="Maximum total size, e.g. 50G.")
+@click.option("--max-age", type=float, help="Maximum days since last use.")
+@click.option("--dry-run", is_flag=True, help="Only show what would be removed.")
+@click.pass_obj
+def prune(context, max_size, max_age, dry_run):
+    """Remove least recently used cache entries.
+
+    Default limits are from the configuration; see Config.cache_max_size and
+    .cache_max_age.
+    """
+    core = context.core
+    for path in Cache().prune(
+        max_size=core.cache_max_size if max_size is None else parse_size(max_size),
+        max_age=core.cache_max_age if max_age is None else max_age,
+        dry_run=dry_run or context.dry_run,
+    ):
+        print(path.name)
+
+
+@cli.command("warm")
+@click.argument("func")
+@click.argument("kwargs", nargs=-1)
+def warm(func, kwargs):
+    """Populate the cache by calling FUNC.
+
+    FUNC is the fully-qualified name of a function decorated with @cached, for
+    instance "message_ix_models.tools.iea.web.load_data". KWARGS are key=value pairs;
+    values are parsed as Python literals, for instance 1, [1, 2], or "a", and otherwise
+    used as strings.
+    """
+    from importlib import import_module
+
+    def _parse(value: str):
+        try:
+            return ast.literal_eval(value)
+        except (SyntaxError, ValueError):
+            return value
+
+    module_name, name = func.rsplit(".", maxsplit=1)
+    f = getattr(import_module(module_name), name)
+    f(**{k: _parse(v) for k, v in (arg.split("=", 1) for arg in kwargs)})
+    print(STATS[f.__name__])
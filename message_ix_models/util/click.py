@@ -205,6 +205,79 @@ def scenario_param(
     return decorator
 
 
+class LazyGroup(click.Group):
+    """:class:`click.Group` that imports the modules providing subcommands when needed.
+
+    Subcommands in :attr:`lazy_commands` are listed with their help text, for instance
+    by ``--help``, without importing the modules that provide them. A module is
+    imported only when its subcommand is invoked, or its own help is requested.
+    """
+
+    #: Mapping from subcommand names to (module name, short help text). Each module
+    #: must contain a :class:`click.Command` or :class:`click.Group` named ``cli``.
+    lazy_commands: dict[str, tuple[str, str]]
+
+    #: Function to call, once, to add further commands to the group when
+    #: :meth:`list_commands` is called or a command name is not found.
+    add_extra: Callable[["LazyGroup"], None] | None
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.lazy_commands = kwargs.pop("lazy_commands", {})
+        self.add_extra = kwargs.pop("add_extra", None)
+        super().__init__(*args, **kwargs)
+
+    def _add_extra(self) -> None:
+        if self.add_extra is not None:
+            func, self.add_extra = self.add_extra, None
+            func(self)
+
+    def _load(self, name: str) -> None:
+        """Import the module for command `name` and add its ``cli`` command."""
+        from importlib import import_module
+
+        module_name = self.lazy_commands[name][0]
+        try:
+            module = import_module(module_name)
+        except ImportError as e:
+            log.warning(f"{module_name} not available: {e}")
+            return
+
+        self.add_command(getattr(module, "cli"), name)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        self._add_extra()
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands:
+            if cmd_name in self.lazy_commands:
+                self._load(cmd_name)
+            else:
+                self._add_extra()
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # Same as click.Group.format_commands(), except using help text from
+        # `lazy_commands` for commands not yet loaded
+        names = self.list_commands(ctx)
+        limit = formatter.width - 6 - max(map(len, names), default=0)
+
+        rows = []
+        for name in names:
+            if cmd := self.commands.get(name):
+                if cmd.hidden:
+                    continue
+                rows.append((name, cmd.get_short_help_str(limit)))
+            else:
+                rows.append((name, self.lazy_commands[name][1]))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
 def store_context(context: click.Context | Context, param, value):
     """Callback that simply stores a value on the :class:`.Context` object.
 
@@ -1,7 +1,8 @@
 import logging
 import os
 import pickle
-from collections.abc import Iterator, Mapping, MutableMapping, Sequence
+import re
+from collections.abc import Callable, Iterator, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field, fields, is_dataclass, replace
 from hashlib import blake2s
 from pathlib import Path
@@ -38,6 +39,27 @@ def _cache_path_factory() -> Path:
     )
 
 
+def parse_size(value: str | int) -> int:
+    """Parse a size like "500M" or "20 GB" to a number of bytes."""
+    if isinstance(value, int):
+        return value
+    match = re.fullmatch(r"\s*([\d.]+)\s*([kKMGT]?)i?B?\s*", value)
+    if not match:
+        raise ValueError(f"Cannot parse size {value!r}")
+    number, prefix = match.groups()
+    return int(float(number) * 1024 ** "BKMGT".index(prefix.upper() or "B"))
+
+
+def _cache_limit_factory(name: str, parse: Callable) -> Callable[[], Any]:
+    """Default value for :attr:`.Config.cache_max_size` or `cache_max_age`."""
+
+    def _factory():
+        value = os.environ.get(f"MESSAGE_MODELS_CACHE_MAX_{name}", "")
+        return parse(value) if value else None
+
+    return _factory
+
+
 def _local_data_factory(*parts: str) -> Path:
     """Default value for :attr:`.Config.local_data."""
     from platformdirs import user_data_path
@@ -214,6 +236,14 @@ class Config:
     # See cache_skip(), below
     _cache_skip: bool = False
 
+    # See cache_max_age() and cache_max_size(), below
+    _cache_max_age: float | None = field(
+        default_factory=_cache_limit_factory("AGE", float)
+    )
+    _cache_max_size: int | None = field(
+        default_factory=_cache_limit_factory("SIZE", parse_size)
+    )
+
     #: Paths of files containing debug outputs. See
     #: :meth:`.Context.write_debug_archive`.
     debug_paths: Sequence[Path] = field(default_factory=list)
@@ -268,7 +298,11 @@ class Config:
     def __post_init__(self):
         from . import cache
 
-        cache.COMPUTER.graph["config"]["cache_path"] = self._cache_path
+        cache.COMPUTER.graph["config"].update(
+            cache_path=self._cache_path,
+            cache_max_age=self._cache_max_age,
+            cache_max_size=self._cache_max_size,
+        )
 
     def __deepcopy__(self, memo):
         # Hide "_mp" from the copy
@@ -314,6 +348,40 @@ class Config:
 
         cache.COMPUTER.graph["config"]["cache_skip"] = self._cache_skip = value
 
+    @property
+    def cache_max_age(self) -> float | None:
+        """Maximum age of cached data, in days since last use.
+
+        If set, older cache files are removed when uses of cached data are recorded;
+        see :meth:`.Cache.record`.
+        The default is from the environment variable
+        :envvar:`MESSAGE_MODELS_CACHE_MAX_AGE`, if set. See :meth:`.Cache.prune`.
+        """
+        return self._cache_max_age
+
+    @cache_max_age.setter
+    def cache_max_age(self, value: float | None) -> None:
+        from . import cache
+
+        cache.COMPUTER.graph["config"]["cache_max_age"] = self._cache_max_age = value
+
+    @property
+    def cache_max_size(self) -> int | None:
+        """Maximum total size of cached data, in bytes.
+
+        If set, the least recently used cache files are removed when uses of cached
+        data are recorded, until the total size is within this limit. The default is
+        from the environment variable :envvar:`MESSAGE_MODELS_CACHE_MAX_SIZE`, if set,
+        for instance "50G". See :meth:`.Cache.prune`.
+        """
+        return self._cache_max_size
+
+    @cache_max_size.setter
+    def cache_max_size(self, value: int | None) -> None:
+        from . import cache
+
+        cache.COMPUTER.graph["config"]["cache_max_size"] = self._cache_max_size = value
+
     def close_db(self) -> None:
         """Close the database connection for the Platform given by :meth:`get_platform`.
 
@@ -1,4 +1,11 @@
+import json
+import os
 from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 #: Mapping from common, non-standard country names to exact field values occurring in
 #: the ISO 3166-1 database.
@@ -16,8 +23,68 @@ COUNTRY_NAME = {
     "Turkey": "Türkiye",
 }
 
+#: Name of the file in :attr:`.Config.cache_path` storing results of lookups by
+#: :func:`to_iso_3166_alpha_3`.
+MEMO = "pycountry-alpha_3.json"
+
+#: Results of lookups, keyed by name. Loaded from :data:`MEMO` on first use.
+_memo: dict[str, str | None] = {}
+
+#: Names added to :data:`_memo` and not yet written to :data:`MEMO`.
+_unsaved: set[str] = set()
+
+
+def _memo_path() -> Path | None:
+    """Return the path to the :data:`MEMO` file, or :any:`None` to not use it."""
+    from message_ix_models.util.cache import COMPUTER
+
+    config = COMPUTER.graph["config"]
+    return None if config.get("cache_skip") else Path(config["cache_path"], MEMO)
+
+
+def _read_memo(path: Path) -> dict[str, str | None]:
+    """Read the :data:`MEMO` file at `path`, if written by the installed pycountry."""
+    from importlib.metadata import version
+
+    try:
+        data = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return data["names"] if data.get("pycountry") == version("pycountry") else {}
+
+
+def _write_memo(path: Path) -> None:
+    """Merge unsaved entries in :data:`_memo` into the :data:`MEMO` file at `path`."""
+    from importlib.metadata import version
+
+    # Re-read, in case another process has written the file
+    names = _read_memo(path)
+    names.update({k: _memo[k] for k in _unsaved})
+
+    # Write to a temporary file, then replace, so the memo is never incomplete
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}")
+    tmp.write_text(json.dumps(dict(pycountry=version("pycountry"), names=names)))
+    tmp.replace(path)
+    _unsaved.clear()
+
 
 @lru_cache(maxsize=2**9)
+def _lookup(name: str) -> str | None:
+    """Look up `name` in the :mod:`pycountry` databases."""
+    from pycountry import countries, historic_countries
+
+    # Use pycountry's built-in, case-insensitive lookup on all fields including name,
+    # official_name, and common_name
+    for db in (countries, historic_countries):
+        try:
+            return db.lookup(name).alpha_3
+        except LookupError:
+            continue  # Not found in `db`, e.g. countries; try again
+
+    return None
+
+
 def iso_3166_alpha_3(name: str) -> str | None:
     """Return an ISO 3166 alpha-3 code for a country `name`.
 
@@ -32,18 +99,65 @@ def iso_3166_alpha_3(name: str) -> str | None:
     Returns
     -------
     str or None
-    """
-    from pycountry import countries, historic_countries
 
+    See also
+    --------
+    to_iso_3166_alpha_3
+    """
     # Maybe map a known, non-standard value to a standard value
     name = COUNTRY_NAME.get(name, name)
 
-    # Use pycountry's built-in, case-insensitive lookup on all fields including name,
-    # official_name, and common_name
-    for db in (countries, historic_countries):
-        try:
-            return db.lookup(name).alpha_3
-        except LookupError:
-            continue  # Not found in `db`, e.g. countries; try again
+    try:
+        return _memo[name]
+    except KeyError:
+        return _lookup(name)
 
-    return None
+
+def to_iso_3166_alpha_3(
+    values: "pd.Series", *, missing: Literal["keep", "discard"] = "discard"
+) -> "pd.Series":
+    """Map country names in `values` to ISO 3166 alpha-3 codes.
+
+    This gives the same result as :py:`values.apply(iso_3166_alpha_3)`, but looks up
+    each distinct label in `values` only once. Results of lookups are also stored in
+    the file :data:`MEMO` in :attr:`.Config.cache_path`, and reused by later calls in
+    the same or other processes. The memo is discarded if the installed version of
+    :mod:`pycountry` changes, and is not used if :attr:`.Config.cache_skip` is set.
+
+    Parameters
+    ----------
+    values :
+        Country names.
+    missing :
+        If "discard" (default), labels that are not found are mapped to :any:`None`.
+        If "keep", such labels are preserved.
+
+    Returns
+    -------
+    pandas.Series
+        with the same index as `values`.
+    """
+    import numpy as np
+    import pandas as pd
+
+    path = _memo_path()
+    if path and not _memo:
+        _memo.update(_read_memo(path))
+
+    # Integer codes for each row; the distinct labels in `values`
+    codes, labels = pd.factorize(values)
+
+    result = []
+    for label in labels:
+        name = COUNTRY_NAME.get(label, label)
+        if name not in _memo:
+            _memo[name] = _lookup(name)
+            _unsaved.add(name)
+        result.append(_memo[name] or (label if missing == "keep" else None))
+
+    if path and _unsaved:
+        _write_memo(path)
+
+    # Missing values in `values` have code -1, thus the last element, None
+    mapped = np.array(result + [None], dtype=object)
+    return pd.Series(mapped[codes], index=values.index, name=values.name)
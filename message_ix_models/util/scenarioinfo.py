@@ -1,6 +1,8 @@
 """:class:`.ScenarioInfo` class."""
 
 import logging
+import os
+import pickle
 import re
 from collections import defaultdict
 from dataclasses import InitVar, dataclass, field
@@ -13,12 +15,43 @@ import sdmx.model.v21 as sdmx_model
 from ixmp.util import parse_url
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
     from message_ix import Scenario
 
 log = logging.getLogger(__name__)
 
+#: Attributes of :class:`ScenarioInfo` stored in snapshots.
+SNAPSHOT_ATTRS = ("set", "par", "y0", "is_message_macro", "_yv_ya")
+
+
+def _extend_unique(existing: list, values: "Iterable") -> None:
+    """Extend `existing` with the elements of `values` that are not in it.
+
+    Equivalent to :py:`existing.extend(filter(lambda v: v not in existing, values))`,
+    but membership is checked using a hash index instead of scanning `existing`.
+    Elements that are not hashable are compared by scanning the other such elements.
+    """
+    seen = set()
+    unhashable = []
+    for v in existing:
+        try:
+            seen.add(v)
+        except TypeError:
+            unhashable.append(v)
+
+    for v in values:
+        try:
+            if v in seen:
+                continue
+            seen.add(v)
+        except TypeError:
+            if v in unhashable:
+                continue
+            unhashable.append(v)
+        existing.append(v)
+
 
 # FIXME the .. autosummary part does not render correctly in VSCode preview
 @dataclass(kw_only=True)
@@ -48,6 +81,13 @@ class ScenarioInfo:
     ----------
     scenario_obj : message_ix.Scenario
         If given, :attr:`.set` is initialized from this existing scenario.
+    snapshot : bool, optional
+        If :obj:`True` and `scenario_obj` is given, read structure information from a
+        snapshot file in :attr:`.Config.cache_path`, keyed by the platform name, model
+        name, scenario name, version, and :meth:`~ixmp.TimeSeries.last_update` of
+        `scenario_obj`. If there is no such file, the information is read from
+        `scenario_obj` and then stored. Only use this for scenarios that will not be
+        modified while checked out, for instance scenarios with a solution.
 
     Examples
     --------
@@ -65,6 +105,7 @@ class ScenarioInfo:
     # Parameters for initialization only
     scenario_obj: InitVar["Scenario | None"] = field(default=None, kw_only=False)
     empty: InitVar[bool] = False
+    snapshot: InitVar[bool] = False
 
     platform_name: str | None = None
 
@@ -91,7 +132,9 @@ class ScenarioInfo:
 
     _yv_ya: pd.DataFrame | None = None
 
-    def __post_init__(self, scenario_obj: "Scenario | None", empty: bool):
+    def __post_init__(
+        self, scenario_obj: "Scenario | None", empty: bool, snapshot: bool
+    ):
         if not scenario_obj:
             return
 
@@ -103,7 +146,13 @@ class ScenarioInfo:
 
         if empty:
             return
+        elif snapshot and self.version is not None:
+            self._read_snapshot(scenario_obj)
+        else:
+            self._read(scenario_obj)
 
+    def _read(self, scenario_obj: "Scenario") -> None:
+        """Read structure information from `scenario_obj`."""
         # Copy structure (set contents)
         for name in scenario_obj.set_list():
             value = scenario_obj.set(name)
@@ -124,6 +173,39 @@ class ScenarioInfo:
 
         self._yv_ya = scenario_obj.vintage_and_active_years()
 
+    def _read_snapshot(self, scenario_obj: "Scenario") -> None:
+        """Read structure information from a snapshot of `scenario_obj` on disk.
+
+        The snapshot is written, using :meth:`_read`, if it does not exist.
+        """
+        from genno.caching import hash_args
+
+        from .cache import COMPUTER
+
+        key = hash_args(
+            scenario_obj.platform.name,
+            self.model,
+            self.scenario,
+            self.version,
+            scenario_obj.last_update(),
+        )
+        config = COMPUTER.graph["config"]
+        path = config["cache_path"].joinpath(f"scenarioinfo-{key}.pkl")
+
+        if path.exists() and not config.get("cache_skip", False):
+            log.debug(f"Read structure of {self.url} from {path}")
+            self.__dict__.update(pickle.loads(path.read_bytes()))
+            return
+
+        self._read(scenario_obj)
+
+        # Write to a temporary file, then replace, so the file is never incomplete
+        data = {k: getattr(self, k) for k in SNAPSHOT_ATTRS}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}")
+        tmp.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp.replace(path)
+
     @classmethod
     def from_path(
         cls, path: "Path", model_pattern: str = ".*", scenario_pattern: str = ".*"
@@ -208,11 +290,13 @@ class ScenarioInfo:
         return reduce(lambda s, e: e[0].sub(e[1], s), self._path_re, self.url)
 
     def update(self, other: "ScenarioInfo"):
-        """Update with the set elements of `other`."""
+        """Update with the set elements of `other`.
+
+        Elements of each set in `other` that are not already present are appended, in
+        order. This takes time linear in the total number of elements.
+        """
         for name, data_list in other.set.items():
-            self.set[name].extend(
-                filter(lambda id: id not in self.set[name], data_list)
-            )
+            _extend_unique(self.set[name], data_list)
 
         for name, data_frame in other.par.items():
             log.warning(f"Not implemented: merging parameter data for {name!r}")
@@ -1,27 +1,142 @@
 """Tools for modeling workflows."""
 
+import json
 import logging
+import os
 import re
 from collections.abc import Callable, Mapping
+from copy import deepcopy
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from time import sleep
 from typing import TYPE_CHECKING, Literal, overload
 
+import genno.caching
 from genno import Computer
 from ixmp.util import parse_url
 from message_ix import Scenario
 
+import message_ix_models.util.cache  # noqa: F401  Hashing of message_ix_models types
+from message_ix_models.util import short_hash
+from message_ix_models.util._lock import file_lock
 from message_ix_models.util.context import Context
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
     from click import Command
     from ixmp.types import PlatformInfo, TimeSeriesIdentifiers
 
 log = logging.getLogger(__name__)
 
+#: Expression matching messages of exceptions raised when a step tries to use a
+#: :class:`.Scenario` that is locked (checked out) by another process.
+LOCKED = re.compile("(is|been) (locked|checked out)", flags=re.IGNORECASE)
+
 # commented: this conflicts with option keyword arguments to workflow step functions
 # CallbackType = Callable[[Context, Scenario], Scenario]
 CallbackType = Callable
 
 
+class _Encoder(genno.caching.Encoder):
+    """Encoder for :meth:`WorkflowStep.input_hash`.
+
+    Unlike :class:`genno.caching.Encoder`, callables are identified by name, so that
+    the result is the same in every Python session.
+    """
+
+    def default(self, o):
+        if isinstance(o, partial):
+            return dict(func=o.func, args=o.args, keywords=o.keywords)
+        elif callable(o) and hasattr(o, "__qualname__"):
+            return f"{o.__module__}.{o.__qualname__}"
+        return super().default(o)
+
+
+class Ledger:
+    """Persistent record of completed :class:`WorkflowSteps <WorkflowStep>`.
+
+    The ledger is stored as JSON in the file at `path`. For each step, it records the
+    URL and version of the target scenario, a hash of the step inputs (see
+    :meth:`WorkflowStep.input_hash`), and the completion time.
+
+    Parameters
+    ----------
+    path : os.PathLike
+        Path to the ledger file. If the file does not exist, it is created when the
+        first step is recorded.
+    skip : bool, optional
+        If :obj:`False`, :meth:`lookup` never returns a scenario, so that all steps are
+        run; completed steps are still recorded.
+    """
+
+    #: Entries, keyed by step name.
+    entries: dict[str, dict]
+
+    def __init__(self, path: os.PathLike, skip: bool = True):
+        self.path = Path(path)
+        self.skip = skip
+        self.entries = self._read()
+
+    def _read(self) -> dict[str, dict]:
+        return json.loads(self.path.read_text()) if self.path.exists() else dict()
+
+    def get_hash(self, name: str | None) -> str | None:
+        """Return the recorded input hash of step `name`, if any."""
+        self.entries = self._read()
+        return self.entries.get(name, {}).get("hash") if name else None
+
+    def lookup(self, name: str, input_hash: str, platform) -> Scenario | None:
+        """Return the target scenario of step `name`, if it can be skipped.
+
+        A step can be skipped if it is recorded with the same `input_hash`, and the
+        recorded version of its target scenario still exists on `platform`.
+        """
+        entry = self.entries.get(name)
+        if not (self.skip and entry and entry["hash"] == input_hash):
+            return None
+        elif entry["platform"] != platform.name:
+            return None
+
+        versions = platform.scenario_list(
+            model=entry["model"], scen=entry["scenario"], default=False
+        )["version"]
+        if entry["version"] not in set(versions):
+            log.info(f"Target {entry['url']} of step {name!r} no longer exists")
+            return None
+
+        return Scenario(
+            platform, entry["model"], entry["scenario"], version=entry["version"]
+        )
+
+    def record(self, name: str, input_hash: str, scenario: Scenario) -> None:
+        """Record that step `name` produced `scenario` from inputs with `input_hash`.
+
+        Entries written to :attr:`path` by other processes, for instance by other
+        steps run in parallel, are preserved: the file is locked while it is updated.
+        """
+        entry = dict(
+            url=f"ixmp://{scenario.platform.name}/{scenario.url}",
+            platform=scenario.platform.name,
+            model=scenario.model,
+            scenario=scenario.scenario,
+            version=scenario.version,
+            hash=input_hash,
+            time=datetime.now().isoformat(timespec="seconds"),
+        )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.path):
+            self.entries = self._read()
+            self.entries[name] = entry
+
+            # Write to a temporary file, then replace, so the ledger is never incomplete
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.entries, indent=2))
+            tmp.replace(self.path)
+
+
 class WorkflowStep:
     """Single step in a multi-scenario workflow.
 
@@ -59,6 +174,13 @@ class WorkflowStep:
     #: Target model name, scenario name, and optional version.
     scenario_info: "dict | TimeSeriesIdentifiers"
 
+    #: Name of the step in a :class:`.Workflow`, name of its base step, and
+    #: :class:`.Ledger` in which to record its completion. All are set by
+    #: :meth:`.Workflow.run`.
+    name: str | None = None
+    base_name: str | None = None
+    ledger: Ledger | None = None
+
     def __init__(self, action: CallbackType | None, target=None, clone=False, **kwargs):
         try:
             # Store platform and scenario info by parsing the `target` URL
@@ -76,26 +198,18 @@ class WorkflowStep:
 
     def __call__(self, context: Context, scenario: Scenario | None = None) -> Scenario:
         """Execute the workflow step."""
-        if scenario is None:
-            # No base scenario
-            if self.action:
-                raise RuntimeError(
-                    f"Step with action {self.action!r} requires a base scenario"
-                )
-            # Use Context to retrieve the identified scenario
-            context.platform_info.update(self.platform_info)
-            context.scenario_info.update(self.scenario_info)
-            s = context.get_scenario()
-            log.info(f"Loaded ixmp://{s.platform.name}/{s.url}")
-        else:
-            # Modify the context to identify destination scenario; possibly nothing
-            context.dest_scenario.update(self.scenario_info)
-            s = scenario
-            log.info(f"Step runs on ixmp://{s.platform.name}/{s.url}")
+        s = self._base(context, scenario)
 
         if context.dest_scenario:
             log.info(f"  with context.dest_scenario={context.dest_scenario}")
 
+        input_hash = self._input_hash_or_none(s)
+        if input_hash and self.ledger:
+            # Skip the step if it was completed with the same inputs
+            if existing := self.ledger.lookup(str(self.name), input_hash, s.platform):
+                log.info(f"Skip {self}; unchanged since completed as {existing.url}")
+                return existing
+
         if self.clone is not False:
             # Clone to target model/scenario name
             log.info("Clone to {model}/{scenario}".format(**self.scenario_info))
@@ -109,9 +223,36 @@ class WorkflowStep:
             )
             s = s.clone(**clone_kw)
 
-        if not self.action:
-            return s
+        result = self._act(context, s) if self.action else s
+
+        if input_hash and self.ledger:
+            self.ledger.record(str(self.name), input_hash, result)
+
+        return result
+
+    def _base(self, context: Context, scenario: Scenario | None) -> Scenario:
+        """Return the base scenario for :meth:`__call__`."""
+        if scenario is None:
+            # No base scenario
+            if self.action:
+                raise RuntimeError(
+                    f"Step with action {self.action!r} requires a base scenario"
+                )
+            # Use Context to retrieve the identified scenario
+            context.platform_info.update(self.platform_info)
+            context.scenario_info.update(self.scenario_info)
+            s = context.get_scenario()
+            log.info(f"Loaded ixmp://{s.platform.name}/{s.url}")
+        else:
+            # Modify the context to identify destination scenario; possibly nothing
+            context.dest_scenario.update(self.scenario_info)
+            s = scenario
+            log.info(f"Step runs on ixmp://{s.platform.name}/{s.url}")
+        return s
 
+    def _act(self, context: Context, s: Scenario) -> Scenario:
+        """Execute :attr:`action` on `s` for :meth:`__call__`."""
+        assert self.action is not None
         log.info(f"Execute {self.action!r}")
 
         # Modify context to identify the target scenario
@@ -130,6 +271,44 @@ class WorkflowStep:
 
         return result
 
+    def _input_hash_or_none(self, base: Scenario) -> str | None:
+        """Return :meth:`input_hash`, if the step is recorded in a :attr:`ledger`."""
+        if not (self.ledger and self.name and (self.action or self.clone is not False)):
+            return None
+        try:
+            return self.input_hash(base)
+        except TypeError as e:
+            log.warning(f"{self} is not recorded: cannot hash its inputs ({e})")
+            return None
+
+    def input_hash(self, base: Scenario) -> str:
+        """Return a hash of the inputs to the step.
+
+        The hash reflects the name of :attr:`action`, :attr:`kwargs`, :attr:`clone`,
+        :attr:`scenario_info`, the platform, URL, and version of `base`, and—if
+        :attr:`ledger` is set—the recorded inputs of the :attr:`base_name` step. The
+        last ensures that a step is run again if the preceding step modified `base` in
+        place with different inputs.
+
+        Functions, including those in :attr:`kwargs`, are identified by their module
+        and qualified name; :func:`functools.partial` objects, also by their
+        arguments. Other values are serialized as by :func:`genno.caching.hash_args`.
+
+        Raises
+        ------
+        TypeError
+            if any of :attr:`kwargs` cannot be serialized.
+        """
+        data = dict(
+            action=self.action,
+            kwargs=self.kwargs,
+            clone=self.clone,
+            target=self.scenario_info,
+            base=f"ixmp://{base.platform.name}/{base.url}",
+            base_hash=self.ledger.get_hash(self.base_name) if self.ledger else None,
+        )
+        return short_hash(json.dumps(data, sort_keys=True, cls=_Encoder), 32)
+
     def __repr__(self):
         action = f"{self.action.__name__}()" if self.action else "load"
         dest = ""
@@ -147,6 +326,10 @@ class Workflow(Computer):
         Context object with settings common to the entire workflow.
     """
 
+    #: If set, the completion of each step is recorded, and steps that were already
+    #: completed with the same inputs are skipped. See :class:`.Ledger`.
+    ledger: Ledger | None = None
+
     def __init__(self, context: Context):
         super().__init__()
         self.add_single("context", context)
@@ -196,15 +379,104 @@ class Workflow(Computer):
         # Add to the Computer; return the name of the added step
         return str(self.add_single(name, step, "context", base, strict=True))
 
-    def run(self, name_or_names: str | list[str]):
+    def run(
+        self,
+        name_or_names: str | list[str],
+        jobs: int = 1,
+        retries: int = 3,
+        retry_delay: float = 30.0,
+    ):
         """Run all workflow steps necessary to produce `name_or_names`.
 
+        With `jobs` greater than 1, independent steps—for instance, several steps that
+        share the same base—are run concurrently in up to `jobs` worker processes.
+        Each worker process opens its own :class:`ixmp.Platform`, and receives a copy
+        of the workflow :class:`.Context`, so:
+
+        - The :attr:`~.WorkflowStep.action` of every step, its keyword arguments, and
+          the values stored on the Context must be picklable.
+        - Changes made to the Context by one step are not seen by other steps.
+
+        If :attr:`ledger` is set, steps that were completed with the same inputs—and
+        whose target scenarios still exist—are skipped; see :class:`Ledger`.
+
         Parameters
         ----------
         name_or_names: str or list of str
             Identifier(s) of steps to run.
+        jobs : int, optional
+            Maximum number of steps to run at the same time.
+        retries : int, optional
+            With `jobs` > 1, number of times to retry a step that fails because a
+            scenario is locked by another process.
+        retry_delay : float, optional
+            Seconds to wait before each retry.
         """
-        return self.get(name_or_names)
+        # Give each step its name, the name of its base step, and the ledger, if any
+        for key, task in self.graph.items():
+            if isinstance(task, tuple) and isinstance(task[0], WorkflowStep):
+                step = task[0]
+                step.name, step.ledger = str(key), self.ledger
+                step.base_name = None if task[2] is None else str(task[2])
+
+        if jobs > 1:
+            return self._run_parallel(name_or_names, jobs, retries, retry_delay)
+
+        return self.get(name_or_names)  # type: ignore [arg-type]
+
+    def _run_parallel(
+        self, name_or_names: str | list[str], jobs: int, retries: int, delay: float
+    ):
+        """Run workflow steps in parallel. See :meth:`run`."""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        steps = self._steps(name_or_names)
+
+        # Copy of the context, without any open Platform, to be pickled to workers
+        context = deepcopy(self.graph["context"])
+
+        log.info(f"Run {len(steps)} workflow steps with up to {jobs} processes")
+
+        # Use "spawn", not "fork": a forked process cannot use the JVM of its parent
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as pool:
+            done = _schedule(pool, steps, context, retries, delay)
+
+        # Temporarily replace each step with one that loads its result
+        original = {key: self.graph[key] for key in done}
+        try:
+            for key, (platform_info, scenario_info) in done.items():
+                step = WorkflowStep(None)
+                step.platform_info.update(platform_info)
+                step.scenario_info.update(scenario_info)
+                self.graph[key] = (step, "context", None)
+
+            return self.get(name_or_names)  # type: ignore [arg-type]
+        finally:
+            self.graph.update(original)
+
+    def _steps(
+        self, name_or_names: str | list[str]
+    ) -> dict[str, tuple[WorkflowStep, str | None]]:
+        """Return the steps needed to produce `name_or_names`, and their bases."""
+        result: dict[str, tuple[WorkflowStep, str | None]] = {}
+
+        def _collect(key) -> None:
+            if key is None or str(key) in result:
+                return
+            task = self.graph[key]
+            if isinstance(task, tuple) and isinstance(task[0], WorkflowStep):
+                result[str(key)] = (task[0], None if task[2] is None else str(task[2]))
+                _collect(task[2])
+            elif isinstance(task, list):
+                for k in task:
+                    _collect(k)
+
+        for key in [name_or_names] if isinstance(name_or_names, str) else name_or_names:
+            _collect(key)
+
+        return result
 
     def truncate(self, name: str) -> None:
         """Truncate the workflow at the step `name`.
@@ -268,6 +540,95 @@ class Workflow(Computer):
         return (i.copy(), step_name) if len(i) else self.guess_target(task[2], kind)
 
 
+def _url(platform_info: Mapping, scenario_info: Mapping) -> str:
+    return "ixmp://{}/{model}/{scenario}#{version}".format(
+        platform_info["name"], **scenario_info
+    )
+
+
+def _schedule(
+    pool: "Executor",
+    steps: Mapping[str, tuple[WorkflowStep, str | None]],
+    context: Context,
+    retries: int,
+    delay: float,
+) -> dict[str, tuple[dict, dict]]:
+    """Run `steps` using `pool`, each once its base step is complete.
+
+    Returns platform and scenario info for the scenario produced by each step. If any
+    step fails, the steps not yet started are cancelled and the exception is raised.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    done: dict[str, tuple[dict, dict]] = {}
+    pending = dict(steps)
+    running: dict[Future, str] = {}
+
+    while pending or running:
+        # Submit all steps whose base step, if any, is complete
+        for key, (step, base) in list(pending.items()):
+            if base is None or base in done:
+                args = (step, context, done.get(str(base)), retries, delay)
+                running[pool.submit(_run_step, *args)] = key
+                pending.pop(key)
+
+        if not running:
+            raise RuntimeError(f"Unable to run steps: {sorted(pending)}")
+
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in finished:
+            key = running.pop(future)
+            try:
+                done[key] = future.result()
+            except Exception:
+                log.error(f"Step {key!r} failed; cancel remaining steps")
+                for f in running:
+                    f.cancel()
+                raise
+            log.info(f"Step {key!r} produced {_url(*done[key])}")
+
+    return done
+
+
+def _run_step(
+    step: WorkflowStep,
+    context: Context,
+    base: tuple[dict, dict] | None,
+    retries: int,
+    delay: float,
+) -> tuple[dict, dict]:
+    """Run `step` in a worker process for :meth:`Workflow.run`.
+
+    The base scenario, if any, is loaded from the platform and scenario info in
+    `base`. If the step fails because a scenario is locked, it is retried up to
+    `retries` times. Returns platform and scenario info for the resulting scenario.
+    """
+    for attempt in range(retries + 1):
+        scenario = None
+        if base is not None:
+            context.platform_info.update(base[0])
+            scenario = Scenario(context.get_platform(), **base[1])
+
+        try:
+            s = step(context, scenario)
+        except Exception as e:
+            if attempt == retries or not LOCKED.search(str(e)):
+                raise
+            log.warning(f"{e}\n…retry {step} in {delay} s")
+            context.close_db()
+            sleep(delay)
+        else:
+            break
+
+    result = (
+        dict(name=s.platform.name),
+        dict(model=s.model, scenario=s.scenario, version=s.version),
+    )
+    context.close_db()
+
+    return result
+
+
 def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Command":
     """Generate a click CLI command to run a :class:`.Workflow`.
 
@@ -283,6 +644,10 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
         displayed.
       - :program:`--from`: Truncate the workflow at any step(s) whose names are a full
         match for this regular expression.
+      - :program:`--jobs`: Run up to this many independent steps at the same time,
+        each in a separate process. See :meth:`.Workflow.run`.
+      - :program:`--force`: Run all steps, even those recorded as completed with the
+        same inputs in the :class:`.Ledger` file :file:`{slug}-ledger.json`.
 
     - uses the :attr:`~.Computer.default_key` (if any) of the :class:`.Workflow`
       returned by `wf_callback`, if the user does not provide :program:`TARGET` on the
@@ -315,9 +680,21 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
     @click.option(
         "--from", "truncate_step", help="Truncate workflow at matching step(s)."
     )
+    @click.option(
+        "--jobs",
+        type=int,
+        default=1,
+        show_default=True,
+        help="Number of steps to run in parallel.",
+    )
+    @click.option(
+        "--force", is_flag=True, help="Run all steps, even if already completed."
+    )
     @click.argument("target_step", metavar="TARGET", required=False)
     @click.pass_obj
-    def _func(context, go, truncate_step, target_step: str | None, **kwargs):
+    def _func(
+        context, go, truncate_step, jobs, force, target_step: str | None, **kwargs
+    ):
         from importlib import import_module
 
         from message_ix_models.util import show_versions
@@ -379,7 +756,11 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
             wf.visualize(path, key=target_step, rankdir="LR")
             return
 
-        wf.run(target_step)
+        # Record completed steps; skip those already completed, unless --force
+        path = context.get_local_path(f"{slug}-ledger.json")
+        wf.ledger = Ledger(path, skip=not force)
+
+        wf.run(target_step, jobs=jobs)
 
     return _func
 